@@ -1,10 +1,112 @@
+"""
+API authentication.
+
+FastPathAuthentication is the single DRF authentication class. It picks
+one authenticator from the ``Authorization`` header keyword instead of
+trying Session, JWT and Token authentication in turn:
+
+- ``Bearer <jwt>``  -> CachedJWTAuthentication
+- ``Token <key>``   -> ExpiringTokenAuthentication
+- no header         -> SessionAuthentication
+
+Resolved users and auth tokens are cached in AuthCache for
+``AUTH_CACHE_TTL`` seconds, so an authenticated API call normally runs no
+auth query. User and Token saves/deletes drop the cached entries (see
+signals.py), which covers logout, deactivation and password changes.
+Those drops only reach every worker through a shared cache, so with the
+per-process default (no CACHE_URL) nothing is cached and every request
+authenticates against the database.
+Token expiry and the user's active flag are still checked on every
+request.
+"""
 from datetime import timedelta
 from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from rest_framework import exceptions
-from rest_framework.authentication import TokenAuthentication
+from rest_framework.authentication import (
+    BaseAuthentication,
+    SessionAuthentication,
+    TokenAuthentication,
+    get_authorization_header,
+)
 from rest_framework.authtoken.models import Token
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from apps.commons.cache import cache_is_shared
+from apps.commons.db_router import primary_reads
+
+USER_CACHE_KEY = "auth_user:{user_id}"
+TOKEN_CACHE_KEY = "auth_token:{key}"
+
+
+class AuthCache:
+    """
+    Short-lived cache of authenticated users and auth tokens.
+
+    Tokens are stored as (user_id, created) and users separately, so a
+    change to the user only has to drop one entry. Disabled unless the
+    cache is shared between workers.
+    """
+
+    @classmethod
+    def ttl(cls) -> int:
+        return getattr(settings, "AUTH_CACHE_TTL", 60)
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return cls.ttl() > 0 and cache_is_shared()
+
+    @classmethod
+    def get_user(cls, user_id):
+        if not cls.enabled():
+            return None
+        return cache.get(USER_CACHE_KEY.format(user_id=user_id))
+
+    @classmethod
+    def set_user(cls, user):
+        if cls.enabled():
+            cache.set(USER_CACHE_KEY.format(user_id=user.pk), user, cls.ttl())
+
+    @classmethod
+    def get_token(cls, key):
+        """The token with its user attached, or None if either is not cached."""
+        if not cls.enabled():
+            return None
+        entry = cache.get(TOKEN_CACHE_KEY.format(key=key))
+        if entry is None:
+            return None
+        user_id, created = entry
+        user = cls.get_user(user_id)
+        if user is None:
+            return None
+        token = Token(key=key, user_id=user_id, created=created)
+        token.user = user
+        return token
+
+    @classmethod
+    def set_token(cls, token):
+        if not cls.enabled():
+            return
+        cache.set_many(
+            {
+                TOKEN_CACHE_KEY.format(key=token.key): (token.user_id, token.created),
+                USER_CACHE_KEY.format(user_id=token.user_id): token.user,
+            },
+            cls.ttl(),
+        )
+
+    @classmethod
+    def invalidate_user(cls, user_id):
+        cache.delete(USER_CACHE_KEY.format(user_id=user_id))
+
+    @classmethod
+    def invalidate_token(cls, key):
+        cache.delete(TOKEN_CACHE_KEY.format(key=key))
 
 
 class ExpiringTokenAuthentication(TokenAuthentication):
@@ -12,10 +114,17 @@ class ExpiringTokenAuthentication(TokenAuthentication):
     keyword = "Token"  # Use Token keyword to avoid conflict with JWT Bearer
 
     def authenticate_credentials(self, key: str):
-        try:
-            token = self.model.objects.select_related("user").get(key=key)
-        except self.model.DoesNotExist:
-            raise exceptions.AuthenticationFailed(_("Invalid token."))
+        token = AuthCache.get_token(key)
+        if token is None:
+            try:
+                token = (
+                    self.model.objects.using(DEFAULT_DB_ALIAS)
+                    .select_related("user")
+                    .get(key=key)
+                )
+            except self.model.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_("Invalid token."))
+            AuthCache.set_token(token)
 
         if not token.user.is_active:
             raise exceptions.AuthenticationFailed(_("User is not active."))
@@ -47,3 +156,64 @@ class ExpiringTokenAuthentication(TokenAuthentication):
     def is_expired(token: Token) -> bool:
         time_remaining = ExpiringTokenAuthentication.expires_in(token)
         return time_remaining < timedelta(seconds=0)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication with the user read from AuthCache. Token validation
+    is unchanged; the active and password-change checks run on cached
+    users too.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(jwt_settings.USER_ID_CLAIM)
+        user = AuthCache.get_user(user_id) if user_id is not None else None
+        if user is None:
+            with primary_reads():
+                user = super().get_user(validated_token)
+            AuthCache.set_user(user)
+            return user
+
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if jwt_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            jwt_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise exceptions.AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+        return user
+
+
+class FastPathAuthentication(BaseAuthentication):
+    """
+    Dispatch to exactly one authenticator by ``Authorization`` keyword.
+    """
+
+    def __init__(self):
+        self.session = SessionAuthentication()
+        self.by_keyword = {
+            keyword.encode().lower(): authenticator
+            for authenticator in (CachedJWTAuthentication(), ExpiringTokenAuthentication())
+            for keyword in self._keywords(authenticator)
+        }
+
+    @staticmethod
+    def _keywords(authenticator):
+        if isinstance(authenticator, JWTAuthentication):
+            header_types = jwt_settings.AUTH_HEADER_TYPES
+            return (header_types,) if isinstance(header_types, str) else header_types
+        return (authenticator.keyword,)
+
+    def authenticate(self, request):
+        parts = get_authorization_header(request).split()
+        if not parts:
+            return self.session.authenticate(request)
+        authenticator = self.by_keyword.get(parts[0].lower())
+        if authenticator is None:
+            return None
+        return authenticator.authenticate(request)
+
+    def authenticate_header(self, request):
+        # Same as the previous first class (Session): unauthenticated is a 403
+        return self.session.authenticate_header(request)
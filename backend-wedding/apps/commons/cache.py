@@ -0,0 +1,19 @@
+"""
+Cache helpers.
+"""
+from django.conf import settings
+
+PROCESS_LOCAL_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def cache_is_shared(alias="default"):
+    """
+    Whether the cache is shared between worker processes (CACHE_URL set
+    to Redis, Memcached, a database table, ...). Signal-based
+    invalidation only reaches every worker through a shared cache, so
+    data that must not outlive an invalidation is only cached then.
+    """
+    return settings.CACHES[alias]["BACKEND"] not in PROCESS_LOCAL_BACKENDS
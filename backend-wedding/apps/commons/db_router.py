@@ -0,0 +1,183 @@
+"""
+Read-replica routing with read-your-writes stickiness.
+
+When a ``replica`` database is configured (DATABASE_REPLICA_URL),
+ReplicaRoutingMiddleware decides per request where reads go and
+ReplicaRouter applies it:
+
+- safe requests (GET/HEAD/OPTIONS) read from the replica;
+- unsafe requests, and reads inside ``transaction.atomic()``, use the
+  primary;
+- the first write of a request (even a GET that get_or_creates) moves the
+  rest of the request to the primary;
+- after a write the client's reads stay on the primary for
+  DATABASE_REPLICA_PIN_SECONDS, so it sees its own changes despite
+  replication lag. The pin is a short-lived cache entry keyed by a hash
+  of the request's credential (the Authorization header, else the
+  session cookie), which also covers server-side callers such as the
+  Next.js server actions that never send cookies back. Browsers also
+  get a ``db_primary_pin`` cookie, which pins anonymous clients.
+
+Pins written to a per-process cache (the locmem default) are only seen
+by the worker that wrote them; set CACHE_URL to a shared cache when
+running several workers with a replica.
+
+Outside a request (management commands, shells, tests without the
+middleware) everything uses the primary. Each response carries an
+``X-Database-Route`` header naming where its reads ended up and why
+(``replica``, ``default; write`` or ``default; pinned``); with the query
+profiler on, its log lines and stats also count queries per alias.
+
+Caches refilled after an invalidation read from the primary
+(``.using(DEFAULT_DB_ALIAS)`` or ``primary_reads()``) so a lagging replica
+cannot put stale rows back into them.
+
+Writes and migrations only ever go to ``default``. To try it locally
+with two SQLite files, copy the migrated dev database and point the
+replica at the copy:
+
+    cp media/database/dev_db.sqlite3 media/database/replica.sqlite3
+    DATABASE_REPLICA_URL=sqlite:///media/database/replica.sqlite3 python manage.py runserver
+"""
+import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_ALIAS = "replica"
+PIN_COOKIE = "db_primary_pin"
+PIN_CACHE_KEY = "db_pin:{credential}"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+_current = ContextVar("db_routing", default=None)
+
+
+class RequestRouting:
+    """Where the current request reads from; flips to the primary on write."""
+
+    __slots__ = ("read_alias", "reason", "wrote")
+
+    def __init__(self, read_alias, reason):
+        self.read_alias = read_alias
+        self.reason = reason
+        self.wrote = False
+
+    @property
+    def header(self):
+        return self.read_alias if self.reason is None else f"{self.read_alias}; {self.reason}"
+
+
+@contextmanager
+def primary_reads():
+    """
+    Read from the primary inside the block, for code that cannot pass
+    ``.using(DEFAULT_DB_ALIAS)`` itself (e.g. library lookups that fill a
+    cache just after an invalidation).
+    """
+    routing = _current.get()
+    if routing is None or routing.read_alias == DEFAULT_DB_ALIAS:
+        yield
+        return
+    read_alias, wrote = routing.read_alias, routing.wrote
+    routing.read_alias = DEFAULT_DB_ALIAS
+    try:
+        yield
+    finally:
+        if routing.wrote and not wrote:
+            routing.reason = "write"  # stay on the primary, as after any write
+        else:
+            routing.read_alias = read_alias
+
+
+class ReplicaRouter:
+    """
+    Route reads per the current RequestRouting, writes to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        routing = _current.get()
+        if routing is None or routing.read_alias == DEFAULT_DB_ALIAS:
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return routing.read_alias
+
+    def db_for_write(self, model, **hints):
+        routing = _current.get()
+        if routing is not None:
+            routing.wrote = True
+            if routing.read_alias != DEFAULT_DB_ALIAS:
+                routing.read_alias, routing.reason = DEFAULT_DB_ALIAS, "write"
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, REPLICA_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica is a copy of the primary; it is never migrated itself
+        return db != REPLICA_ALIAS
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Send safe, unpinned requests' reads to the replica and pin writers to
+    the primary. Unloads itself when no replica is configured.
+    """
+
+    def __init__(self, get_response):
+        if REPLICA_ALIAS not in settings.DATABASES:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.pin_seconds = getattr(settings, "DATABASE_REPLICA_PIN_SECONDS", 10)
+
+    def __call__(self, request):
+        routing = self._routing(request)
+        token = _current.set(routing)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        if routing.wrote or request.method not in SAFE_METHODS:
+            pin_key = self._pin_key(request)
+            if pin_key is not None:
+                cache.set(pin_key, 1, self.pin_seconds)
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=self.pin_seconds,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite="Lax",
+            )
+        response["X-Database-Route"] = routing.header
+        return response
+
+    @classmethod
+    def _routing(cls, request):
+        if request.method not in SAFE_METHODS:
+            return RequestRouting(DEFAULT_DB_ALIAS, "write")
+        if PIN_COOKIE in request.COOKIES:
+            return RequestRouting(DEFAULT_DB_ALIAS, "pinned")
+        pin_key = cls._pin_key(request)
+        if pin_key is not None and cache.get(pin_key):
+            return RequestRouting(DEFAULT_DB_ALIAS, "pinned")
+        return RequestRouting(REPLICA_ALIAS, None)
+
+    @staticmethod
+    def _pin_key(request):
+        """Cache key of the request's credential, or None if it has none."""
+        credential = request.META.get("HTTP_AUTHORIZATION") or request.COOKIES.get(
+            settings.SESSION_COOKIE_NAME
+        )
+        if not credential:
+            return None
+        digest = hashlib.sha256(credential.encode()).hexdigest()
+        return PIN_CACHE_KEY.format(credential=digest)
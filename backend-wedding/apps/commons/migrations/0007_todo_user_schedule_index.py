@@ -0,0 +1,17 @@
+# Generated by Django 5.1.4 on 2026-10-19 07:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('commons', '0006_remove_todo_created_at_remove_todo_uid_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['user', 'start_datetime', 'end_datetime'], name='todo_user_schedule_idx'),
+        ),
+    ]
@@ -3,6 +3,38 @@ from django.conf import settings
 from django.utils import timezone
 
 
+class TodoQuerySet(models.QuerySet):
+    """
+    Schedule filters evaluated in SQL against the current time.
+    Backed by the (user, start_datetime, end_datetime) index.
+    """
+
+    def pending(self, now=None):
+        """Todos that have not started yet."""
+        return self.filter(start_datetime__gt=now or timezone.now())
+
+    def active(self, now=None):
+        """Todos running right now."""
+        now = now or timezone.now()
+        return self.filter(start_datetime__lte=now, end_datetime__gte=now)
+
+    def expired(self, now=None):
+        """Todos that have already ended."""
+        return self.filter(end_datetime__lt=now or timezone.now())
+
+    def with_status(self, now=None):
+        """Annotate ``schedule_status`` ('pending' | 'active' | 'expired')."""
+        now = now or timezone.now()
+        return self.annotate(
+            schedule_status=models.Case(
+                models.When(start_datetime__gt=now, then=models.Value("pending")),
+                models.When(end_datetime__lt=now, then=models.Value("expired")),
+                default=models.Value("active"),
+                output_field=models.CharField(),
+            )
+        )
+
+
 class Todo(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     category = models.ForeignKey("Category", on_delete=models.CASCADE)
@@ -11,12 +43,18 @@ class Todo(models.Model):
     start_datetime = models.DateTimeField()
     end_datetime = models.DateTimeField()
 
+    objects = TodoQuerySet.as_manager()
+
     @property
     def is_active(self):
         """
         Dynamic status - computed in real-time
         Returns: 'pending' | 'active' | 'expired'
+        Uses the ``schedule_status`` annotation when the queryset has it.
         """
+        annotated = getattr(self, "schedule_status", None)
+        if annotated is not None:
+            return annotated
         now = timezone.now()
         if now < self.start_datetime:
             return "pending"
@@ -28,6 +66,12 @@ class Todo(models.Model):
     class Meta:
         db_table = "todos"
         ordering = ["-start_datetime"]
+        indexes = [
+            models.Index(
+                fields=["user", "start_datetime", "end_datetime"],
+                name="todo_user_schedule_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.user.email})"
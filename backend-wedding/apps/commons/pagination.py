@@ -0,0 +1,65 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Cursor (keyset) pagination over ``(created_at, id)``, newest first.
+
+    No ``COUNT(*)`` and no ``OFFSET`` scan: each page seeks from the last
+    seen ``created_at`` using the model's (…, created_at, id) index.
+    The ordering is fixed so cursors stay valid regardless of any
+    ``ordering``/``sort_by`` query params.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_ordering(self, request, queryset, view):
+        return getattr(view, "cursor_ordering", self.ordering)
+
+
+class OptionalCursorPagination(PageNumberPagination):
+    """
+    Page-number pagination by default, keyset cursor pagination on request.
+
+    Clients opt in with ``?pagination=cursor``; the ``next``/``previous``
+    links keep that parameter, so following them stays in cursor mode.
+    Existing clients that send ``?page=N`` are unaffected.
+    """
+
+    mode_query_param = "pagination"
+    cursor_pagination_class = KeysetCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        if self.use_cursor(request):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append({
+            "name": self.mode_query_param,
+            "required": False,
+            "in": "query",
+            "description": "Set to 'cursor' for keyset pagination (no total count).",
+            "schema": {"type": "string", "enum": ["page", "cursor"]},
+        })
+        parameters.extend(
+            self.cursor_pagination_class().get_schema_operation_parameters(view)
+        )
+        return parameters
+
+    def use_cursor(self, request):
+        cursor_param = self.cursor_pagination_class.cursor_query_param
+        return (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or cursor_param in request.query_params
+        )
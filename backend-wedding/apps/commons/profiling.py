@@ -0,0 +1,265 @@
+"""
+Query Profiler - Opt-in per-request SQL and serializer instrumentation.
+
+Enabled with ``QUERY_PROFILER_ENABLED``. When it is off the middleware
+raises MiddlewareNotUsed at startup, so Django drops it from the chain and
+no database or serializer hook is ever installed.
+
+For every profiled request (``QUERY_PROFILER_SAMPLE_RATE`` of them):
+
+- every query on every configured database is counted and timed through
+  ``connection.execute_wrapper`` and grouped by fingerprint (the SQL with
+  literals and IN lists collapsed), so repeated N+1 statements show up as
+  one fingerprint with a high count, and by database alias (to see how
+  much of the read traffic the replica takes);
+- time spent producing ``serializer.data`` is measured;
+- a ``Server-Timing`` header (db, serialize, total) is added to the response;
+- one structured log line is written to the ``apps.commons.profiling``
+  logger (WARNING once the query count reaches
+  ``QUERY_PROFILER_QUERY_WARNING``);
+- the sample is kept per view in a bounded in-process window, which the
+  staff-only stats endpoint reports as p50/p95 per view.
+
+Stats are per worker process, like the other in-process buffers here.
+"""
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERY_FINGERPRINTS = 3
+FINGERPRINT_LENGTH = 300
+UNRESOLVED_VIEW = "<unresolved>"
+
+_current = ContextVar("query_profile", default=None)
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\(\s*(?:\?|%s)(?:\s*,\s*(?:\?|%s))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_SELECT_LIST = re.compile(r"^SELECT\s.*?\sFROM\s", re.DOTALL)
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(sql):
+    """
+    SQL with the leading select list dropped, literals replaced by ``?``
+    and IN lists collapsed.
+    """
+    sql = _SELECT_LIST.sub("SELECT … FROM ", sql, count=1)
+    sql = _LITERALS.sub("?", sql)
+    sql = _IN_LISTS.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()[:FINGERPRINT_LENGTH]
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty sequence."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class RequestProfile:
+    """Measurements collected while one request is handled."""
+
+    __slots__ = (
+        "query_count", "db_ms", "serialize_ms", "fingerprints", "aliases", "_serialize_depth",
+    )
+
+    def __init__(self):
+        self.query_count = 0
+        self.db_ms = 0.0
+        self.serialize_ms = 0.0
+        self.fingerprints = defaultdict(lambda: [0, 0.0])  # fingerprint -> [count, ms]
+        self.aliases = defaultdict(int)  # database alias -> query count
+        self._serialize_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        """``connection.execute_wrapper`` hook."""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.query_count += 1
+            self.db_ms += elapsed
+            self.aliases[context["connection"].alias] += 1
+            entry = self.fingerprints[fingerprint(sql)]
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def slowest(self, limit=SLOW_QUERY_FINGERPRINTS):
+        """The fingerprints with the most total time, slowest first."""
+        ranked = sorted(self.fingerprints.items(), key=lambda item: item[1][1], reverse=True)
+        return [
+            {"sql": sql, "count": count, "ms": round(ms, 2)}
+            for sql, (count, ms) in ranked[:limit]
+        ]
+
+
+class QueryProfileStore:
+    """
+    Recent samples per view, aggregated for the stats endpoint.
+    """
+
+    WINDOW = 500
+
+    _samples = defaultdict(lambda: deque(maxlen=QueryProfileStore.WINDOW))
+    _fingerprints = defaultdict(lambda: defaultdict(lambda: [0, 0.0]))
+    _aliases = defaultdict(lambda: defaultdict(int))
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(cls, view, total_ms, profile):
+        with cls._lock:
+            cls._samples[view].append(
+                (total_ms, profile.db_ms, profile.serialize_ms, profile.query_count)
+            )
+            totals = cls._fingerprints[view]
+            for sql, (count, ms) in profile.fingerprints.items():
+                totals[sql][0] += count
+                totals[sql][1] += ms
+            aliases = cls._aliases[view]
+            for alias, count in profile.aliases.items():
+                aliases[alias] += count
+
+    @classmethod
+    def stats(cls):
+        """p50/p95 per view over the recent window, busiest views first."""
+        with cls._lock:
+            samples = {view: list(window) for view, window in cls._samples.items()}
+            fingerprints = {
+                view: sorted(totals.items(), key=lambda item: item[1][1], reverse=True)
+                [:SLOW_QUERY_FINGERPRINTS]
+                for view, totals in cls._fingerprints.items()
+            }
+            aliases = {view: dict(counts) for view, counts in cls._aliases.items()}
+
+        views = []
+        for view, rows in samples.items():
+            columns = dict(zip(("total_ms", "db_ms", "serialize_ms", "queries"), zip(*rows)))
+            views.append({
+                "view": view,
+                "requests": len(rows),
+                **{
+                    f"{name}_p{pct}": round(percentile(values, pct), 2)
+                    for name, values in columns.items()
+                    for pct in (50, 95)
+                },
+                "slowest_queries": [
+                    {"sql": sql, "count": count, "ms": round(ms, 2)}
+                    for sql, (count, ms) in fingerprints.get(view, [])
+                ],
+                "queries_by_alias": aliases.get(view, {}),
+            })
+        views.sort(key=lambda row: row["requests"], reverse=True)
+        return views
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._samples.clear()
+            cls._fingerprints.clear()
+            cls._aliases.clear()
+
+
+def _install_serializer_timer():
+    """
+    Time ``BaseSerializer.data`` for the profiled request. Nested
+    ``.data`` calls are only counted once.
+    """
+    from rest_framework.serializers import BaseSerializer
+
+    data = BaseSerializer.data
+    if getattr(data.fget, "_profiled", False):
+        return
+
+    def timed_data(serializer):
+        profile = _current.get()
+        if profile is None or profile._serialize_depth:
+            return data.fget(serializer)
+        profile._serialize_depth += 1
+        started = time.perf_counter()
+        try:
+            return data.fget(serializer)
+        finally:
+            profile._serialize_depth -= 1
+            profile.serialize_ms += (time.perf_counter() - started) * 1000
+
+    timed_data._profiled = True
+    BaseSerializer.data = property(timed_data)
+
+
+class QueryProfilerMiddleware:
+    """
+    Profile requests when QUERY_PROFILER_ENABLED is set.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "QUERY_PROFILER_ENABLED", False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, "QUERY_PROFILER_SAMPLE_RATE", 1.0)
+        self.query_warning = getattr(settings, "QUERY_PROFILER_QUERY_WARNING", 50)
+        _install_serializer_timer()
+
+    def __call__(self, request):
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        profile = RequestProfile()
+        token = _current.set(profile)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(profile))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total_ms = (time.perf_counter() - started) * 1000
+
+        response["Server-Timing"] = ", ".join((
+            f'db;dur={profile.db_ms:.1f};desc="{profile.query_count} queries"',
+            f"serialize;dur={profile.serialize_ms:.1f}",
+            f"total;dur={total_ms:.1f}",
+        ))
+
+        view = self._view_name(request)
+        QueryProfileStore.record(view, total_ms, profile)
+        level = logging.WARNING if profile.query_count >= self.query_warning else logging.INFO
+        if logger.isEnabledFor(level):
+            logger.log(level, "request_profile %s", json.dumps({
+                "view": view,
+                "path": request.path,
+                "status": response.status_code,
+                "total_ms": round(total_ms, 2),
+                "db_ms": round(profile.db_ms, 2),
+                "serialize_ms": round(profile.serialize_ms, 2),
+                "queries": profile.query_count,
+                "queries_by_alias": dict(profile.aliases),
+                "slowest_queries": profile.slowest(),
+            }))
+        return response
+
+    @staticmethod
+    def _view_name(request):
+        """
+        ``METHOD url-name`` (e.g. ``GET todos-list``). Unresolved requests
+        (404s, scanners) share one ``METHOD <unresolved>`` bucket so their
+        paths can't grow the stats without bound.
+        """
+        match = getattr(request, "resolver_match", None)
+        name = (match.view_name or match.route) if match else UNRESOLVED_VIEW
+        return f"{request.method} {name}"
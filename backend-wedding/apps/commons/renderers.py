@@ -0,0 +1,150 @@
+"""
+Fast JSON rendering and parsing.
+
+FastJSONRenderer / FastJSONParser are drop-in replacements for DRF's
+JSONRenderer / JSONParser that use orjson when it is installed and DRF's
+stdlib implementation otherwise. With the default settings
+(UNICODE_JSON, COMPACT_JSON, STRICT_JSON) the output matches
+JSONRenderer's:
+
+- datetimes, dates and times go through DRF's JSONEncoder (ISO 8601,
+  ``Z`` for UTC), as do Decimals (floats), lazy strings, timedeltas and
+  querysets; UUIDs are their string form;
+- non-string dict keys are converted to strings, like ``json.dumps``;
+- U+2028 / U+2029 are escaped;
+- NaN and infinities (floats or Decimals) raise ValueError, as in strict
+  JSONRenderer, instead of orjson's ``null``.
+
+One difference remains: floats written in exponent form lose the ``+``
+and leading zeros of the exponent (``1e16`` instead of ``1e+16``,
+``1e-7`` instead of ``1e-07``; also for Decimals such as ``1E+20``). Both
+are the same JSON number.
+
+Anything orjson cannot encode (integers beyond 64 bits, custom types the
+encoder rejects), indented output (``; indent=`` or the browsable API)
+and non-default JSON settings fall back to the stdlib path. ``dumps`` is
+the same encoder for code outside DRF (the SSE stream).
+
+Parsing gives the same results and errors as JSONParser: bodies with
+integers too large for orjson (19+ digits) are parsed by the stdlib so
+they stay exact ints instead of becoming floats, and bodies orjson
+rejects are handed to the stdlib.
+"""
+import json
+import pickle
+import re
+from decimal import Decimal
+
+from django.conf import settings
+from rest_framework.compat import SHORT_SEPARATORS
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+from rest_framework.utils.json import strict_constant
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+UTF8_ENCODINGS = ("utf-8", "utf8")
+
+# A pickled float is b"G" and its big-endian IEEE 754 bytes; NaN and the
+# infinities have every exponent bit set. String data can produce false
+# positives (which only cost a stdlib render), never false negatives.
+NON_FINITE_PICKLED_FLOAT = re.compile(rb"G[\x7f\xff][\xf0-\xff]")
+# orjson parses integers beyond 64 bits as (lossy) floats. Bodies with a
+# run of 19+ digits are spotted by mapping every digit to "0" and looking
+# for the run (much faster than a regex over a large body).
+DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+LONG_DIGIT_RUN = b"0" * 19
+
+_encoder = encoders.JSONEncoder()
+
+
+def _default(obj):
+    if isinstance(obj, Decimal) and not obj.is_finite():
+        raise TypeError(f"Out of range Decimal value is not JSON compliant: {obj}")
+    return _encoder.default(obj)
+
+
+def _may_hold_non_finite(data):
+    """
+    Whether ``data`` may contain a NaN/infinite float, which orjson would
+    write as ``null``. Pickling walks the data at C speed; data that
+    can't be pickled counts as suspect.
+    """
+    try:
+        dumped = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return True
+    return NON_FINITE_PICKLED_FLOAT.search(dumped) is not None
+
+
+def _escape_separators(content):
+    return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+def dumps(data):
+    """Compact UTF-8 JSON bytes of ``data``, as JSONRenderer would render it."""
+    if orjson is not None:
+        try:
+            content = orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            # Non-finite floats come out as null; only then is it worth a look
+            if b"null" not in content or not _may_hold_non_finite(data):
+                return _escape_separators(content)
+    content = json.dumps(
+        data, cls=encoders.JSONEncoder, ensure_ascii=False,
+        allow_nan=False, separators=SHORT_SEPARATORS,
+    )
+    return _escape_separators(content.encode())
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson when it can.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSONParser that decodes UTF-8 bodies with orjson. Bodies with very
+    long integers, and bodies orjson rejects (invalid JSON, but also
+    numbers like 1e400 that the stdlib reads as infinity), go through the
+    stdlib as before.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or encoding.lower() not in UTF8_ENCODINGS:
+            return super().parse(stream, media_type, parser_context)
+        body = stream.read()
+        if LONG_DIGIT_RUN not in body.translate(DIGITS_TO_ZERO):
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                pass  # let the stdlib decide (and word the error as before)
+        try:
+            return json.loads(body.decode(encoding), parse_constant=strict_constant)
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
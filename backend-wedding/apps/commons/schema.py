@@ -0,0 +1,27 @@
+"""
+OpenAPI schema extensions (drf-spectacular).
+"""
+from django.conf import settings
+from drf_spectacular.extensions import OpenApiAuthenticationExtension
+from drf_spectacular.plumbing import build_bearer_security_scheme_object
+
+
+class FastPathAuthenticationScheme(OpenApiAuthenticationExtension):
+    """FastPathAuthentication accepts any one of JWT, token or session auth."""
+
+    target_class = "apps.commons.authentication.FastPathAuthentication"
+    name = ["jwtAuth", "tokenAuth", "cookieAuth"]
+
+    def get_security_requirement(self, auto_schema):
+        return [{name: []} for name in self.name]
+
+    def get_security_definition(self, auto_schema):
+        return [
+            build_bearer_security_scheme_object(
+                header_name="Authorization", token_prefix="Bearer", bearer_format="JWT"
+            ),
+            build_bearer_security_scheme_object(
+                header_name="Authorization", token_prefix="Token"
+            ),
+            {"type": "apiKey", "in": "cookie", "name": settings.SESSION_COOKIE_NAME},
+        ]
@@ -0,0 +1,23 @@
+"""
+Commons signals - Keep the authentication cache in step with the database.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from apps.commons.authentication import AuthCache
+from apps.commons.models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop the cached user on any change (deactivation, password, profile)."""
+    AuthCache.invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_cached_token(sender, instance, **kwargs):
+    """Drop the cached token on logout, expiry or replacement."""
+    AuthCache.invalidate_token(instance.key)
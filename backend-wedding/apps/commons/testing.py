@@ -0,0 +1,275 @@
+"""
+Query-count regression harness shared by the apps' tests.py.
+
+QueryCountRegressionMixin discovers every route of an app's URLconf and
+requests it at two data sizes (SampleDataService weddings with 10 and
+200 guests, todos, registry items, notifications and vendors). A route
+whose query count is higher at the large size has a per-row query (N+1)
+somewhere and fails the test.
+
+- Every route with a GET handler is requested, with ``?wedding=<id>``
+  and URL kwargs filled in from the seeded data (``pk`` is the first
+  object of the view's own queryset for the wedding owner).
+- Write-only routes are only requested when the test case gives them a
+  payload in ``post_payloads``; the rest are listed as not exercised.
+- ``known_growth`` maps route names to the reason they still grow, and
+  ``broken_routes`` those that raise to the reason they do. Listed routes
+  must keep misbehaving: once one is fixed the test asks for the entry to
+  be removed.
+
+Each size gets its own owner and wedding; vendors are global, so the
+large size adds to the small one's vendors before it is measured.
+"""
+import random
+import re
+from collections import namedtuple
+from importlib import import_module
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, reverse
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from apps.wedding_planner.models import MealChoice, Table
+from apps.wedding_planner.services import SampleDataService
+
+SIZES = {
+    "small": {
+        "guests": 10, "todos": 10, "checklist_items": 2,
+        "registry_items": 10, "notifications": 10, "vendors": 10,
+    },
+    "large": {
+        "guests": 200, "todos": 200, "checklist_items": 5,
+        "registry_items": 200, "notifications": 200, "vendors": 200,
+    },
+}
+SKIPPED_METHODS = {"head", "options", "trace"}
+URL_KWARG = re.compile(r"\(\?P<(\w+)>|<(?:\w+:)?(\w+)>")
+
+Route = namedtuple("Route", "name pattern methods callback")
+
+
+def discover_routes(urlconf):
+    """
+    Named routes of ``urlconf`` with the HTTP methods their views handle.
+    Router API roots and ``.json`` format-suffix variants are skipped.
+    """
+    module = import_module(urlconf)
+    namespace = getattr(module, "app_name", None)
+
+    def walk(patterns, prefix=""):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                yield from walk(pattern.url_patterns, prefix + str(pattern.pattern))
+            elif isinstance(pattern, URLPattern) and pattern.name:
+                yield prefix + str(pattern.pattern), pattern
+
+    routes = {}
+    for regex, pattern in walk(module.urlpatterns):
+        if pattern.name == "api-root" or "(?P<format>" in regex:
+            continue
+        name = f"{namespace}:{pattern.name}" if namespace else pattern.name
+        routes[name] = Route(name, regex, _view_methods(pattern.callback), pattern.callback)
+    return list(routes.values())
+
+
+def _view_methods(callback):
+    actions = getattr(callback, "actions", None)
+    if actions:
+        return set(actions)
+    view_class = getattr(callback, "view_class", None) or getattr(callback, "cls", None)
+    if view_class is None:
+        return {"get"}
+    return {
+        method for method in view_class.http_method_names
+        if method not in SKIPPED_METHODS and hasattr(view_class, method)
+    }
+
+
+class QueryCountRegressionMixin:
+    """
+    Mixin for a django TestCase; set ``urlconf`` to the app's URL module.
+    """
+
+    urlconf = None
+    # route name -> extra query params (on top of ``wedding``)
+    route_params = {}
+    # route name -> {kwarg: callable(data) -> value}, overriding the defaults
+    route_kwargs = {}
+    # route name -> callable(data) -> POST body for write-only routes
+    post_payloads = {}
+    # route name -> why its query count still grows with the data
+    known_growth = {}
+    # route name -> why the view raises
+    broken_routes = {}
+
+    def test_query_count_does_not_grow_with_data(self):
+        routes = discover_routes(self.urlconf)
+        random.seed(1234)
+        vendors = []
+
+        measured = {}
+        for size, counts in SIZES.items():
+            vendors += SampleDataService.seed_vendors(
+                counts["vendors"] - len(vendors), prefix=f"qc-{size}"
+            )
+            owner = SampleDataService.create_owner(f"query-count-{size}@example.com")
+            wedding = SampleDataService.seed_wedding(
+                owner,
+                guests=counts["guests"],
+                todos=counts["todos"],
+                checklist_items=counts["checklist_items"],
+                registry_items=counts["registry_items"],
+                notifications=counts["notifications"],
+                vendors=vendors,
+                label=f"qc-{size}",
+            )
+            data = self._seed_lookups(owner, wedding)
+            measured[size] = {route.name: self._measure(route, data) for route in routes}
+
+        not_exercised = []
+        for route in routes:
+            small, large = measured["small"][route.name], measured["large"][route.name]
+            if small is None:
+                not_exercised.append(route.name)
+                continue
+            with self.subTest(route=route.name, pattern=route.pattern):
+                if route.name in self.broken_routes:
+                    self.assertIsNone(
+                        small[1], f"{route.name} works now; remove it from broken_routes"
+                    )
+                    continue
+                for result in (small, large):
+                    if result[1] is None:
+                        self.fail(f"{route.name} raised {result[0]}")
+                self.assertEqual(
+                    small[0], large[0],
+                    f"{route.name} answered {small[0]} with little data but {large[0]} "
+                    f"with more; the query counts are not comparable",
+                )
+                grew = large[1] > small[1]
+                if route.name in self.known_growth:
+                    self.assertTrue(
+                        grew,
+                        f"{route.name} no longer grows ({small[1]} -> {large[1]} queries); "
+                        f"remove it from known_growth",
+                    )
+                else:
+                    self.assertFalse(
+                        grew,
+                        f"{route.name} ran {small[1]} queries with "
+                        f"{SIZES['small']['guests']} rows per parent and {large[1]} with "
+                        f"{SIZES['large']['guests']}: a query is issued per row",
+                    )
+        self.assertTrue(
+            len(not_exercised) < len(routes),
+            f"No route of {self.urlconf} could be exercised",
+        )
+
+    def _seed_lookups(self, owner, wedding):
+        """Objects URL kwargs are filled in from."""
+        saved = owner.saved_vendors.select_related("vendor__category").order_by("id").first()
+        return {
+            "owner": owner,
+            "wedding": wedding,
+            "token": wedding.restaurant_access_tokens.first(),
+            "guest": wedding.guests.order_by("id").first(),
+            "table": Table.objects.filter(wedding=wedding).order_by("id").first(),
+            "meal": MealChoice.objects.filter(wedding=wedding).order_by("id").first(),
+            "vendor": saved.vendor,
+        }
+
+    def _default_kwargs(self, data):
+        return {
+            "access_code": lambda: data["token"].access_code,
+            "table_id": lambda: data["table"].id,
+            "meal_id": lambda: data["meal"].id,
+            "user_code": lambda: data["guest"].user_code,
+            "guest_code": lambda: data["guest"].user_code,
+            "code": lambda: data["wedding"].public_code,
+            "slug": lambda: data["wedding"].slug,
+            "vendor_id": lambda: data["vendor"].id,
+        }
+
+    def _measure(self, route, data):
+        """
+        (status, query count) for one request, (error, None) if the view
+        raised, or None if the route is not exercised.
+        """
+        if "get" in route.methods:
+            method, body = "get", None
+        elif route.name in self.post_payloads:
+            method, body = "post", self.post_payloads[route.name](data)
+        else:
+            return None
+
+        kwargs = self._url_kwargs(route, data)
+        if kwargs is None:
+            return None
+        url = reverse(route.name, kwargs=kwargs)
+
+        client = APIClient()
+        client.force_authenticate(data["owner"])
+        params = {"wedding": data["wedding"].id, **self.route_params.get(route.name, {})}
+        if method == "get":
+            request = lambda: client.get(url, params)
+        else:
+            url = f"{url}?wedding={data['wedding'].id}"
+            request = lambda: client.post(url, body, format="json")
+
+        try:
+            with transaction.atomic():
+                self._read(request())  # warm-up: fills per-process caches
+                with CaptureQueriesContext(connection) as queries:
+                    response = self._read(request())
+        except Exception as exc:
+            return f"{type(exc).__name__}: {exc}", None
+        return response.status_code, len(queries.captured_queries)
+
+    def _url_kwargs(self, route, data):
+        """URL kwargs for ``route``, or None when one cannot be filled in."""
+        providers = self._default_kwargs(data)
+        providers.update({
+            name: (lambda fn=fn: fn(data))
+            for name, fn in self.route_kwargs.get(route.name, {}).items()
+        })
+        kwargs = {}
+        for groups in URL_KWARG.findall(route.pattern):
+            name = groups[0] or groups[1]
+            if name in providers:
+                kwargs[name] = providers[name]()
+            elif name == "pk":
+                kwargs[name] = self._first_pk(route, data)
+            else:
+                kwargs[name] = None
+            if kwargs[name] is None:
+                return None
+        return kwargs
+
+    def _first_pk(self, route, data):
+        """First pk of the viewset's queryset as seen by the wedding owner."""
+        view_class = getattr(route.callback, "cls", None)
+        actions = getattr(route.callback, "actions", None)
+        if view_class is None or not actions:
+            return None
+        request = APIRequestFactory().get("/", {"wedding": data["wedding"].id})
+        force_authenticate(request, user=data["owner"])
+        view = view_class(**route.callback.initkwargs)
+        view.action_map = actions
+        view.action = actions.get("get") or next(iter(actions.values()))
+        view.args, view.kwargs, view.format_kwarg = (), {}, None
+        view.request = view.initialize_request(request)
+        try:
+            queryset = view.get_queryset()
+        except Exception:
+            return None
+        return queryset.order_by("pk").values_list("pk", flat=True).first()
+
+    @staticmethod
+    def _read(response):
+        """Consume streamed bodies (except event streams, which never end)."""
+        if response.streaming and not response.get("Content-Type", "").startswith(
+            "text/event-stream"
+        ):
+            b"".join(response.streaming_content)
+        return response
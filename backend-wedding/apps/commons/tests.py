@@ -1,3 +1,7 @@
 from django.test import TestCase
 
-# Create your tests here.
+from apps.commons.testing import QueryCountRegressionMixin
+
+
+class QueryCountRegressionTests(QueryCountRegressionMixin, TestCase):
+    urlconf = "apps.commons.urls"
@@ -1,7 +1,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from rest_framework_simplejwt.views import TokenRefreshView
-from .views import HealthCheckView, RegisterView, UserMeView, LoginView
+from .views import (
+    HealthCheckView,
+    LoginView,
+    QueryProfileStatsView,
+    RegisterView,
+    UserMeView,
+)
 from .token_views import logout, token_status
 from .view.categories_views import Categories
 from .view.todo_views import TodoViews
@@ -21,5 +27,7 @@ urlpatterns = [
     path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     # Legacy token auth status
     path("auth/token-status/", token_status, name="token-status"),
+    # Query profiler stats (staff only)
+    path("profiling/stats/", QueryProfileStatsView.as_view(), name="profiling-stats"),
     path("", include(router.urls)),
 ]
@@ -15,8 +15,15 @@ class TodoViews(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        """Scope todos to the authenticated user."""
-        return Todo.objects.filter(user=self.request.user)
+        """
+        Scope todos to the authenticated user. Lists get ``schedule_status``
+        annotated; single-object actions don't, so an update serializes the
+        status of the saved dates rather than the one read before the save.
+        """
+        queryset = Todo.objects.filter(user=self.request.user)
+        if self.action in ("list", "get_active_todos"):
+            queryset = queryset.with_status()
+        return queryset
 
     @action(detail=False, methods=["get"], url_path="server-time")
     def get_server_time(self, request):
@@ -32,8 +39,11 @@ class TodoViews(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["get"], url_path="active")
     def get_active_todos(self, request):
-        """Return only currently active todos for the user."""
-        todos = self.get_queryset()
-        active_todos = [todo for todo in todos if todo.is_active == "active"]
+        """Return only currently active todos for the user (paginated)."""
+        active_todos = self.get_queryset().active()
+        page = self.paginate_queryset(active_todos)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
         serializer = self.get_serializer(active_todos, many=True)
         return Response(serializer.data)
@@ -1,10 +1,15 @@
+from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
 from rest_framework import serializers, status
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from config.database import connection_stats
+
+from .profiling import QueryProfileStore
+
 User = get_user_model()
 
 
@@ -146,3 +151,24 @@ class RegisterView(APIView):
             },
             status=status.HTTP_201_CREATED,
         )
+
+
+class QueryProfileStatsView(APIView):
+    """
+    Staff only: p50/p95 timings and query counts per view, collected by
+    QueryProfilerMiddleware in this worker process, and the process's
+    database connection pool counters. DELETE resets the view timings.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response({
+            "enabled": settings.QUERY_PROFILER_ENABLED,
+            "views": QueryProfileStore.stats(),
+            "databases": connection_stats(),
+        })
+
+    def delete(self, request):
+        QueryProfileStore.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,3 +1,19 @@
 from django.test import TestCase
 
-# Create your tests here.
+from apps.commons.testing import QueryCountRegressionMixin
+
+
+class QueryCountRegressionTests(QueryCountRegressionMixin, TestCase):
+    urlconf = "apps.email_services.urls"
+    post_payloads = {
+        "email_services:send-rsvp-confirmation": lambda data: {
+            "guest_id": data["guest"].id, "confirmed": True,
+        },
+        "email_services:send-reminder": lambda data: {"guest_id": data["guest"].id},
+        "email_services:send-event-details": lambda data: {"guest_id": data["guest"].id},
+        "email_services:send-seating-assignment": lambda data: {"guest_id": data["guest"].id},
+        "email_services:send-bulk-reminders": lambda data: {},
+        "email_services:send-bulk-event-details": lambda data: {},
+        "email_services:send-bulk-seating-assignments": lambda data: {},
+        "email_services:test-email": lambda data: {"to_email": "planner@example.com"},
+    }
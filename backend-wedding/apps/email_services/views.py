@@ -293,9 +293,14 @@ def send_seating_assignment_email(request):
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    try:
-        seating = guest.seating_assignment
-    except SeatingAssignment.DoesNotExist:
+    seating = (
+        guest.seating_assignments.filter(
+            attendee_type=SeatingAssignment.AttendeeType.GUEST
+        )
+        .select_related("table")
+        .first()
+    )
+    if seating is None:
         return Response(
             {"error": "Guest has no seating assignment"},
             status=status.HTTP_400_BAD_REQUEST
@@ -5,3 +5,7 @@ class TodoListWeddingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.todo_list_wedding'
     verbose_name = 'Todo List - Wedding'
+
+    def ready(self):
+        # Import signals when app is ready
+        from apps.todo_list_wedding import signals  # noqa
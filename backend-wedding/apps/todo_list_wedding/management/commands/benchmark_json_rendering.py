@@ -0,0 +1,102 @@
+"""
+Benchmark JSON rendering and parsing of a large todo dashboard payload.
+
+Seeds a wedding with 2,000 todos (by default) through SampleDataService
+inside a transaction that is rolled back afterwards, fetches
+``/todos/dashboard/`` once as the owner and then renders its data with
+DRF's JSONRenderer and with FastJSONRenderer, and parses the rendered
+body with JSONParser and FastJSONParser. Reports median/p95 per
+implementation and fails if the two renderers' bytes or the two parsers'
+results differ.
+
+Usage:
+    python manage.py benchmark_json_rendering --todos 2000 --runs 50
+"""
+import io
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client
+from django.urls import reverse
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.commons.profiling import percentile
+from apps.commons.renderers import FastJSONParser, FastJSONRenderer, orjson
+from apps.wedding_planner.services import SampleDataService
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Compare stdlib and orjson rendering/parsing of a large todo dashboard"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--todos", type=int, default=2000)
+        parser.add_argument("--runs", type=int, default=50)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        if orjson is None:
+            self.stdout.write(self.style.WARNING(
+                "orjson is not installed; FastJSONRenderer uses the stdlib fallback."
+            ))
+        try:
+            with transaction.atomic():
+                self._run(options)
+                raise _Rollback()
+        except _Rollback:
+            self.stdout.write("Seeded wedding rolled back.")
+
+    def _run(self, options):
+        owner = SampleDataService.create_owner()
+        wedding = SampleDataService.seed_wedding(
+            owner, guests=10, todos=options["todos"], registry_items=0,
+            notifications=0, label="json-bench",
+        )
+        client = Client()
+        client.force_login(owner)
+        response = client.get(reverse("todo-dashboard"), {"wedding": wedding.id})
+        if response.status_code != 200:
+            raise CommandError(f"Dashboard answered {response.status_code}")
+        data = response.data
+
+        runs = options["runs"]
+        stdlib_body, stdlib_render = self._time(lambda: JSONRenderer().render(data), runs)
+        fast_body, fast_render = self._time(lambda: FastJSONRenderer().render(data), runs)
+        if fast_body != stdlib_body:
+            raise CommandError("FastJSONRenderer output differs from JSONRenderer")
+
+        parse = lambda parser: parser.parse(io.BytesIO(stdlib_body))  # noqa: E731
+        stdlib_data, stdlib_parse = self._time(lambda: parse(JSONParser()), runs)
+        fast_data, fast_parse = self._time(lambda: parse(FastJSONParser()), runs)
+        if fast_data != stdlib_data:
+            raise CommandError("FastJSONParser result differs from JSONParser")
+
+        self.stdout.write(
+            f"Dashboard with {options['todos']} todos: {len(stdlib_body) / 1024:.0f} KB, "
+            f"identical output\n"
+        )
+        self.stdout.write(f"  {'':<8} {'stdlib p50':>11} {'p95':>9} {'fast p50':>11} {'p95':>9} {'speedup':>8}")
+        for name, old, new in (("render", stdlib_render, fast_render), ("parse", stdlib_parse, fast_parse)):
+            old_p50, new_p50 = statistics.median(old), statistics.median(new)
+            self.stdout.write(
+                f"  {name:<8} {old_p50:9.2f}ms {percentile(old, 95):7.2f}ms "
+                f"{new_p50:9.2f}ms {percentile(new, 95):7.2f}ms {old_p50 / new_p50:7.1f}x"
+            )
+
+    def _time(self, call, runs):
+        """(last result, timings in ms) of ``runs`` calls after one warm-up."""
+        result = call()
+        timings = []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            result = call()
+            timings.append((time.perf_counter() - t0) * 1000)
+        return result, timings
@@ -0,0 +1,208 @@
+"""
+Show that the todo list/dashboard queries use the Todo indexes.
+
+Seeds a synthetic set of weddings with todos (100k by default) inside a
+transaction that is rolled back afterwards, runs ANALYZE, then for every
+access path of TodoViewSet prints the EXPLAIN plan, the indexes it uses
+and the median time. The same paths are timed again with the composite
+indexes dropped (inside the same transaction) for comparison.
+
+The partial index on open todos is used by PostgreSQL, which plans with
+the excluded status values. SQLite only sees them as bound parameters and
+falls back to the wedding index for those paths.
+
+Usage:
+    python manage.py benchmark_todo_indexes --todos 100000 --weddings 20
+"""
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.commons.models import User
+from apps.todo_list_wedding.models import Todo
+from apps.todo_list_wedding.views import TodoViewSet
+from apps.wedding_planner.models import Wedding
+
+CLOSED = [Todo.Status.COMPLETED, Todo.Status.CANCELLED]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN and time the todo access paths on a seeded database"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--todos", type=int, default=100_000)
+        parser.add_argument("--weddings", type=int, default=20)
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--plans", action="store_true", help="Print full query plans")
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        try:
+            with transaction.atomic():
+                self._run(options)
+                raise _Rollback()
+        except _Rollback:
+            self.stdout.write("Seeded todos rolled back.")
+
+    def _run(self, options):
+        started = time.perf_counter()
+        wedding = self._seed(options["todos"], options["weddings"])
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        self.stdout.write(
+            f"Seeded {options['todos']} todos over {options['weddings']} weddings "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+
+        paths = self._access_paths(wedding)
+        index_names = [index.name for index in Todo._meta.indexes]
+
+        self.stdout.write("\nWith indexes:")
+        with_indexes = {}
+        for label, run in paths.items():
+            queryset, evaluate = run()
+            plan = queryset.explain()
+            used = [name for name in index_names if name in plan] or ["-"]
+            with_indexes[label] = self._time(evaluate, options["runs"])
+            self.stdout.write(
+                f"  {label:<22} {with_indexes[label]:8.2f}ms  uses {', '.join(used)}"
+            )
+            if options["plans"]:
+                for line in plan.splitlines():
+                    self.stdout.write(f"      {line}")
+
+        with connection.cursor() as cursor:
+            for name in index_names:
+                cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+            cursor.execute("ANALYZE")
+
+        self.stdout.write("\nWithout composite indexes:")
+        for label, run in paths.items():
+            _, evaluate = run()
+            elapsed = self._time(evaluate, options["runs"])
+            self.stdout.write(
+                f"  {label:<22} {elapsed:8.2f}ms  ({elapsed / with_indexes[label]:.1f}x)"
+            )
+
+    def _access_paths(self, wedding):
+        """
+        Querysets as built by TodoViewSet (list filters/sorts, overdue,
+        today, upcoming) and the dashboard counts, each paired with how the
+        endpoint evaluates it (a page of 20 or a COUNT).
+        """
+        today = timezone.now().date()
+        week_end = today + timedelta(days=7)
+
+        def listing(**params):
+            queryset = self._view_queryset(wedding, params)
+            return queryset, lambda: list(queryset[:20])
+
+        def page(queryset):
+            return queryset, lambda: list(queryset[:20])
+
+        def count(queryset):
+            return queryset, queryset.count
+
+        base = Todo.objects.filter(wedding=wedding)
+        return {
+            "list default": lambda: listing(),
+            "list open": lambda: listing(status="open"),
+            "list status/due": lambda: listing(status="in_progress", sort_by="due_date"),
+            "list due range": lambda: listing(
+                due_after=str(today), due_before=str(week_end), sort_by="due_date"
+            ),
+            "overdue": lambda: page(
+                self._view_queryset(wedding, {})
+                .filter(due_date__lt=today)
+                .exclude(status__in=CLOSED)
+                .order_by("due_date")
+            ),
+            "today": lambda: page(
+                self._view_queryset(wedding, {})
+                .filter(due_date=today)
+                .exclude(status=Todo.Status.CANCELLED)
+                .order_by("-priority_order")
+            ),
+            "upcoming": lambda: page(
+                self._view_queryset(wedding, {})
+                .filter(due_date__gte=today, due_date__lte=week_end)
+                .exclude(status__in=CLOSED)
+                .order_by("due_date", "-priority_order")
+            ),
+            "dashboard status count": lambda: count(
+                base.filter(status=Todo.Status.COMPLETED)
+            ),
+            "dashboard overdue": lambda: count(
+                base.exclude(status__in=CLOSED).filter(due_date__lt=today)
+            ),
+        }
+
+    def _view_queryset(self, wedding, params):
+        """TodoViewSet.get_queryset for the given query params."""
+        view = TodoViewSet()
+        view.action = "list"
+        view.format_kwarg = None
+        view.request = Request(
+            APIRequestFactory().get("/", {"wedding": wedding.id, **params})
+        )
+        return view.get_queryset()
+
+    def _seed(self, todo_count, wedding_count):
+        suffix = random.randint(0, 10**9)
+        owner = User.objects.create_user(
+            email=f"todo-benchmark-{suffix}@example.com",
+            password=None,
+        )
+        weddings = [
+            Wedding.objects.create(
+                owner=owner,
+                partner1_name="Alex",
+                partner2_name="Sam",
+                slug=f"todo-benchmark-{suffix}-{n}",
+            )
+            for n in range(wedding_count)
+        ]
+
+        today = timezone.now().date()
+        statuses = [choice for choice, _ in Todo.Status.choices]
+        priorities = [choice for choice, _ in Todo.Priority.choices]
+        batch = []
+        for i in range(todo_count):
+            priority = random.choice(priorities)
+            batch.append(Todo(
+                wedding=weddings[i % wedding_count],
+                title=f"Task {i}",
+                status=random.choices(statuses, weights=[30, 25, 10, 30, 5])[0],
+                priority=priority,
+                priority_order=Todo.priority_order_for(priority),
+                due_date=(
+                    today + timedelta(days=random.randint(-200, 400))
+                    if random.random() < 0.9 else None
+                ),
+                is_pinned=random.random() < 0.05,
+            ))
+            if len(batch) == 5000:
+                Todo.objects.bulk_create(batch)
+                batch = []
+        Todo.objects.bulk_create(batch)
+        return weddings[0]
+
+    def _time(self, evaluate, runs):
+        timings = []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            evaluate()
+            timings.append((time.perf_counter() - t0) * 1000)
+        return statistics.median(timings)
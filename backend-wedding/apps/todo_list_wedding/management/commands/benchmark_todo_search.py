@@ -0,0 +1,144 @@
+"""
+Benchmark ranked todo search against the old icontains filter.
+
+Seeds synthetic weddings with todos (200k by default) whose titles,
+descriptions, notes and vendor names are drawn from a wedding-planning
+vocabulary, inside a transaction that is rolled back afterwards. Each
+query is then run wedding-scoped, as TodoViewSet does, both as the four
+OR'ed ``icontains`` filters and through TodoSearchService, reporting
+median time and match counts for a first page of 20.
+
+Usage:
+    python manage.py benchmark_todo_search --todos 200000 --weddings 200
+"""
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+
+from apps.commons.models import User
+from apps.todo_list_wedding.models import Todo
+from apps.todo_list_wedding.services import TodoSearchService
+from apps.todo_list_wedding.services.todo_search_service import highlight_snippet
+from apps.wedding_planner.models import Wedding
+
+WORDS = (
+    "book venue caterer florist photographer videographer band dj cake "
+    "dress suit rings invitations rsvp seating chart menu tasting deposit "
+    "contract rehearsal dinner honeymoon flights hotel shuttle decor "
+    "lighting centerpieces bouquet boutonniere officiant license vows "
+    "playlist favors welcome bags guestbook registry thank you cards "
+    "budget review confirm schedule call email pay balance final fitting"
+).split()
+VENDORS = (
+    "Bloom & Co", "Golden Hour Studio", "Harbor Catering", "Velvet Strings",
+    "Sweet Layers Bakery", "Lakeside Manor", "Night Owl DJs", None, None,
+)
+QUERIES = ("florist", "book venue", "cak", "final fitting dress", "harbor", "zzz")
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark full-text todo search on a seeded database"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--todos", type=int, default=200_000)
+        parser.add_argument("--weddings", type=int, default=200)
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        try:
+            with transaction.atomic():
+                self._run(options)
+                raise _Rollback()
+        except _Rollback:
+            self.stdout.write("Seeded todos rolled back.")
+
+    def _run(self, options):
+        started = time.perf_counter()
+        wedding = self._seed(options["todos"], options["weddings"])
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        self.stdout.write(
+            f"Seeded {options['todos']} todos over {options['weddings']} weddings "
+            f"in {time.perf_counter() - started:.1f}s ({connection.vendor})"
+        )
+
+        base = Todo.objects.filter(wedding=wedding)
+        self.stdout.write(
+            f"\n  {'query':<22} {'icontains':>10} {'matches':>8} {'search':>10} {'matches':>8}"
+        )
+        for query in QUERIES:
+            old = base.filter(
+                Q(title__icontains=query) |
+                Q(description__icontains=query) |
+                Q(notes__icontains=query) |
+                Q(vendor_name__icontains=query)
+            ).order_by("-is_pinned", "-priority_order", "due_date")
+            new = TodoSearchService.search(base, query, wedding_id=wedding.id).order_by(
+                "-search_rank", "-is_pinned", "-priority_order"
+            )
+            old_ms = self._time(lambda: (old.count(), list(old[:20])), options["runs"])
+            new_ms = self._time(lambda: (new.count(), list(new[:20])), options["runs"])
+            self.stdout.write(
+                f"  {query!r:<22} {old_ms:8.2f}ms {old.count():8} "
+                f"{new_ms:8.2f}ms {new.count():8}"
+            )
+
+        top = TodoSearchService.search(base, QUERIES[1], wedding_id=wedding.id).order_by(
+            "-search_rank"
+        ).first()
+        if top:
+            self.stdout.write(
+                f"\nTop hit for {QUERIES[1]!r}: {highlight_snippet(top.search_snippet)}"
+            )
+
+    def _seed(self, todo_count, wedding_count):
+        suffix = random.randint(0, 10**9)
+        owner = User.objects.create_user(
+            email=f"todo-search-benchmark-{suffix}@example.com",
+            password=None,
+        )
+        weddings = [
+            Wedding.objects.create(
+                owner=owner,
+                partner1_name="Alex",
+                partner2_name="Sam",
+                slug=f"todo-search-benchmark-{suffix}-{n}",
+            )
+            for n in range(wedding_count)
+        ]
+
+        def phrase(low, high):
+            return " ".join(random.choices(WORDS, k=random.randint(low, high)))
+
+        batch = []
+        for i in range(todo_count):
+            batch.append(Todo(
+                wedding=weddings[i % wedding_count],
+                title=phrase(2, 5).capitalize(),
+                description=phrase(8, 25) if random.random() < 0.7 else None,
+                notes=phrase(4, 12) if random.random() < 0.3 else None,
+                vendor_name=random.choice(VENDORS),
+            ))
+            if len(batch) == 5000:
+                Todo.objects.bulk_create(batch)
+                batch = []
+        Todo.objects.bulk_create(batch)
+        return weddings[0]
+
+    def _time(self, evaluate, runs):
+        timings = []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            evaluate()
+            timings.append((time.perf_counter() - t0) * 1000)
+        return statistics.median(timings)
@@ -0,0 +1,68 @@
+"""
+Reconcile todo checklist/subtask totals with their rows.
+
+Checklist and subtask mutations keep Todo.checklist_total,
+checklist_completed, subtask_total, subtask_completed, subtask_cancelled
+and progress_percent current incrementally. Paths that bypass the API
+(admin inlines, raw SQL) can leave them drifted; this command recomputes
+every todo from two grouped queries and writes back only the todos that
+differ.
+
+Usage:
+    python manage.py recompute_todo_progress [--dry-run]
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q
+
+from apps.todo_list_wedding.models import Todo, TodoChecklist
+
+
+class Command(BaseCommand):
+    help = "Recompute todo checklist/subtask totals and progress"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report drift without writing")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        checklists = {
+            row["todo_id"]: row
+            for row in TodoChecklist.objects.values("todo_id")
+            .annotate(
+                checklist_total=Count("id"),
+                checklist_completed=Count("id", filter=Q(is_completed=True)),
+            )
+            .order_by()
+        }
+        subtasks = {
+            row["parent_id"]: row
+            for row in Todo.objects.filter(parent__isnull=False)
+            .values("parent_id")
+            .annotate(
+                subtask_total=Count("id"),
+                subtask_completed=Count("id", filter=Q(status=Todo.Status.COMPLETED)),
+                subtask_cancelled=Count("id", filter=Q(status=Todo.Status.CANCELLED)),
+            )
+            .order_by()
+        }
+
+        fields = list(Todo.COUNTER_FIELDS) + ["progress_percent"]
+        drifted = []
+        todos = Todo.objects.only("id", *fields).order_by("id")
+        for todo in todos.iterator(chunk_size=options["batch_size"]):
+            counts = {**checklists.get(todo.id, {}), **subtasks.get(todo.id, {})}
+            before = [getattr(todo, field) for field in fields]
+            for field in Todo.COUNTER_FIELDS:
+                setattr(todo, field, counts.get(field, 0))
+            todo.refresh_progress()
+            if [getattr(todo, field) for field in fields] != before:
+                drifted.append(todo)
+
+        if options["dry_run"]:
+            self.stdout.write(f"{len(drifted)} todos have drifted progress totals")
+            return
+
+        with transaction.atomic():
+            Todo.objects.bulk_update(drifted, fields, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Updated {len(drifted)} todos"))
@@ -0,0 +1,68 @@
+# Generated by Django 5.1.4 on 2026-10-19 07:29
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_counters(apps, schema_editor):
+    """Seed checklist/subtask totals from existing rows"""
+    Todo = apps.get_model('todo_list_wedding', 'Todo')
+    TodoChecklist = apps.get_model('todo_list_wedding', 'TodoChecklist')
+
+    checklists = TodoChecklist.objects.values('todo_id').annotate(
+        total=Count('id'),
+        completed=Count('id', filter=Q(is_completed=True)),
+    ).order_by()
+    for row in checklists:
+        Todo.objects.filter(pk=row['todo_id']).update(
+            checklist_total=row['total'],
+            checklist_completed=row['completed'],
+        )
+
+    subtasks = Todo.objects.filter(parent__isnull=False).values('parent_id').annotate(
+        total=Count('id'),
+        completed=Count('id', filter=Q(status='completed')),
+        cancelled=Count('id', filter=Q(status='cancelled')),
+    ).order_by()
+    for row in subtasks:
+        Todo.objects.filter(pk=row['parent_id']).update(
+            subtask_total=row['total'],
+            subtask_completed=row['completed'],
+            subtask_cancelled=row['cancelled'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo_list_wedding', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='todo',
+            name='checklist_completed',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='todo',
+            name='checklist_total',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='todo',
+            name='subtask_cancelled',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='todo',
+            name='subtask_completed',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='todo',
+            name='subtask_total',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
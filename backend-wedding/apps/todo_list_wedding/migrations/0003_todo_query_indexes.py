@@ -0,0 +1,28 @@
+# Generated by Django 5.1.4 on 2026-10-19 07:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo_list_wedding', '0002_todo_progress_counters'),
+        ('wedding_planner', '0027_notification_daily_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['wedding', '-is_pinned', '-priority_order', 'due_date'], name='todo_wedding_list_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(fields=['wedding', 'status', 'due_date'], name='todo_wedding_status_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='todo',
+            index=models.Index(condition=models.Q(('status__in', ['completed', 'cancelled']), _negated=True), fields=['wedding', 'due_date', '-priority_order'], name='todo_open_due_idx'),
+        ),
+    ]
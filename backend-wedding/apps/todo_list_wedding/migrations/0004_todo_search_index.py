@@ -0,0 +1,96 @@
+# Generated by Django 5.1.4 on 2026-10-19 07:45
+
+from django.db import migrations
+
+# Same expression as TodoSearchService.PG_VECTOR
+PG_CREATE = [
+    """
+    CREATE INDEX todo_search_vector_idx ON todo_list_wedding_todo USING GIN ((
+        setweight(to_tsvector('simple'::regconfig, COALESCE(title, '')), 'A') ||
+        setweight(to_tsvector('simple'::regconfig,
+            COALESCE(description, '') || ' ' || COALESCE(notes, '') || ' ' ||
+            COALESCE(vendor_name, '')), 'B')
+    ))
+    """,
+]
+PG_DROP = ["DROP INDEX IF EXISTS todo_search_vector_idx"]
+
+# External-content FTS5 table kept in sync by triggers, so every write
+# path (save, update, bulk_create, cascades) is covered. A later migration
+# that makes SQLite rebuild the todo table drops the triggers and must
+# recreate them.
+SQLITE_CREATE = [
+    """
+    CREATE VIRTUAL TABLE todo_list_wedding_todo_fts USING fts5(
+        title, description, notes, vendor_name, wedding_id,
+        content='todo_list_wedding_todo', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER todo_fts_insert AFTER INSERT ON todo_list_wedding_todo BEGIN
+        INSERT INTO todo_list_wedding_todo_fts(
+            rowid, title, description, notes, vendor_name, wedding_id
+        ) VALUES (
+            new.id, new.title, new.description, new.notes, new.vendor_name, new.wedding_id
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER todo_fts_delete AFTER DELETE ON todo_list_wedding_todo BEGIN
+        INSERT INTO todo_list_wedding_todo_fts(
+            todo_list_wedding_todo_fts, rowid, title, description, notes, vendor_name, wedding_id
+        ) VALUES (
+            'delete', old.id, old.title, old.description, old.notes, old.vendor_name, old.wedding_id
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER todo_fts_update AFTER UPDATE OF
+        title, description, notes, vendor_name, wedding_id ON todo_list_wedding_todo
+    BEGIN
+        INSERT INTO todo_list_wedding_todo_fts(
+            todo_list_wedding_todo_fts, rowid, title, description, notes, vendor_name, wedding_id
+        ) VALUES (
+            'delete', old.id, old.title, old.description, old.notes, old.vendor_name, old.wedding_id
+        );
+        INSERT INTO todo_list_wedding_todo_fts(
+            rowid, title, description, notes, vendor_name, wedding_id
+        ) VALUES (
+            new.id, new.title, new.description, new.notes, new.vendor_name, new.wedding_id
+        );
+    END
+    """,
+    "INSERT INTO todo_list_wedding_todo_fts(todo_list_wedding_todo_fts) VALUES ('rebuild')",
+]
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS todo_fts_insert",
+    "DROP TRIGGER IF EXISTS todo_fts_delete",
+    "DROP TRIGGER IF EXISTS todo_fts_update",
+    "DROP TABLE IF EXISTS todo_list_wedding_todo_fts",
+]
+
+
+def run_for_vendor(postgres, sqlite):
+    def run(apps, schema_editor):
+        statements = {
+            'postgresql': postgres,
+            'sqlite': sqlite,
+        }.get(schema_editor.connection.vendor, [])
+        for sql in statements:
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo_list_wedding', '0003_todo_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor(PG_CREATE, SQLITE_CREATE),
+            run_for_vendor(PG_DROP, SQLITE_DROP),
+        ),
+    ]
@@ -2,7 +2,7 @@
 Todo List models for Wedding Planner.
 Provides comprehensive task management for wedding planning timeline.
 """
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
@@ -63,10 +63,44 @@ class Todo(TimeStampedBaseModel):
         HIGH = "high", "High"
         URGENT = "urgent", "Urgent"
 
+    # Numeric ordering value stored in priority_order for each priority
+    PRIORITY_ORDER = {
+        Priority.LOW: 25,
+        Priority.MEDIUM: 50,
+        Priority.HIGH: 75,
+        Priority.URGENT: 100,
+    }
+
+    COUNTER_FIELDS = (
+        "checklist_total",
+        "checklist_completed",
+        "subtask_total",
+        "subtask_completed",
+        "subtask_cancelled",
+    )
+
     class Meta:
         verbose_name = "Todo"
         verbose_name_plural = "Todos"
         ordering = ["-priority_order", "due_date", "created_at"]
+        indexes = [
+            # Default list/dashboard order within a wedding
+            models.Index(
+                fields=["wedding", "-is_pinned", "-priority_order", "due_date"],
+                name="todo_wedding_list_order_idx",
+            ),
+            # Status filters and per-status counts, optionally by due date
+            models.Index(
+                fields=["wedding", "status", "due_date"],
+                name="todo_wedding_status_due_idx",
+            ),
+            # Open todos by due date (overdue, today, upcoming)
+            models.Index(
+                fields=["wedding", "due_date", "-priority_order"],
+                condition=~models.Q(status__in=["completed", "cancelled"]),
+                name="todo_open_due_idx",
+            ),
+        ]
 
     # Core relationships
     wedding = models.ForeignKey(
@@ -161,6 +195,13 @@ class Todo(TimeStampedBaseModel):
         validators=[MinValueValidator(0), MaxValueValidator(100)],
     )
 
+    # Checklist/subtask totals (maintained incrementally, see adjust_counts)
+    checklist_total = models.PositiveIntegerField(default=0, editable=False)
+    checklist_completed = models.PositiveIntegerField(default=0, editable=False)
+    subtask_total = models.PositiveIntegerField(default=0, editable=False)
+    subtask_completed = models.PositiveIntegerField(default=0, editable=False)
+    subtask_cancelled = models.PositiveIntegerField(default=0, editable=False)
+
     # Flags
     is_milestone = models.BooleanField(
         default=False,
@@ -181,17 +222,184 @@ class Todo(TimeStampedBaseModel):
     def __str__(self):
         return f"{self.title} ({self.get_status_display()})"
 
+    @classmethod
+    def priority_order_for(cls, priority):
+        """Numeric priority_order for a priority choice."""
+        return cls.PRIORITY_ORDER.get(priority, 50)
+
     def save(self, *args, **kwargs):
         """Update priority_order based on priority choice."""
-        priority_map = {
-            self.Priority.LOW: 25,
-            self.Priority.MEDIUM: 50,
-            self.Priority.HIGH: 75,
-            self.Priority.URGENT: 100,
-        }
-        self.priority_order = priority_map.get(self.priority, 50)
+        self.priority_order = self.priority_order_for(self.priority)
         super().save(*args, **kwargs)
 
+    def save_without_counters(self, *extra_fields):
+        """
+        save() every field except the checklist/subtask counters and
+        progress_percent, which adjust_counts maintains with F()
+        expressions; writing the in-memory values would undo concurrent
+        increments. Pass any of them in ``extra_fields`` to write it anyway.
+        """
+        skipped = set(self.COUNTER_FIELDS) | {"progress_percent"}
+        fields = [
+            field.name
+            for field in self._meta.concrete_fields
+            if not field.primary_key and field.name not in skipped
+        ]
+        self.save(update_fields=[*fields, *extra_fields])
+
+    @staticmethod
+    def compute_progress(completed, total):
+        """Percent complete rounded half up, None when there is nothing to count"""
+        if total <= 0:
+            return None
+        return (completed * 200 + total) // (total * 2)
+
+    def refresh_progress(self):
+        """
+        Set progress_percent from the in-memory checklist/subtask totals.
+        Cancelled subtasks don't count. Returns True if it changed.
+        """
+        progress = self.compute_progress(
+            self.checklist_completed + self.subtask_completed,
+            self.checklist_total + self.subtask_total - self.subtask_cancelled,
+        )
+        if progress is None or progress == self.progress_percent:
+            return False
+        self.progress_percent = progress
+        return True
+
+    @classmethod
+    def subtask_deltas(cls, status, sign=1):
+        """Counter changes for adding (sign=1) or removing (sign=-1) a subtask"""
+        return {
+            "subtask_total": sign,
+            "subtask_completed": sign if status == cls.Status.COMPLETED else 0,
+            "subtask_cancelled": sign if status == cls.Status.CANCELLED else 0,
+        }
+
+    @classmethod
+    def adjust_counts(cls, todo_id, auto_complete=False, **deltas):
+        """
+        Apply checklist/subtask changes to a todo's totals and progress
+        in one UPDATE, without recounting its items.
+
+        - Checklist item added: adjust_counts(id, checklist_total=1)
+        - Item checked: adjust_counts(id, checklist_completed=1)
+        - Subtask completed: adjust_counts(id, subtask_completed=1)
+
+        With auto_complete the todo is marked completed once every
+        counted item is done.
+        """
+        from django.db.models import Case, F, IntegerField, Q, Value, When
+        from django.db.models.lookups import Exact, GreaterThan
+
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        new = {field: F(field) + deltas.get(field, 0) for field in cls.COUNTER_FIELDS}
+        total = new["checklist_total"] + new["subtask_total"] - new["subtask_cancelled"]
+        completed = new["checklist_completed"] + new["subtask_completed"]
+
+        # SET expressions see the pre-update row, so progress is derived
+        # from the adjusted totals within the same statement.
+        has_items = GreaterThan(total, 0)
+        updates = {field: new[field] for field in deltas}
+        updates["progress_percent"] = Case(
+            When(has_items, then=(completed * 200 + total) / (total * 2)),
+            default=F("progress_percent"),
+            output_field=IntegerField(),
+        )
+        if not auto_complete:
+            cls.objects.filter(pk=todo_id).update(**updates)
+            return
+
+        all_done = Q(has_items) & Q(Exact(completed, total))
+        updates["status"] = Case(
+            When(all_done, then=Value(cls.Status.COMPLETED)),
+            default=F("status"),
+        )
+        updates["completed_at"] = Case(
+            When(all_done & ~Q(status=cls.Status.COMPLETED), then=Value(timezone.now())),
+            default=F("completed_at"),
+        )
+        with transaction.atomic():
+            # Lock the row so only one concurrent update sees the flip and
+            # reports it to the parent.
+            before = (
+                cls.objects.select_for_update()
+                .filter(pk=todo_id)
+                .values("status", "parent_id")
+                .first()
+            )
+            cls.objects.filter(pk=todo_id).update(**updates)
+            if (
+                before
+                and before["parent_id"]
+                and before["status"] != cls.Status.COMPLETED
+                and cls.objects.filter(pk=todo_id, status=cls.Status.COMPLETED).exists()
+            ):
+                cls.apply_subtask_changes(
+                    [(before["parent_id"], before["status"], cls.Status.COMPLETED)]
+                )
+
+    @classmethod
+    def recount_subtasks(cls, parent_ids):
+        """
+        Recount subtask totals and progress for many parents at once:
+        one grouped query over their subtasks and one bulk UPDATE.
+        Used by bulk paths that change subtasks under several parents.
+        """
+        from django.db.models import Count, Q
+
+        if not parent_ids:
+            return 0
+        parents = list(
+            cls.objects.filter(pk__in=parent_ids)
+            .only("id", "progress_percent", *cls.COUNTER_FIELDS)
+            .annotate(
+                subtasks_now=Count("subtasks"),
+                completed_now=Count(
+                    "subtasks", filter=Q(subtasks__status=cls.Status.COMPLETED)
+                ),
+                cancelled_now=Count(
+                    "subtasks", filter=Q(subtasks__status=cls.Status.CANCELLED)
+                ),
+            )
+        )
+        for parent in parents:
+            parent.subtask_total = parent.subtasks_now
+            parent.subtask_completed = parent.completed_now
+            parent.subtask_cancelled = parent.cancelled_now
+            parent.refresh_progress()
+        cls.objects.bulk_update(
+            parents,
+            ["subtask_total", "subtask_completed", "subtask_cancelled", "progress_percent"],
+        )
+        return len(parents)
+
+    @classmethod
+    def apply_subtask_changes(cls, changes):
+        """
+        Update parent totals for subtask changes, one UPDATE per parent.
+
+        ``changes`` holds ``(parent_id, old_status, new_status)`` tuples;
+        old_status is None for a new subtask, new_status None for a removed
+        one. Moving a subtask is a removal from one parent plus an addition
+        to the other.
+        """
+        from collections import Counter, defaultdict
+
+        per_parent = defaultdict(Counter)
+        for parent_id, old_status, new_status in changes:
+            if not parent_id or old_status == new_status:
+                continue
+            if old_status is not None:
+                per_parent[parent_id].update(cls.subtask_deltas(old_status, -1))
+            if new_status is not None:
+                per_parent[parent_id].update(cls.subtask_deltas(new_status))
+        for parent_id, deltas in per_parent.items():
+            cls.adjust_counts(parent_id, **deltas)
+
 
 class TodoChecklist(TimeStampedBaseModel):
     """
@@ -52,11 +52,17 @@ class TodoChecklistSerializer(serializers.ModelSerializer):
             validated_data["order"] = max_order + 1
         
         instance = super().create(validated_data)
-        self._update_parent_progress(instance.todo)
+        Todo.adjust_counts(
+            instance.todo_id,
+            auto_complete=True,
+            checklist_total=1,
+            checklist_completed=int(instance.is_completed),
+        )
         return instance
 
     def update(self, instance, validated_data):
         """Update checklist item and handle completion tracking."""
+        old_todo_id = instance.todo_id
         old_completed = instance.is_completed
         new_completed = validated_data.get("is_completed", old_completed)
         
@@ -67,41 +73,27 @@ class TodoChecklistSerializer(serializers.ModelSerializer):
             validated_data["completed_at"] = None
         
         instance = super().update(instance, validated_data)
-        self._update_parent_progress(instance.todo)
-        return instance
-
-    def _update_parent_progress(self, todo):
-        """
-        Update parent todo's progress based on checklist completion.
-        This is business logic that lives in the serializer, not the view.
-        """
-        checklist_items = todo.checklist_items.all()
-        total = checklist_items.count()
-        
-        if total == 0:
-            return
-        
-        completed = checklist_items.filter(is_completed=True).count()
-        
-        # Also count subtasks if any
-        subtasks = todo.subtasks.exclude(status=Todo.Status.CANCELLED)
-        subtask_total = subtasks.count()
-        subtask_completed = subtasks.filter(status=Todo.Status.COMPLETED).count()
-        
-        total_items = total + subtask_total
-        completed_items = completed + subtask_completed
         
-        new_progress = round((completed_items / total_items) * 100) if total_items > 0 else 0
-        
-        if new_progress != todo.progress_percent:
-            todo.progress_percent = new_progress
-            
-            # Auto-complete todo if all items are done
-            if new_progress == 100 and todo.status != Todo.Status.COMPLETED:
-                todo.status = Todo.Status.COMPLETED
-                todo.completed_at = timezone.now()
-            
-            todo.save(update_fields=["progress_percent", "status", "completed_at"])
+        # Keep parent totals in step (the item may also move to another todo)
+        if instance.todo_id != old_todo_id:
+            Todo.adjust_counts(
+                old_todo_id,
+                checklist_total=-1,
+                checklist_completed=-int(old_completed),
+            )
+            Todo.adjust_counts(
+                instance.todo_id,
+                auto_complete=True,
+                checklist_total=1,
+                checklist_completed=int(instance.is_completed),
+            )
+        else:
+            Todo.adjust_counts(
+                instance.todo_id,
+                auto_complete=True,
+                checklist_completed=int(instance.is_completed) - int(old_completed),
+            )
+        return instance
 
 
 class TodoChecklistBulkSerializer(serializers.Serializer):
@@ -114,17 +106,18 @@ class TodoChecklistBulkSerializer(serializers.Serializer):
     )
     
     def create_bulk(self, todo):
-        """Create multiple checklist items for a todo."""
+        """Create multiple checklist items for a todo in one insert."""
         items_data = self.validated_data.get("items", [])
-        created = []
         
-        for idx, item_data in enumerate(items_data):
-            checklist_item = TodoChecklist.objects.create(
+        created = TodoChecklist.objects.bulk_create([
+            TodoChecklist(
                 todo=todo,
                 title=item_data.get("title", ""),
                 order=item_data.get("order", idx),
             )
-            created.append(checklist_item)
+            for idx, item_data in enumerate(items_data)
+        ])
+        Todo.adjust_counts(todo.id, checklist_total=len(created))
         
         return created
 
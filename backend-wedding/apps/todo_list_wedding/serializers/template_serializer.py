@@ -2,11 +2,12 @@
 TodoTemplate serializer with template application logic.
 """
 from rest_framework import serializers
-from django.utils import timezone
-from django.db.models import Q
+from django.db import transaction
 from datetime import timedelta
 
 from apps.todo_list_wedding.models import TodoTemplate, Todo, TodoCategory, TodoChecklist
+from apps.todo_list_wedding.services.template_cache_service import TemplateCacheService
+from .todo_serializer import select_list_related
 
 
 class TodoTemplateSerializer(serializers.ModelSerializer):
@@ -104,21 +105,17 @@ class ApplyTemplateSerializer(serializers.Serializer):
             except Exception:
                 pass
         
-        # Build template queryset
-        templates = TodoTemplate.objects.filter(is_active=True)
-        
+        # Resolve templates
         if template_ids:
-            templates = templates.filter(id__in=template_ids)
+            templates = list(
+                TodoTemplate.objects.filter(is_active=True, id__in=template_ids)
+                .order_by("timeline_position", "order")
+            )
         else:
-            # Get wedding-specific and optionally global templates
-            if include_global:
-                templates = templates.filter(
-                    Q(wedding=wedding) | Q(wedding__isnull=True)
-                )
-            else:
-                templates = templates.filter(wedding=wedding)
-        
-        templates = templates.order_by("timeline_position", "order")
+            # Wedding-specific and optionally (cached) global templates
+            templates = TemplateCacheService.templates_for(
+                wedding, include_global=include_global
+            )
         
         # Get existing todo titles for skip check
         existing_titles = set()
@@ -128,12 +125,8 @@ class ApplyTemplateSerializer(serializers.Serializer):
                 .values_list("title", flat=True)
             )
         
-        # Category cache to avoid repeated lookups/creates
-        category_cache = {}
-        
-        created_todos = []
+        to_apply = []
         skipped_templates = []
-        
         for template in templates:
             # Skip if already exists
             if skip_existing and template.title in existing_titles:
@@ -143,43 +136,56 @@ class ApplyTemplateSerializer(serializers.Serializer):
                     "reason": "Already exists",
                 })
                 continue
-            
-            # Get or create category
-            category = self._get_or_create_category(
+            to_apply.append(template)
+        
+        if not to_apply:
+            return {
+                "created": 0,
+                "skipped": len(skipped_templates),
+                "todos": [],
+                "skipped_details": skipped_templates,
+            }
+        
+        with transaction.atomic():
+            categories = self._resolve_categories(
                 wedding,
-                template.category_name,
-                category_cache,
-            )
-            
-            # Calculate due date
-            due_date = self._calculate_due_date(
-                wedding_date,
-                template.timeline_position,
-                template.days_before_wedding,
+                {template.category_name for template in to_apply},
             )
             
-            # Create todo
-            todo = Todo.objects.create(
-                wedding=wedding,
-                category=category,
-                title=template.title,
-                description=template.description,
-                priority=template.priority,
-                due_date=due_date,
-                estimated_cost=template.estimated_cost,
-                is_milestone=template.is_milestone,
-                assigned_to=user,
-            )
-            
-            # Create checklist items from template
-            for idx, item in enumerate(template.checklist_items or []):
-                TodoChecklist.objects.create(
-                    todo=todo,
-                    title=item.get("title", ""),
-                    order=idx,
+            todos = Todo.objects.bulk_create([
+                Todo(
+                    wedding=wedding,
+                    category=categories[template.category_name],
+                    title=template.title,
+                    description=template.description,
+                    priority=template.priority,
+                    # bulk_create skips Todo.save(), so set this explicitly
+                    priority_order=Todo.priority_order_for(template.priority),
+                    due_date=self._calculate_due_date(
+                        wedding_date,
+                        template.timeline_position,
+                        template.days_before_wedding,
+                    ),
+                    estimated_cost=template.estimated_cost,
+                    is_milestone=template.is_milestone,
+                    assigned_to=user,
+                    checklist_total=len(template.checklist_items or []),
                 )
+                for template in to_apply
+            ])
             
-            created_todos.append(todo)
+            # Create checklist items from templates
+            TodoChecklist.objects.bulk_create([
+                TodoChecklist(todo=todo, title=item.get("title", ""), order=idx)
+                for todo, template in zip(todos, to_apply)
+                for idx, item in enumerate(template.checklist_items or [])
+            ])
+        
+        # Re-read with related rows for the response
+        created_todos = list(
+            select_list_related(Todo.objects.filter(id__in=[todo.id for todo in todos]))
+            .order_by("id")
+        )
         
         return {
             "created": len(created_todos),
@@ -188,19 +194,35 @@ class ApplyTemplateSerializer(serializers.Serializer):
             "skipped_details": skipped_templates,
         }
 
-    def _get_or_create_category(self, wedding, category_name, cache):
-        """Get or create a category, using cache to avoid duplicates."""
-        if category_name in cache:
-            return cache[category_name]
-        
-        category, _ = TodoCategory.objects.get_or_create(
-            wedding=wedding,
-            name=category_name,
-            defaults={"color": self._get_category_color(category_name)},
-        )
-        
-        cache[category_name] = category
-        return category
+    def _resolve_categories(self, wedding, names):
+        """
+        Return {name: category} for the given names, creating missing ones.
+        Existing categories are read in one query and missing ones inserted
+        in one bulk insert.
+        """
+        categories = {
+            category.name: category
+            for category in TodoCategory.objects.filter(wedding=wedding, name__in=names)
+        }
+        missing = names - categories.keys()
+        if missing:
+            TodoCategory.objects.bulk_create(
+                [
+                    TodoCategory(
+                        wedding=wedding,
+                        name=name,
+                        color=self._get_category_color(name),
+                    )
+                    for name in missing
+                ],
+                # Another request may have created the same category meanwhile
+                ignore_conflicts=True,
+            )
+            categories.update(
+                (category.name, category)
+                for category in TodoCategory.objects.filter(wedding=wedding, name__in=missing)
+            )
+        return categories
 
     def _get_category_color(self, category_name):
         """Assign default colors based on category name."""
@@ -4,12 +4,21 @@ All validation, status transitions, and progress calculations are handled here.
 """
 from rest_framework import serializers
 from django.utils import timezone
-from django.db import models
+from django.db import models, transaction
 
 from apps.todo_list_wedding.models import Todo, TodoCategory, TodoChecklist
+from apps.todo_list_wedding.services.todo_search_service import highlight_snippet
 from .category_serializer import TodoCategorySummarySerializer
 
 
+def select_list_related(queryset):
+    """
+    Join the relations TodoListSerializer reads (category, assignee).
+    Subtask and checklist counts are stored on Todo itself.
+    """
+    return queryset.select_related("category", "assigned_to")
+
+
 class TodoChecklistInlineSerializer(serializers.ModelSerializer):
     """Inline serializer for checklist items within Todo."""
     
@@ -33,6 +42,7 @@ class TodoListSerializer(serializers.ModelSerializer):
     days_until_due = serializers.SerializerMethodField()
     subtask_count = serializers.SerializerMethodField()
     checklist_progress = serializers.SerializerMethodField()
+    search_snippet = serializers.SerializerMethodField()
     
     class Meta:
         model = Todo
@@ -58,6 +68,7 @@ class TodoListSerializer(serializers.ModelSerializer):
             "days_until_due",
             "subtask_count",
             "checklist_progress",
+            "search_snippet",
             "estimated_cost",
             "created_at",
         ]
@@ -85,20 +96,20 @@ class TodoListSerializer(serializers.ModelSerializer):
         return delta.days
 
     def get_subtask_count(self, obj) -> dict:
-        """Count subtasks by status."""
-        subtasks = obj.subtasks.all()
-        total = subtasks.count()
-        completed = subtasks.filter(status=Todo.Status.COMPLETED).count()
-        return {"total": total, "completed": completed}
+        """Subtask totals from the counters stored on the todo."""
+        return {"total": obj.subtask_total, "completed": obj.subtask_completed}
 
     def get_checklist_progress(self, obj) -> dict:
-        """Calculate checklist completion progress."""
-        items = obj.checklist_items.all()
-        total = items.count()
-        completed = items.filter(is_completed=True).count()
+        """Checklist completion progress from the counters stored on the todo."""
+        total = obj.checklist_total
+        completed = obj.checklist_completed
         percent = round((completed / total) * 100) if total > 0 else 0
         return {"total": total, "completed": completed, "percent": percent}
 
+    def get_search_snippet(self, obj) -> str | None:
+        """Highlighted match text (escaped HTML) when the todo came from a search."""
+        return highlight_snippet(getattr(obj, "search_snippet", None))
+
 
 class TodoDetailSerializer(TodoListSerializer):
     """
@@ -258,15 +269,23 @@ class TodoCreateSerializer(serializers.ModelSerializer):
         """Create todo with nested checklist items."""
         checklist_items_data = validated_data.pop("checklist_items", [])
         
-        todo = Todo.objects.create(**validated_data)
+        todo = Todo.objects.create(
+            checklist_total=len(checklist_items_data),
+            **validated_data,
+        )
         
         # Create checklist items
-        for idx, item_data in enumerate(checklist_items_data):
-            TodoChecklist.objects.create(
+        TodoChecklist.objects.bulk_create([
+            TodoChecklist(
                 todo=todo,
                 title=item_data.get("title", ""),
                 order=item_data.get("order", idx),
             )
+            for idx, item_data in enumerate(checklist_items_data)
+        ])
+        
+        # Count the new subtask on its parent
+        Todo.apply_subtask_changes([(todo.parent_id, None, todo.status)])
         
         return todo
 
@@ -338,6 +357,7 @@ class TodoSerializer(TodoCreateSerializer):
         checklist_items_data = validated_data.pop("checklist_items", None)
         
         old_status = instance.status
+        old_parent_id = instance.parent_id
         new_status = validated_data.get("status", old_status)
         
         # Handle status transition side effects
@@ -356,45 +376,52 @@ class TodoSerializer(TodoCreateSerializer):
         # Update the instance
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
         
-        # Update checklist items if provided
+        # Replace checklist items if provided (simple approach)
+        new_items = None
         if checklist_items_data is not None:
-            # Delete existing and recreate (simple approach)
-            instance.checklist_items.all().delete()
+            now = timezone.now()
+            new_items = []
             for idx, item_data in enumerate(checklist_items_data):
-                TodoChecklist.objects.create(
+                is_completed = bool(item_data.get("is_completed", False))
+                new_items.append(TodoChecklist(
                     todo=instance,
                     title=item_data.get("title", ""),
-                    is_completed=item_data.get("is_completed", False),
+                    is_completed=is_completed,
+                    completed_at=now if is_completed else None,
                     order=item_data.get("order", idx),
-                )
+                ))
+            instance.checklist_total = len(new_items)
+            instance.checklist_completed = sum(item.is_completed for item in new_items)
         
-        # Recalculate progress based on checklist
-        self._update_progress(instance)
-        
-        return instance
-
-    def _update_progress(self, todo):
-        """Recalculate progress based on subtasks and checklist."""
-        total_items = 0
-        completed_items = 0
+        # Recalculate progress from the stored totals
+        instance.refresh_progress()
         
-        # Count subtasks
-        subtasks = todo.subtasks.exclude(status=Todo.Status.CANCELLED)
-        total_items += subtasks.count()
-        completed_items += subtasks.filter(status=Todo.Status.COMPLETED).count()
+        # Counters move with concurrent F() updates: only write the ones
+        # this request set outright.
+        written = []
+        if new_items is not None:
+            written += ["checklist_total", "checklist_completed", "progress_percent"]
+        elif "progress_percent" in validated_data:
+            written.append("progress_percent")
         
-        # Count checklist items
-        checklist = todo.checklist_items.all()
-        total_items += checklist.count()
-        completed_items += checklist.filter(is_completed=True).count()
+        with transaction.atomic():
+            instance.save_without_counters(*written)
+            if new_items is not None:
+                instance.checklist_items.all().delete()
+                TodoChecklist.objects.bulk_create(new_items)
+            
+            # Keep parent totals in step with status/parent changes
+            if instance.parent_id != old_parent_id:
+                changes = [
+                    (old_parent_id, old_status, None),
+                    (instance.parent_id, None, instance.status),
+                ]
+            else:
+                changes = [(old_parent_id, old_status, instance.status)]
+            Todo.apply_subtask_changes(changes)
         
-        if total_items > 0:
-            progress = round((completed_items / total_items) * 100)
-            if progress != todo.progress_percent:
-                todo.progress_percent = progress
-                todo.save(update_fields=["progress_percent"])
+        return instance
 
 
 class TodoBulkUpdateSerializer(serializers.Serializer):
@@ -440,8 +467,14 @@ class TodoBulkUpdateSerializer(serializers.Serializer):
         
         return attrs
 
-    def save(self, wedding):
-        """Execute bulk action."""
+    def save(self, wedding, user=None):
+        """
+        Execute bulk action as a single UPDATE/DELETE.
+        
+        Derived columns are written in the same statement, completion
+        notifications (for ``user``) are inserted in one batch, and parents
+        of affected subtasks are recounted with one grouped query.
+        """
         action = self.validated_data["action"]
         todo_ids = self.validated_data["todo_ids"]
         
@@ -450,29 +483,67 @@ class TodoBulkUpdateSerializer(serializers.Serializer):
             wedding=wedding,
         )
         
+        if action == "set_priority":
+            priority = self.validated_data["priority"]
+            # update() skips Todo.save(), so priority_order is set here too
+            updated = todos.update(
+                priority=priority,
+                priority_order=Todo.priority_order_for(priority),
+            )
+            return {"updated": updated}
+        if action == "set_category":
+            updated = todos.update(category_id=self.validated_data["category_id"])
+            return {"updated": updated}
+        if action == "assign":
+            updated = todos.update(assigned_to_id=self.validated_data.get("assigned_to_id"))
+            return {"updated": updated}
+        
+        # Status changes and deletes need the previous state of the rows
+        rows = list(todos.values("id", "title", "status", "parent_id"))
+        parent_ids = {row["parent_id"] for row in rows if row["parent_id"]}
+        
+        if action == "delete":
+            todos.delete()
+            Todo.recount_subtasks(parent_ids)
+            return {"deleted": len(rows)}
+        
         if action == "complete":
-            todos.update(
+            updated = todos.update(
                 status=Todo.Status.COMPLETED,
                 completed_at=timezone.now(),
                 progress_percent=100,
             )
+            if user is not None:
+                self._notify_completed(
+                    user,
+                    wedding,
+                    [row for row in rows if row["status"] != Todo.Status.COMPLETED],
+                )
         elif action == "cancel":
-            todos.update(status=Todo.Status.CANCELLED)
-        elif action == "restart":
-            todos.update(
+            updated = todos.update(status=Todo.Status.CANCELLED)
+        else:  # restart
+            updated = todos.update(
                 status=Todo.Status.NOT_STARTED,
                 completed_at=None,
                 progress_percent=0,
             )
-        elif action == "set_priority":
-            todos.update(priority=self.validated_data["priority"])
-        elif action == "set_category":
-            todos.update(category_id=self.validated_data["category_id"])
-        elif action == "assign":
-            todos.update(assigned_to_id=self.validated_data.get("assigned_to_id"))
-        elif action == "delete":
-            count = todos.count()
-            todos.delete()
-            return {"deleted": count}
         
-        return {"updated": todos.count()}
+        Todo.recount_subtasks(parent_ids)
+        return {"updated": updated}
+
+    def _notify_completed(self, user, wedding, rows):
+        """Create one completion notification per newly completed todo."""
+        from apps.wedding_planner.models import Notification
+        
+        Notification.objects.bulk_create([
+            Notification(
+                user=user,
+                wedding=wedding,
+                notification_type=Notification.NotificationType.TODO_COMPLETED,
+                title="Todo Completed",
+                message=f"'{row['title']}' has been completed.",
+                related_todo_id=row["id"],
+                priority=Notification.Priority.NORMAL,
+            )
+            for row in rows
+        ])
@@ -0,0 +1,7 @@
+from .template_cache_service import TemplateCacheService
+from .todo_search_service import TodoSearchService
+
+__all__ = [
+    "TemplateCacheService",
+    "TodoSearchService",
+]
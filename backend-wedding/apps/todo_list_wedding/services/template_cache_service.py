@@ -0,0 +1,125 @@
+"""
+Template Cache Service - In-process cache of global todo templates.
+
+Global templates (``wedding`` is null) are the same for every wedding and
+change only when an admin edits them or defaults are (re)loaded. They are
+loaded once per process, together with their serialized form, and reused
+by the template list, by-timeline and apply endpoints.
+
+A version number in the default cache is bumped on every template write
+(see signals.py and load_defaults), so processes sharing that cache
+reload on their next read. With the per-process default (locmem) only
+the writing worker sees the bump, so the memo also expires after
+MEMO_TTL_SECONDS; that bounds how long other workers, and writes that
+bypass signals, can serve stale templates.
+"""
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from apps.todo_list_wedding.models import TodoTemplate
+
+VERSION_KEY = "todo_templates:global_version"
+
+# Safety net for workers the version bump doesn't reach (per-process
+# caches) and for writes that bypass signals
+MEMO_TTL_SECONDS = 60
+
+
+def template_sort_key(template):
+    """Same ordering as ``order_by("timeline_position", "order")``."""
+    return (template.timeline_position, template.order)
+
+
+class TemplateCacheService:
+    """
+    Caches active global templates and their serialized data per process.
+    """
+
+    _memo = {"version": None, "expires_at": 0.0, "templates": None, "data": None}
+    _lock = threading.Lock()
+
+    @classmethod
+    def global_templates(cls) -> list:
+        """Active global templates, ordered by timeline position and order."""
+        return cls._load()["templates"]
+
+    @classmethod
+    def templates_for(cls, wedding=None, include_global=True) -> list:
+        """
+        Active templates for a wedding (instance or id): cached global
+        templates merged with the wedding's own, in template order.
+        """
+        templates = list(cls.global_templates()) if include_global else []
+        if wedding is not None:
+            templates.extend(TodoTemplate.objects.filter(is_active=True, wedding=wedding))
+            templates.sort(key=template_sort_key)
+        return templates
+
+    @classmethod
+    def serialize(cls, templates) -> list:
+        """Serialize templates, reusing cached data for global ones."""
+        from apps.todo_list_wedding.serializers import TodoTemplateSerializer
+
+        cached = cls._load()["data"]
+        result = []
+        for template in templates:
+            data = cached.get(template.id) if template.wedding_id is None else None
+            if data is None:
+                data = TodoTemplateSerializer(template).data
+            result.append(data)
+        return result
+
+    @classmethod
+    def invalidate(cls):
+        """Bump the version so every process reloads global templates."""
+        cls._current_version()
+        try:
+            cache.incr(VERSION_KEY)
+        except ValueError:
+            # Key evicted between the read and incr
+            cache.set(VERSION_KEY, int(time.time() * 1000), None)
+        with cls._lock:
+            cls._memo = {"version": None, "expires_at": 0.0, "templates": None, "data": None}
+
+    @classmethod
+    def _load(cls) -> dict:
+        from apps.todo_list_wedding.serializers import TodoTemplateSerializer
+
+        version = cls._current_version()
+        now = time.monotonic()
+        memo = cls._memo
+        if memo["version"] == version and memo["expires_at"] > now:
+            return memo
+
+        templates = list(
+            TodoTemplate.objects.using(DEFAULT_DB_ALIAS)
+            .filter(is_active=True, wedding__isnull=True)
+            .order_by("timeline_position", "order")
+        )
+        data = {
+            template.id: item
+            for template, item in zip(
+                templates, TodoTemplateSerializer(templates, many=True).data
+            )
+        }
+        memo = {
+            "version": version,
+            "expires_at": now + MEMO_TTL_SECONDS,
+            "templates": templates,
+            "data": data,
+        }
+        with cls._lock:
+            cls._memo = memo
+        return memo
+
+    @classmethod
+    def _current_version(cls) -> int:
+        version = cache.get(VERSION_KEY)
+        if version is None:
+            # Seed with a timestamp so a flushed cache never reuses an old version
+            cache.add(VERSION_KEY, int(time.time() * 1000), None)
+            version = cache.get(VERSION_KEY)
+        return version
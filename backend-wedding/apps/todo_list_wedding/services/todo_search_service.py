@@ -0,0 +1,164 @@
+"""
+Todo Search Service - Ranked full-text search over todo text fields.
+
+Searches title, description, notes and vendor_name through a database
+index instead of four OR'ed ``icontains`` scans:
+
+- PostgreSQL: a GIN expression index on a weighted tsvector (title
+  weighted above the other fields), queried with prefix tsqueries,
+  ranked with ts_rank and highlighted with ts_headline.
+- SQLite (dev): an FTS5 table over the todo table, ranked with bm25 and
+  highlighted with snippet(). The wedding id is indexed as a token so a
+  wedding-scoped search only walks that wedding's entries.
+
+Both indexes are maintained by the database itself (expression index /
+triggers, see migration 0004), so save(), update(), bulk_create and
+cascading deletes all stay in sync. Other backends fall back to the
+``icontains`` filter.
+
+Every term is matched as a prefix, so results update per keystroke.
+Matching todos are annotated with ``search_rank`` (higher is better)
+and ``search_snippet``: raw todo text with private-use sentinel
+characters around hits. ``highlight_snippet`` turns that into safe HTML
+(the text escaped, only ``<mark>`` tags added); never send the raw
+annotation to a client.
+"""
+import re
+
+from django.utils.html import escape
+
+from django.db import connection
+from django.db.models import BooleanField, CharField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "todo_list_wedding_todo_fts"
+MAX_TERMS = 8
+SNIPPET_WORDS = 12
+# Hit delimiters in the raw snippet; private-use characters, so escaping
+# leaves them alone and they never look like markup.
+MARK_START = "\ue000"
+MARK_END = "\ue001"
+
+# Must match the indexed expression in migration 0004 (column
+# qualification aside, which PostgreSQL ignores when matching)
+PG_VECTOR = (
+    "(setweight(to_tsvector('simple'::regconfig, COALESCE({t}title, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, "
+    "COALESCE({t}description, '') || ' ' || COALESCE({t}notes, '') || ' ' || "
+    "COALESCE({t}vendor_name, '')), 'B'))"
+)
+PG_DOCUMENT = (
+    "COALESCE({t}title, '') || ' ' || COALESCE({t}vendor_name, '') || ' ' || "
+    "COALESCE({t}description, '') || ' ' || COALESCE({t}notes, '')"
+)
+PG_HEADLINE_OPTIONS = (
+    f'StartSel="{MARK_START}", StopSel="{MARK_END}", MaxWords={SNIPPET_WORDS}, MinWords=4, '
+    "MaxFragments=1, FragmentDelimiter=…"
+)
+
+# bm25 weights for the FTS5 columns: title, description, notes, vendor_name, wedding_id
+SQLITE_WEIGHTS = "10.0, 2.0, 1.0, 4.0, 0.0"
+
+
+def search_terms(query):
+    """Lower-cased word terms of a search string (at most MAX_TERMS)."""
+    return re.findall(r"\w+", (query or "").lower())[:MAX_TERMS]
+
+
+def highlight_snippet(snippet):
+    """HTML-escaped ``search_snippet`` with ``<mark>`` around the hits."""
+    if snippet is None:
+        return None
+    return escape(snippet).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+
+
+class TodoSearchService:
+    """
+    Full-text todo search with ranking and highlight snippets.
+    """
+
+    @classmethod
+    def search(cls, queryset, query, wedding_id=None):
+        """
+        Restrict ``queryset`` to todos matching every term of ``query``
+        and annotate ``search_rank``/``search_snippet``.
+
+        ``wedding_id`` narrows the index lookup when the queryset is
+        already scoped to one wedding.
+        """
+        terms = search_terms(query)
+        if not terms:
+            return cls._unranked(queryset.none())
+
+        vendor = connection.vendor
+        if vendor == "postgresql":
+            return cls._search_postgres(queryset, terms)
+        if vendor == "sqlite":
+            return cls._search_sqlite(queryset, terms, wedding_id)
+        return cls._search_fallback(queryset, query)
+
+    @classmethod
+    def _search_postgres(cls, queryset, terms):
+        table = f'"{queryset.model._meta.db_table}".'
+        vector = PG_VECTOR.format(t=table)
+        document = PG_DOCUMENT.format(t=table)
+        tsquery = " & ".join(f"{term}:*" for term in terms)
+        return queryset.filter(
+            RawSQL(
+                f"{vector} @@ to_tsquery('simple'::regconfig, %s)",
+                [tsquery],
+                output_field=BooleanField(),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f"ts_rank({vector}, to_tsquery('simple'::regconfig, %s))",
+                [tsquery],
+                output_field=FloatField(),
+            ),
+            search_snippet=RawSQL(
+                f"ts_headline('simple'::regconfig, {document}, "
+                f"to_tsquery('simple'::regconfig, %s), %s)",
+                [tsquery, PG_HEADLINE_OPTIONS],
+                output_field=CharField(),
+            ),
+        )
+
+    @classmethod
+    def _search_sqlite(cls, queryset, terms, wedding_id=None):
+        text = " AND ".join(f'"{term}"*' for term in terms)
+        match = f"{{title description notes vendor_name}} : ({text})"
+        if wedding_id:
+            match = f'wedding_id : "{int(wedding_id)}" AND {match}'
+
+        # Joined rather than correlated: bm25()/snippet() only work inside
+        # the MATCH query itself, and a join evaluates the MATCH once.
+        table = queryset.model._meta.db_table
+        return queryset.extra(
+            tables=[FTS_TABLE],
+            where=[f'{FTS_TABLE}.rowid = "{table}"."id"', f"{FTS_TABLE} MATCH %s"],
+            params=[match],
+            select={
+                # bm25() is lower-is-better; negate so higher ranks first everywhere
+                "search_rank": f"-bm25({FTS_TABLE}, {SQLITE_WEIGHTS})",
+                "search_snippet": (
+                    f"snippet({FTS_TABLE}, -1, '{MARK_START}', '{MARK_END}', '…', {SNIPPET_WORDS})"
+                ),
+            },
+        )
+
+    @classmethod
+    def _search_fallback(cls, queryset, query):
+        """Unindexed substring match, unranked and without snippets."""
+        return cls._unranked(queryset.filter(
+            Q(title__icontains=query) |
+            Q(description__icontains=query) |
+            Q(notes__icontains=query) |
+            Q(vendor_name__icontains=query)
+        ))
+
+    @staticmethod
+    def _unranked(queryset):
+        return queryset.annotate(
+            search_rank=Value(0.0, output_field=FloatField()),
+            search_snippet=Value(None, output_field=CharField()),
+        )
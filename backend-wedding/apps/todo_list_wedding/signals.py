@@ -0,0 +1,19 @@
+"""
+Todo List signals - Keep cached global templates in sync with writes.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.todo_list_wedding.models import TodoTemplate
+from apps.todo_list_wedding.services.template_cache_service import TemplateCacheService
+
+
+@receiver(post_save, sender=TodoTemplate)
+@receiver(post_delete, sender=TodoTemplate)
+def invalidate_global_templates(sender, instance, **kwargs):
+    """
+    Drop cached global templates whenever a template is written.
+    A wedding template can be turned into a global one (and back),
+    so every template write invalidates.
+    """
+    TemplateCacheService.invalidate()
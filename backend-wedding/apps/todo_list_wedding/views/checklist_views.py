@@ -6,7 +6,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from apps.todo_list_wedding.models import TodoChecklist
+from apps.todo_list_wedding.models import Todo, TodoChecklist
 from apps.todo_list_wedding.serializers import TodoChecklistSerializer
 from apps.todo_list_wedding.serializers.checklist_serializer import (
     TodoChecklistBulkSerializer,
@@ -40,6 +40,16 @@ class TodoChecklistViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(todo_id=todo_id)
         return queryset.order_by("order", "created_at")
 
+    def perform_destroy(self, instance):
+        """Delete the item and take it out of the parent todo's totals."""
+        instance.delete()
+        Todo.adjust_counts(
+            instance.todo_id,
+            auto_complete=True,
+            checklist_total=-1,
+            checklist_completed=-int(instance.is_completed),
+        )
+
     @action(detail=True, methods=["post"], url_path="toggle")
     def toggle(self, request, pk=None):
         """Toggle the completion status of a checklist item."""
@@ -49,10 +59,12 @@ class TodoChecklistViewSet(viewsets.ModelViewSet):
         # The model's save method handles completed_at timestamp
         item.save()
         
-        # Update parent todo's progress (handled in serializer logic)
-        from apps.todo_list_wedding.serializers import TodoChecklistSerializer
-        serializer = TodoChecklistSerializer()
-        serializer._update_parent_progress(item.todo)
+        # Update parent todo's totals and progress
+        Todo.adjust_counts(
+            item.todo_id,
+            auto_complete=True,
+            checklist_completed=1 if item.is_completed else -1,
+        )
         
         return Response(TodoChecklistSerializer(item).data)
 
@@ -77,7 +89,6 @@ class TodoChecklistViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        from apps.todo_list_wedding.models import Todo
         try:
             todo = Todo.objects.get(id=todo_id)
         except Todo.DoesNotExist:
@@ -114,7 +125,6 @@ class TodoChecklistViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        from apps.todo_list_wedding.models import Todo
         try:
             todo = Todo.objects.get(id=todo_id)
         except Todo.DoesNotExist:
@@ -157,15 +167,8 @@ class TodoChecklistViewSet(viewsets.ModelViewSet):
             completed_at=timezone.now(),
         )
         
-        # Update parent todo's progress
-        from apps.todo_list_wedding.models import Todo
-        try:
-            todo = Todo.objects.get(id=todo_id)
-            from apps.todo_list_wedding.serializers import TodoChecklistSerializer
-            serializer = TodoChecklistSerializer()
-            serializer._update_parent_progress(todo)
-        except Todo.DoesNotExist:
-            pass
+        # Update parent todo's totals and progress
+        Todo.adjust_counts(todo_id, auto_complete=True, checklist_completed=count)
         
         return Response({"completed": count})
 
@@ -189,4 +192,11 @@ class TodoChecklistViewSet(viewsets.ModelViewSet):
             is_completed=True,
         ).delete()
         
+        Todo.adjust_counts(
+            todo_id,
+            auto_complete=True,
+            checklist_total=-deleted_count,
+            checklist_completed=-deleted_count,
+        )
+        
         return Response({"deleted": deleted_count})
@@ -13,6 +13,7 @@ from apps.todo_list_wedding.serializers import (
     TodoListSerializer,
 )
 from apps.todo_list_wedding.serializers.template_serializer import DEFAULT_WEDDING_TEMPLATES
+from apps.todo_list_wedding.services.template_cache_service import TemplateCacheService
 
 
 class TodoTemplateViewSet(viewsets.ModelViewSet):
@@ -50,6 +51,17 @@ class TodoTemplateViewSet(viewsets.ModelViewSet):
         
         return queryset.order_by("timeline_position", "order")
 
+    def list(self, request, *args, **kwargs):
+        """List templates, serving global ones from the in-process cache."""
+        if {"search", "ordering"} & request.query_params.keys():
+            return super().list(request, *args, **kwargs)
+        
+        templates = TemplateCacheService.templates_for(request.query_params.get("wedding") or None)
+        page = self.paginate_queryset(templates)
+        if page is not None:
+            return self.get_paginated_response(TemplateCacheService.serialize(page))
+        return Response(TemplateCacheService.serialize(templates))
+
     @action(detail=False, methods=["post"], url_path="apply")
     def apply(self, request):
         """
@@ -126,9 +138,8 @@ class TodoTemplateViewSet(viewsets.ModelViewSet):
                 TodoTemplate.objects.filter(wedding__isnull=True).delete()
         
         # Create templates
-        created = []
-        for idx, template_data in enumerate(DEFAULT_WEDDING_TEMPLATES):
-            template = TodoTemplate.objects.create(
+        created = TodoTemplate.objects.bulk_create([
+            TodoTemplate(
                 wedding=wedding,
                 category_name=template_data.get("category_name", "Planning"),
                 title=template_data.get("title"),
@@ -141,7 +152,10 @@ class TodoTemplateViewSet(viewsets.ModelViewSet):
                 order=idx,
                 checklist_items=template_data.get("checklist_items", []),
             )
-            created.append(template)
+            for idx, template_data in enumerate(DEFAULT_WEDDING_TEMPLATES)
+        ])
+        # bulk_create sends no post_save signals
+        TemplateCacheService.invalidate()
         
         return Response({
             "created": len(created),
@@ -154,16 +168,14 @@ class TodoTemplateViewSet(viewsets.ModelViewSet):
         Get templates grouped by timeline position.
         Useful for displaying a planning timeline overview.
         """
-        queryset = self.get_queryset()
+        templates = TemplateCacheService.templates_for(request.query_params.get("wedding") or None)
         
         # Group by timeline position
         from collections import defaultdict
         grouped = defaultdict(list)
         
-        for template in queryset:
-            grouped[template.timeline_position].append(
-                TodoTemplateSerializer(template).data
-            )
+        for template, data in zip(templates, TemplateCacheService.serialize(templates)):
+            grouped[template.timeline_position].append(data)
         
         # Convert to list ordered by timeline
         timeline_order = [
@@ -10,6 +10,7 @@ from django.db.models import Count, Q
 from django.utils import timezone
 
 from apps.todo_list_wedding.models import Todo
+from apps.todo_list_wedding.services import TodoSearchService
 from apps.todo_list_wedding.serializers import (
     TodoSerializer,
     TodoCreateSerializer,
@@ -17,6 +18,7 @@ from apps.todo_list_wedding.serializers import (
     TodoDetailSerializer,
     TodoBulkUpdateSerializer,
 )
+from apps.todo_list_wedding.serializers.todo_serializer import select_list_related
 from apps.wedding_planner.models import Notification
 
 
@@ -56,7 +58,7 @@ class TodoViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Filter and sort todos based on query parameters."""
-        queryset = super().get_queryset()
+        queryset = select_list_related(super().get_queryset())
         
         # Required: filter by wedding
         wedding_id = self.request.query_params.get("wedding")
@@ -131,21 +133,18 @@ class TodoViewSet(viewsets.ModelViewSet):
         if due_before:
             queryset = queryset.filter(due_date__lte=due_before)
         
-        # Search
+        # Search (ranked full-text, see TodoSearchService)
         search = params.get("search")
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search) |
-                Q(notes__icontains=search) |
-                Q(vendor_name__icontains=search)
-            )
+            queryset = TodoSearchService.search(queryset, search, wedding_id=wedding_id)
         
-        # Sorting
-        sort_by = params.get("sort_by", "default")
+        # Sorting (searches default to relevance)
+        sort_by = params.get("sort_by", "relevance" if search else "default")
         sort_order = params.get("sort_order", "asc")
         
-        if sort_by == "due_date":
+        if sort_by == "relevance" and search:
+            queryset = queryset.order_by("-search_rank", "-is_pinned", "-priority_order")
+        elif sort_by == "due_date":
             order = "due_date" if sort_order == "asc" else "-due_date"
             queryset = queryset.order_by(order, "-priority_order")
         elif sort_by == "priority":
@@ -176,6 +175,11 @@ class TodoViewSet(viewsets.ModelViewSet):
         response_serializer = TodoListSerializer(todo)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
+    def perform_destroy(self, instance):
+        """Delete the todo and take it out of its parent's subtask totals."""
+        instance.delete()
+        Todo.apply_subtask_changes([(instance.parent_id, instance.status, None)])
+
     @action(detail=False, methods=["get"], url_path="stats")
     def stats(self, request):
         """
@@ -260,7 +264,8 @@ class TodoViewSet(viewsets.ModelViewSet):
             - priority: Filter by priority (all, urgent, high, medium, low)
             - category: Filter by category ID (all or category ID)
             - search: Search query
-            - sort_by: Sort field (due_date, priority, title, created, status, category)
+            - sort_by: Sort field (due_date, priority, title, created, status, category,
+              relevance - the default when searching)
             - sort_order: Sort order (asc, desc)
             - group_by: Group field (none, status, category, priority, due_date)
         
@@ -315,21 +320,18 @@ class TodoViewSet(viewsets.ModelViewSet):
         if category_filter and category_filter != "all":
             filtered_qs = filtered_qs.filter(category_id=category_filter)
         
-        # Search
+        # Search (ranked full-text, see TodoSearchService)
         search = params.get("search", "").strip()
         if search:
-            filtered_qs = filtered_qs.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search) |
-                Q(notes__icontains=search) |
-                Q(vendor_name__icontains=search)
-            )
+            filtered_qs = TodoSearchService.search(filtered_qs, search, wedding_id=wedding_id)
         
-        # Sorting
-        sort_by = params.get("sort_by", "default")
+        # Sorting (searches default to relevance)
+        sort_by = params.get("sort_by", "relevance" if search else "default")
         sort_order = params.get("sort_order", "asc")
         
-        if sort_by == "due_date":
+        if sort_by == "relevance" and search:
+            filtered_qs = filtered_qs.order_by("-search_rank", "-is_pinned", "-priority_order")
+        elif sort_by == "due_date":
             order = "due_date" if sort_order == "asc" else "-due_date"
             filtered_qs = filtered_qs.order_by("-is_pinned", order, "-priority_order")
         elif sort_by == "priority":
@@ -363,7 +365,7 @@ class TodoViewSet(viewsets.ModelViewSet):
             filtered_qs = filtered_qs.order_by("-is_pinned", "-priority_order", "due_date")
         
         # Serialize todos
-        todos_data = TodoListSerializer(filtered_qs, many=True).data
+        todos_data = TodoListSerializer(select_list_related(filtered_qs), many=True).data
         
         # Grouping
         group_by = params.get("group_by", "none")
@@ -548,6 +550,7 @@ class TodoViewSet(viewsets.ModelViewSet):
             {"value": "created", "label": "Created Date"},
             {"value": "status", "label": "Status"},
             {"value": "category", "label": "Category"},
+            {"value": "relevance", "label": "Relevance (search)"},
         ]
         
         # Group options
@@ -773,17 +776,19 @@ class TodoViewSet(viewsets.ModelViewSet):
         from apps.wedding_planner.models import Wedding
         wedding = Wedding.objects.get(id=wedding_id)
         
-        result = serializer.save(wedding=wedding)
+        result = serializer.save(wedding=wedding, user=request.user)
         return Response(result)
 
     @action(detail=True, methods=["post"], url_path="complete")
     def complete(self, request, pk=None):
         """Mark a todo as completed."""
         todo = self.get_object()
+        old_status = todo.status
         todo.status = Todo.Status.COMPLETED
         todo.completed_at = timezone.now()
         todo.progress_percent = 100
-        todo.save()
+        todo.save_without_counters("progress_percent")
+        Todo.apply_subtask_changes([(todo.parent_id, old_status, todo.status)])
         
         # Create completion notification
         Notification.objects.create(
@@ -810,10 +815,12 @@ class TodoViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
+        old_status = todo.status
         todo.status = Todo.Status.IN_PROGRESS
         todo.completed_at = None
         # Keep progress as-is for partially completed
-        todo.save()
+        todo.save_without_counters()
+        Todo.apply_subtask_changes([(todo.parent_id, old_status, todo.status)])
         
         serializer = TodoDetailSerializer(todo)
         return Response(serializer.data)
@@ -0,0 +1,219 @@
+"""
+Benchmark key API endpoints and compare against a saved baseline.
+
+Seeds a synthetic wedding with SampleDataService inside a transaction
+that is rolled back afterwards (or uses an existing one with --wedding),
+then requests each endpoint through the Django test client as the
+wedding owner (the restaurant portal anonymously, by access code). For
+every endpoint it reports status, query count, response size and
+p50/p95/max latency over --runs requests after one warm-up request.
+
+--output writes the results as a JSON baseline; --compare reads one and
+flags endpoints whose query count grew or whose p50 latency rose by more
+than --threshold, exiting with an error if any did.
+
+Usage:
+    python manage.py benchmark_endpoints --guests 300 --output baseline.json
+    python manage.py benchmark_endpoints --guests 300 --compare baseline.json
+"""
+import json
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.commons.profiling import percentile
+from apps.wedding_planner.models import Wedding
+from apps.wedding_planner.services import SampleDataService
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Time key endpoints on a seeded wedding and compare with a JSON baseline"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--wedding", type=int, help="Benchmark an existing wedding")
+        parser.add_argument("--guests", type=int, default=300)
+        parser.add_argument("--todos", type=int, default=200)
+        parser.add_argument("--registry-items", type=int, default=100)
+        parser.add_argument("--notifications", type=int, default=100)
+        parser.add_argument("--runs", type=int, default=10)
+        parser.add_argument("--only", help="Comma-separated endpoint names to run")
+        parser.add_argument("--output", help="Write results to this JSON file")
+        parser.add_argument("--compare", help="Compare with this JSON baseline")
+        parser.add_argument("--threshold", type=float, default=0.25,
+                            help="Allowed relative p50 increase before flagging")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        if options["wedding"]:
+            wedding = Wedding.objects.select_related("owner").get(pk=options["wedding"])
+            results = self._run(wedding, options)
+        else:
+            try:
+                with transaction.atomic():
+                    results = self._run(self._seed(options), options)
+                    raise _Rollback()
+            except _Rollback:
+                self.stdout.write("Seeded wedding rolled back.")
+
+        if options["output"]:
+            with open(options["output"], "w") as fh:
+                json.dump(results, fh, indent=2)
+            self.stdout.write(f"Wrote {options['output']}")
+        if options["compare"]:
+            self._compare(results, options["compare"], options["threshold"])
+
+    def _seed(self, options):
+        started = time.perf_counter()
+        owner = SampleDataService.create_owner()
+        vendors = SampleDataService.seed_vendors(50, prefix=f"bench-{owner.pk}")
+        wedding = SampleDataService.seed_wedding(
+            owner,
+            guests=options["guests"],
+            todos=options["todos"],
+            registry_items=options["registry_items"],
+            notifications=options["notifications"],
+            vendors=vendors[:10],
+            label="bench",
+        )
+        self.stdout.write(
+            f"Seeded wedding with {options['guests']} guests, {options['todos']} todos "
+            f"in {time.perf_counter() - started:.1f}s ({connection.vendor})"
+        )
+        return wedding
+
+    def _endpoints(self, wedding):
+        """name -> (url, authenticated)"""
+        token = wedding.restaurant_access_tokens.filter(is_active=True).first()
+        scoped = f"?wedding={wedding.id}"
+        endpoints = {
+            "todos/dashboard": (reverse("todo-dashboard") + scoped, True),
+            "todos": (reverse("todo-list") + scoped, True),
+            "tables/dashboard": (reverse("tables-dashboard") + scoped, True),
+            "guests": (reverse("guests-list") + scoped, True),
+            "registry-items/dashboard": (reverse("registry-items-dashboard") + scoped, True),
+            "weddings/dashboard-data": (reverse("weddings-dashboard-data") + scoped, True),
+            "notifications": (reverse("notifications-list") + scoped, True),
+            "weddings/generate-report": (reverse("weddings-generate-report"), True),
+        }
+        if token:
+            code = {"access_code": token.access_code}
+            endpoints.update({
+                "portal/summary": (reverse("restaurant-portal-summary", kwargs=code), False),
+                "portal/tables": (reverse("restaurant-portal-tables", kwargs=code), False),
+                "portal/meals": (reverse("restaurant-portal-meals", kwargs=code), False),
+                "portal/kitchen-report": (
+                    reverse("restaurant-portal-kitchen-report", kwargs=code), False
+                ),
+            })
+        return endpoints
+
+    def _run(self, wedding, options):
+        owner_client = Client()
+        owner_client.force_login(wedding.owner)
+        public_client = Client()
+
+        endpoints = self._endpoints(wedding)
+        if options["only"]:
+            wanted = set(options["only"].split(","))
+            endpoints = {name: spec for name, spec in endpoints.items() if name in wanted}
+
+        self.stdout.write(
+            f"\n  {'endpoint':<26} {'status':>6} {'queries':>7} {'KB':>7} "
+            f"{'p50':>9} {'p95':>9} {'max':>9}"
+        )
+        results = {}
+        for name, (url, authenticated) in endpoints.items():
+            client = owner_client if authenticated else public_client
+            self._request(client, url)  # warm-up
+            timings = []
+            for _ in range(options["runs"]):
+                with CaptureQueriesContext(connection) as queries:
+                    t0 = time.perf_counter()
+                    status, size = self._request(client, url)
+                    timings.append((time.perf_counter() - t0) * 1000)
+            results[name] = {
+                "url": url,
+                "status": status,
+                "queries": len(queries.captured_queries),
+                "bytes": size,
+                "p50_ms": round(statistics.median(timings), 2),
+                "p95_ms": round(percentile(timings, 95), 2),
+                "max_ms": round(max(timings), 2),
+            }
+            row = results[name]
+            self.stdout.write(
+                f"  {name:<26} {status:>6} {row['queries']:>7} {size / 1024:>7.1f} "
+                f"{row['p50_ms']:>7.1f}ms {row['p95_ms']:>7.1f}ms {row['max_ms']:>7.1f}ms"
+            )
+
+        return {
+            "created_at": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "sizes": {
+                "guests": wedding.guests.count(),
+                "todos": wedding.todos.count(),
+                "registry_items": options["registry_items"],
+                "notifications": options["notifications"],
+            },
+            "runs": options["runs"],
+            "endpoints": results,
+        }
+
+    def _request(self, client, url):
+        """
+        GET ``url``, reading streamed bodies; returns (status, size).
+        The test client closes the response itself (without firing
+        close_old_connections, which would drop the rollback transaction).
+        """
+        response = client.get(url)
+        if response.streaming:
+            size = sum(len(chunk) for chunk in response.streaming_content)
+        else:
+            size = len(response.content)
+        return response.status_code, size
+
+    def _compare(self, results, path, threshold):
+        with open(path) as fh:
+            baseline = json.load(fh)
+
+        self.stdout.write(f"\nCompared with {path} ({baseline.get('created_at', '?')}):")
+        if baseline.get("sizes") != results["sizes"]:
+            self.stdout.write(self.style.WARNING(
+                f"  Data sizes differ: {baseline.get('sizes')} vs {results['sizes']}"
+            ))
+        regressions = []
+        for name, row in results["endpoints"].items():
+            old = baseline.get("endpoints", {}).get(name)
+            if old is None:
+                self.stdout.write(f"  {name:<26} new endpoint")
+                continue
+            flags = []
+            if row["queries"] > old["queries"]:
+                flags.append(f"queries {old['queries']} -> {row['queries']}")
+            if old["p50_ms"] and row["p50_ms"] > old["p50_ms"] * (1 + threshold):
+                flags.append(f"p50 {old['p50_ms']}ms -> {row['p50_ms']}ms")
+            change = (row["p50_ms"] / old["p50_ms"] - 1) * 100 if old["p50_ms"] else 0.0
+            line = (
+                f"  {name:<26} queries {old['queries']:>4} -> {row['queries']:<4} "
+                f"p50 {change:+6.1f}%"
+            )
+            if flags:
+                regressions.append(name)
+                line = self.style.ERROR(f"{line}  REGRESSION: {', '.join(flags)}")
+            self.stdout.write(line)
+
+        if regressions:
+            raise CommandError(f"{len(regressions)} endpoint(s) regressed: {', '.join(regressions)}")
+        self.stdout.write(self.style.SUCCESS("No regressions."))
@@ -0,0 +1,172 @@
+"""
+Benchmark wedding PDF report generation.
+
+Seeds a synthetic wedding (confirmed guests with meal selections, plus-ones,
+children and a full seating plan) inside a transaction that is rolled back
+afterwards unless --keep is given, then generates the full report several
+times, reporting query count, snapshot loading time, total time, peak
+Python memory and size.
+
+Usage:
+    python manage.py benchmark_pdf_report --guests 300 --runs 5
+"""
+import os
+import random
+import statistics
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from apps.commons.models import User
+from apps.wedding_planner.models import (
+    Child,
+    Guest,
+    GuestMealSelection,
+    MealChoice,
+    SeatingAssignment,
+    Table,
+    Wedding,
+)
+from apps.wedding_planner.services.pdf_report_service import WeddingPDFReport
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark PDF report generation on a synthetic wedding"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--guests", type=int, default=300)
+        parser.add_argument("--table-size", type=int, default=10)
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--keep", action="store_true", help="Keep the seeded wedding")
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        try:
+            with transaction.atomic():
+                self._run(options)
+                if not options["keep"]:
+                    raise _Rollback()
+        except _Rollback:
+            self.stdout.write("Seeded wedding rolled back.")
+
+    def _run(self, options):
+        started = time.perf_counter()
+        wedding = self._seed_wedding(options["guests"], options["table_size"])
+        self.stdout.write(
+            f"Seeded {options['guests']} guests in {time.perf_counter() - started:.1f}s"
+        )
+
+        totals = []
+        snapshots = []
+        for _ in range(options["runs"]):
+            report = WeddingPDFReport(wedding)
+            with CaptureQueriesContext(connection) as queries:
+                t0 = time.perf_counter()
+                report.load_snapshot()
+                t1 = time.perf_counter()
+                pdf_file = report.generate_full_report()
+                t2 = time.perf_counter()
+            snapshots.append((t1 - t0) * 1000)
+            totals.append((t2 - t0) * 1000)
+            size_kb = pdf_file.seek(0, os.SEEK_END) / 1024
+            pdf_file.close()
+
+        # Measured in a separate run: tracing allocations slows rendering down
+        tracemalloc.start()
+        WeddingPDFReport(wedding).generate_full_report().close()
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+
+        self.stdout.write(f"queries per report: {len(queries.captured_queries)}")
+        self._report("snapshot", snapshots)
+        self._report("total", totals)
+        self.stdout.write(f"peak python memory: {peak_mb:.1f} MB")
+        self.stdout.write(f"report size: {size_kb:.0f} KB")
+
+    def _seed_wedding(self, guest_count, table_size):
+        suffix = random.randint(0, 10**9)
+        owner = User.objects.create_user(
+            email=f"pdf-benchmark-{suffix}@example.com",
+            password=None,
+        )
+        wedding = Wedding.objects.create(
+            owner=owner,
+            partner1_name="Alex",
+            partner2_name="Sam",
+            slug=f"pdf-benchmark-{suffix}",
+        )
+
+        meals = [
+            MealChoice.objects.create(wedding=wedding, name=name, meal_type=meal_type)
+            for name, meal_type in [
+                ("Beef Tenderloin", MealChoice.MealType.MEAT),
+                ("Sea Bass", MealChoice.MealType.FISH),
+                ("Mushroom Risotto", MealChoice.MealType.VEGETARIAN),
+                ("Kids Pasta", MealChoice.MealType.KIDS),
+            ]
+        ]
+
+        guests = Guest.objects.bulk_create([
+            Guest(
+                wedding=wedding,
+                first_name=f"Guest{i}",
+                last_name=f"Family{i % 97}",
+                email=f"guest{i}@example.com",
+                attendance_status="yes",
+                is_plus_one_coming=i % 5 == 0,
+                plus_one_name=f"Partner{i}" if i % 5 == 0 else None,
+                dietary_restrictions="No nuts" if i % 11 == 0 else None,
+            )
+            for i in range(guest_count)
+        ])
+        GuestMealSelection.objects.bulk_create([
+            GuestMealSelection(guest=guest, meal_choice=random.choice(meals[:3]))
+            for guest in guests
+            if random.random() < 0.9
+        ])
+        children = Child.objects.bulk_create([
+            Child(guest=guest, first_name=f"Child{i}", age=random.randint(2, 12))
+            for i, guest in enumerate(guests[::15])
+        ])
+
+        attendees = [(guest, SeatingAssignment.AttendeeType.GUEST, None) for guest in guests]
+        attendees += [
+            (guest, SeatingAssignment.AttendeeType.PLUS_ONE, None)
+            for guest in guests
+            if guest.is_plus_one_coming
+        ]
+        attendees += [
+            (child.guest, SeatingAssignment.AttendeeType.CHILD, child) for child in children
+        ]
+
+        table_count = -(-len(attendees) // table_size)
+        tables = Table.objects.bulk_create([
+            Table(wedding=wedding, table_number=n, capacity=table_size)
+            for n in range(1, table_count + 1)
+        ])
+        SeatingAssignment.objects.bulk_create([
+            SeatingAssignment(
+                guest=guest,
+                table=tables[i // table_size],
+                attendee_type=attendee_type,
+                child=child,
+                seat_number=i % table_size + 1,
+            )
+            for i, (guest, attendee_type, child) in enumerate(attendees)
+        ])
+        return wedding
+
+    def _report(self, label, timings):
+        timings = sorted(timings)
+        self.stdout.write(
+            f"{label:<9} p50={statistics.median(timings):.1f}ms "
+            f"min={timings[0]:.1f}ms max={timings[-1]:.1f}ms"
+        )
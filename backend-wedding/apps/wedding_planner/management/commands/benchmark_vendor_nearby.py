@@ -0,0 +1,141 @@
+"""
+Benchmark the geohash-backed nearby vendor search.
+
+Seeds synthetic vendors inside a transaction (rolled back afterwards
+unless --keep is given), runs random radius searches through
+GeoService.nearby and reports latency percentiles, comparing against an
+unindexed full-scan haversine query and checking results for correctness.
+
+Usage:
+    python manage.py benchmark_vendor_nearby --vendors 100000 --queries 200
+"""
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.wedding_planner.models import Vendor, VendorCategory
+from apps.wedding_planner.services.geo_service import (
+    GeoService,
+    encode_geohash,
+    haversine_expression,
+    haversine_km,
+)
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark nearby vendor search on synthetic data"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--vendors", type=int, default=100000)
+        parser.add_argument("--queries", type=int, default=200)
+        parser.add_argument("--radius", type=float, default=25.0, help="Search radius in km")
+        parser.add_argument("--limit", type=int, default=50)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--keep", action="store_true", help="Keep the seeded vendors")
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        try:
+            with transaction.atomic():
+                self._run(options)
+                if not options["keep"]:
+                    raise _Rollback()
+        except _Rollback:
+            self.stdout.write("Seeded vendors rolled back.")
+
+    def _run(self, options):
+        category, _ = VendorCategory.objects.get_or_create(
+            slug="benchmark-geo",
+            defaults={"name": "Benchmark Geo", "is_active": True},
+        )
+
+        started = time.perf_counter()
+        self._seed_vendors(category, options["vendors"])
+        self.stdout.write(
+            f"Seeded {options['vendors']} vendors in {time.perf_counter() - started:.1f}s"
+        )
+
+        queryset = Vendor.objects.filter(is_active=True)
+        radius = options["radius"]
+        limit = options["limit"]
+        points = [self._random_point() for _ in range(options["queries"])]
+
+        indexed = []
+        full_scan = []
+        mismatches = 0
+        for lat, lng in points:
+            t0 = time.perf_counter()
+            result = list(GeoService.nearby(queryset, lat, lng, radius, limit).values_list("id", flat=True))
+            indexed.append((time.perf_counter() - t0) * 1000)
+
+            t0 = time.perf_counter()
+            expected = list(
+                queryset.filter(latitude__isnull=False)
+                .annotate(distance_km=haversine_expression(lat, lng))
+                .filter(distance_km__lte=radius)
+                .order_by("distance_km", "id")
+                .values_list("id", flat=True)[:limit]
+            )
+            full_scan.append((time.perf_counter() - t0) * 1000)
+
+            if result != expected:
+                mismatches += 1
+
+        self._verify_distances(queryset, points[:5], radius, limit)
+
+        self._report("geohash index", indexed)
+        self._report("full scan", full_scan)
+        if mismatches:
+            self.stdout.write(self.style.ERROR(f"{mismatches} queries differed from full scan"))
+        else:
+            self.stdout.write(self.style.SUCCESS("All results match the full scan"))
+
+    def _seed_vendors(self, category, count):
+        batch = []
+        for i in range(count):
+            lat, lng = self._random_point()
+            batch.append(Vendor(
+                name=f"Benchmark Vendor {i}",
+                slug=f"benchmark-vendor-{i}",
+                category=category,
+                latitude=round(lat, 6),
+                longitude=round(lng, 6),
+                geohash=encode_geohash(lat, lng),
+            ))
+            if len(batch) >= 5000:
+                Vendor.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            Vendor.objects.bulk_create(batch)
+
+    def _random_point(self):
+        # Mostly Thailand, with some vendors spread worldwide
+        if random.random() < 0.9:
+            return random.uniform(5.6, 20.4), random.uniform(97.3, 105.6)
+        return random.uniform(-60, 70), random.uniform(-180, 180)
+
+    def _verify_distances(self, queryset, points, radius, limit):
+        """Cross-check database distances against the Python haversine"""
+        for lat, lng in points:
+            for vendor in GeoService.nearby(queryset, lat, lng, radius, limit):
+                expected = haversine_km(lat, lng, vendor.latitude, vendor.longitude)
+                if abs(expected - vendor.distance_km) > 0.01:
+                    self.stdout.write(self.style.ERROR(
+                        f"Distance mismatch for vendor {vendor.id}: "
+                        f"{vendor.distance_km:.3f} vs {expected:.3f}"
+                    ))
+
+    def _report(self, label, timings):
+        timings = sorted(timings)
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(
+            f"{label:<14} p50={statistics.median(timings):.2f}ms "
+            f"p95={p95:.2f}ms max={timings[-1]:.2f}ms"
+        )
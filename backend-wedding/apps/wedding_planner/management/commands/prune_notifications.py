@@ -0,0 +1,66 @@
+"""
+Notification retention job.
+
+Deletes expired notifications and read notifications older than the
+retention window in primary-key batches, rolling each batch up into
+NotificationDailyCount first. Meant to run from cron, e.g. nightly:
+
+    python manage.py prune_notifications --days 30 --batch-size 5000
+"""
+from django.core.management.base import BaseCommand
+
+from apps.wedding_planner.services.notification_retention_service import (
+    NotificationRetentionService,
+)
+
+
+class Command(BaseCommand):
+    help = "Prune old/expired notifications in batches and roll them up into daily counts"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=NotificationRetentionService.DEFAULT_RETENTION_DAYS,
+            help="Keep read notifications newer than this many days",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=NotificationRetentionService.DEFAULT_BATCH_SIZE,
+            help="Primary key range handled per transaction",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between batches to reduce load",
+        )
+        parser.add_argument("--no-rollup", action="store_true", help="Delete without daily roll-ups")
+        parser.add_argument("--dry-run", action="store_true", help="Count eligible rows only")
+
+    def handle(self, *args, **options):
+        verbose = options["verbosity"] > 1
+
+        def progress(stats):
+            if verbose:
+                self.stdout.write(
+                    f"batch {stats['batches']}: {stats['deleted']} rows, "
+                    f"{stats['rows_per_second']} rows/s"
+                )
+
+        stats = NotificationRetentionService.prune(
+            days=options["days"],
+            batch_size=options["batch_size"],
+            rollup=not options["no_rollup"],
+            dry_run=options["dry_run"],
+            pause_seconds=options["pause"],
+            progress=progress,
+        )
+
+        action = "Would delete" if options["dry_run"] else "Deleted"
+        self.stdout.write(self.style.SUCCESS(
+            f"{action} {stats['deleted']} notifications in {stats['batches']} batches "
+            f"({stats['seconds']}s, {stats['rows_per_second']} rows/s); "
+            f"rolled up {stats['rolled_up']}"
+        ))
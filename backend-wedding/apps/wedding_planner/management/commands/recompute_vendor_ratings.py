@@ -0,0 +1,62 @@
+"""
+Reconcile vendor rating totals with their reviews.
+
+Review create/update/delete keep Vendor.rating_sum, review_count and
+average_rating current incrementally. Paths that bypass the API (admin,
+cascading user deletes, raw SQL) can leave them drifted; this command
+recomputes every vendor from one grouped review query and writes back
+only the vendors that differ.
+
+Usage:
+    python manage.py recompute_vendor_ratings [--dry-run]
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from apps.wedding_planner.models import Vendor, VendorReview
+
+
+class Command(BaseCommand):
+    help = "Recompute vendor rating totals from reviews"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report drift without writing")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        totals = {
+            row["vendor_id"]: (row["total"], row["count"])
+            for row in VendorReview.objects.values("vendor_id")
+            .annotate(total=Sum("rating"), count=Count("id"))
+            .order_by()
+        }
+
+        drifted = []
+        vendors = Vendor.objects.only(
+            "id", "rating_sum", "review_count", "average_rating"
+        ).order_by("id")
+        for vendor in vendors.iterator(chunk_size=options["batch_size"]):
+            rating_sum, review_count = totals.get(vendor.id, (0, 0))
+            average = Vendor.compute_average(rating_sum, review_count)
+            if (
+                vendor.rating_sum != rating_sum
+                or vendor.review_count != review_count
+                or vendor.average_rating != average
+            ):
+                vendor.rating_sum = rating_sum
+                vendor.review_count = review_count
+                vendor.average_rating = average
+                drifted.append(vendor)
+
+        if options["dry_run"]:
+            self.stdout.write(f"{len(drifted)} vendors have drifted rating totals")
+            return
+
+        with transaction.atomic():
+            Vendor.objects.bulk_update(
+                drifted,
+                ["rating_sum", "review_count", "average_rating"],
+                batch_size=options["batch_size"],
+            )
+        self.stdout.write(self.style.SUCCESS(f"Updated {len(drifted)} vendors"))
@@ -0,0 +1,87 @@
+"""
+Seed synthetic weddings for load testing and local development.
+
+Creates (or reuses, with --owner-email) a wedding owner and N weddings,
+each with guests (plus-ones and children), tables and seating, meal
+choices and selections, todos with checklists, a gift registry,
+notifications and a restaurant access token; plus a set of vendors, some
+saved by the owner. Data is kept; use benchmark_endpoints for throwaway
+runs.
+
+Usage:
+    python manage.py seed_sample_data --weddings 5 --guests 300 --todos 200
+"""
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.commons.models import User
+from apps.wedding_planner.services import SampleDataService
+
+
+class Command(BaseCommand):
+    help = "Seed synthetic weddings with guests, seating, meals, todos and registry items"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--weddings", type=int, default=1)
+        parser.add_argument("--guests", type=int, default=200)
+        parser.add_argument("--children-per-family", type=int, default=2)
+        parser.add_argument("--family-rate", type=float, default=0.2,
+                            help="Share of guests bringing children")
+        parser.add_argument("--plus-one-rate", type=float, default=0.3)
+        parser.add_argument("--table-size", type=int, default=10)
+        parser.add_argument("--todos", type=int, default=100)
+        parser.add_argument("--checklist-items", type=int, default=4)
+        parser.add_argument("--registry-items", type=int, default=50)
+        parser.add_argument("--notifications", type=int, default=50)
+        parser.add_argument("--vendors", type=int, default=100)
+        parser.add_argument("--saved-vendors", type=int, default=10,
+                            help="Vendors saved by the owner")
+        parser.add_argument("--owner-email", help="Seed for this (new or existing) user")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        started = time.perf_counter()
+
+        with transaction.atomic():
+            owner = self._owner(options["owner_email"])
+            prefix = f"sample-{random.randint(0, 10**6)}"
+            vendors = SampleDataService.seed_vendors(options["vendors"], prefix=prefix)
+            weddings = [
+                SampleDataService.seed_wedding(
+                    owner,
+                    guests=options["guests"],
+                    children_per_family=options["children_per_family"],
+                    family_rate=options["family_rate"],
+                    plus_one_rate=options["plus_one_rate"],
+                    table_size=options["table_size"],
+                    todos=options["todos"],
+                    checklist_items=options["checklist_items"],
+                    registry_items=options["registry_items"],
+                    notifications=options["notifications"],
+                    vendors=vendors[:options["saved_vendors"]],
+                    label=prefix,
+                )
+                for _ in range(options["weddings"])
+            ]
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(weddings)} weddings and {len(vendors)} vendors for {owner.email} "
+            f"in {time.perf_counter() - started:.1f}s"
+        ))
+        for wedding in weddings:
+            token = wedding.restaurant_access_tokens.first()
+            self.stdout.write(
+                f"  wedding {wedding.id}: {wedding.guests.count()} guests, "
+                f"{wedding.tables.count()} tables, {wedding.todos.count()} todos, "
+                f"portal /api/wedding_planner/restaurant-portal/{token.access_code}/"
+            )
+
+    def _owner(self, email):
+        if not email:
+            return SampleDataService.create_owner()
+        owner = User.objects.filter(email=email.lower()).first()
+        return owner or SampleDataService.create_owner(email.lower())
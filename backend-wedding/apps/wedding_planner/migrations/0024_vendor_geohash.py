@@ -0,0 +1,39 @@
+# Generated by Django 5.1.4 on 2026-10-19 06:54
+
+from django.db import migrations, models
+
+
+def backfill_geohash(apps, schema_editor):
+    """Fill geohash for vendors that already have coordinates"""
+    from apps.wedding_planner.services.geo_service import encode_geohash
+
+    Vendor = apps.get_model('wedding_planner', 'Vendor')
+    vendors = Vendor.objects.filter(
+        latitude__isnull=False, longitude__isnull=False
+    ).only('id', 'latitude', 'longitude')
+
+    batch = []
+    for vendor in vendors.iterator(chunk_size=1000):
+        vendor.geohash = encode_geohash(vendor.latitude, vendor.longitude)
+        batch.append(vendor)
+        if len(batch) >= 1000:
+            Vendor.objects.bulk_update(batch, ['geohash'])
+            batch = []
+    if batch:
+        Vendor.objects.bulk_update(batch, ['geohash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wedding_planner', '0023_two_way_meal_approval'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vendor',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Geohash of latitude/longitude (auto-filled, used for nearby search)', max_length=12),
+        ),
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.4 on 2026-10-19 07:01
+
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def backfill_rating_sum(apps, schema_editor):
+    """Seed rating_sum from existing reviews"""
+    Vendor = apps.get_model('wedding_planner', 'Vendor')
+    VendorReview = apps.get_model('wedding_planner', 'VendorReview')
+
+    totals = VendorReview.objects.values('vendor_id').annotate(total=Sum('rating')).order_by()
+    for row in totals:
+        Vendor.objects.filter(pk=row['vendor_id']).update(rating_sum=row['total'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wedding_planner', '0024_vendor_geohash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vendor',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, help_text='Sum of all review ratings (maintained incrementally)'),
+        ),
+        migrations.RunPython(backfill_rating_sum, migrations.RunPython.noop),
+    ]
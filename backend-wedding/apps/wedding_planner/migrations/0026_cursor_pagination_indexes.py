@@ -0,0 +1,36 @@
+# Generated by Django 5.1.4 on 2026-10-19 07:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo_list_wedding', '0001_initial'),
+        ('wedding_planner', '0025_vendor_rating_sum'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='guest',
+            index=models.Index(fields=['wedding', '-created_at', '-id'], name='wedding_pla_wedding_a8a601_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='wedding_pla_user_id_8a3193_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=models.Index(fields=['is_active', '-created_at', '-id'], name='wedding_pla_is_acti_536e8d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vendorreview',
+            index=models.Index(fields=['vendor', '-created_at', '-id'], name='wedding_pla_vendor__4b5656_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vendorreview',
+            index=models.Index(fields=['-created_at', '-id'], name='wedding_pla_created_316444_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.4 on 2026-10-19 07:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wedding_planner', '0026_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationDailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('notification_type', models.CharField(choices=[('todo_due_soon', 'Todo Due Soon (30 min)'), ('todo_due_now', 'Todo Due Now'), ('todo_overdue', 'Todo Overdue'), ('todo_reminder', 'Todo Reminder'), ('todo_completed', 'Todo Completed'), ('rsvp_accepted', 'RSVP Accepted'), ('rsvp_declined', 'RSVP Declined'), ('rsvp_pending', 'RSVP Pending Reminder'), ('gift_claimed', 'Gift Claimed'), ('gift_unclaimed', 'Gift Unclaimed'), ('rsvp', 'RSVP Update'), ('payment', 'Payment'), ('task', 'Task'), ('vendor', 'Vendor'), ('team', 'Team'), ('guest', 'Guest'), ('system', 'System'), ('reminder', 'Reminder')], max_length=20)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('wedding', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notification_daily_counts', to='wedding_planner.wedding')),
+            ],
+            options={
+                'verbose_name': 'Notification Daily Count',
+                'verbose_name_plural': 'Notification Daily Counts',
+                'ordering': ['-date'],
+                'unique_together': {('wedding', 'date', 'notification_type')},
+            },
+        ),
+    ]
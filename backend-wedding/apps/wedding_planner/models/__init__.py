@@ -140,7 +140,7 @@ from .speeches_model import (
 
 # Notifications
 from .notifications_model import (
-    NotificationPreference, Notification, ScheduledReminder
+    NotificationPreference, Notification, ScheduledReminder, NotificationDailyCount
 )
 
 # Exports and Reports
@@ -321,6 +321,7 @@ __all__ = [
     "NotificationPreference",
     "Notification",
     "ScheduledReminder",
+    "NotificationDailyCount",
     
     # Exports and Reports
     "ExportJob",
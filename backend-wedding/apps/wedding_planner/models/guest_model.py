@@ -132,7 +132,11 @@ class Guest(TimeStampedBaseModel):
     class Meta:
         verbose_name = "guest"
         verbose_name_plural = "guests"
-        indexes = [models.Index(fields=["email"]), models.Index(fields=["last_name"])]
+        indexes = [
+            models.Index(fields=["email"]),
+            models.Index(fields=["last_name"]),
+            models.Index(fields=["wedding", "-created_at", "-id"]),
+        ]
         # Unique email per wedding, not globally
         constraints = [
             models.UniqueConstraint(
@@ -178,6 +178,7 @@ class Notification(TimeStampedBaseModel):
             models.Index(fields=["user", "is_read"]),
             models.Index(fields=["wedding", "-created_at"]),
             models.Index(fields=["notification_type"]),
+            models.Index(fields=["user", "-created_at", "-id"]),
         ]
     
     def __str__(self):
@@ -194,6 +195,36 @@ class Notification(TimeStampedBaseModel):
         self.save(update_fields=["is_read", "read_at", "updated_at"])
 
 
+class NotificationDailyCount(models.Model):
+    """
+    Per-wedding daily notification counts, kept when old notifications
+    are pruned by the retention job (see prune_notifications).
+    """
+    
+    wedding = models.ForeignKey(
+        "wedding_planner.Wedding",
+        on_delete=models.CASCADE,
+        related_name="notification_daily_counts",
+        null=True,
+        blank=True,
+    )
+    date = models.DateField()
+    notification_type = models.CharField(
+        max_length=20,
+        choices=Notification.NotificationType.choices
+    )
+    count = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        verbose_name = "Notification Daily Count"
+        verbose_name_plural = "Notification Daily Counts"
+        ordering = ["-date"]
+        unique_together = ["wedding", "date", "notification_type"]
+    
+    def __str__(self):
+        return f"{self.date} {self.notification_type}: {self.count}"
+
+
 class ScheduledReminder(TimeStampedBaseModel):
     """Scheduled reminders"""
     
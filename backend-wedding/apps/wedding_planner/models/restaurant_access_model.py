@@ -139,6 +139,8 @@ class RestaurantAccessToken(TimeStampedBaseModel):
     
     def regenerate_code(self):
         """Generate a new access code (invalidates old links)."""
+        # Kept so the cached lookup for the old code can be dropped on save
+        self._previous_access_code = self.access_code
         self.access_code = uuid.uuid4()
         self.save(update_fields=["access_code"])
         return self.access_code
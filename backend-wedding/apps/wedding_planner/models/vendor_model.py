@@ -162,6 +162,13 @@ class Vendor(TimeStampedBaseModel):
     longitude = models.DecimalField(
         max_digits=9, decimal_places=6, null=True, blank=True
     )
+    geohash = models.CharField(
+        max_length=12,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="Geohash of latitude/longitude (auto-filled, used for nearby search)"
+    )
     service_area = models.TextField(
         blank=True, 
         help_text="Areas where vendor provides service (e.g., 'Bangkok, Phuket, Chiang Mai')"
@@ -229,6 +236,10 @@ class Vendor(TimeStampedBaseModel):
         max_digits=3, decimal_places=2, default=0
     )
     review_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(
+        default=0,
+        help_text="Sum of all review ratings (maintained incrementally)"
+    )
     
     # Status flags
     is_verified = models.BooleanField(default=False)
@@ -253,6 +264,7 @@ class Vendor(TimeStampedBaseModel):
             models.Index(fields=["category", "is_active"]),
             models.Index(fields=["city", "country"]),
             models.Index(fields=["-average_rating"]),
+            models.Index(fields=["is_active", "-created_at", "-id"]),
         ]
     
     def __str__(self):
@@ -262,8 +274,19 @@ class Vendor(TimeStampedBaseModel):
         if not self.slug:
             from django.utils.text import slugify
             self.slug = slugify(self.name)
+        self.geohash = self.compute_geohash()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"latitude", "longitude"} & set(update_fields):
+            kwargs["update_fields"] = set(update_fields) | {"geohash"}
         super().save(*args, **kwargs)
     
+    def compute_geohash(self):
+        """Geohash for the current coordinates, empty if not located"""
+        if self.latitude is None or self.longitude is None:
+            return ""
+        from apps.wedding_planner.services.geo_service import encode_geohash
+        return encode_geohash(self.latitude, self.longitude)
+    
     @property
     def price_display(self):
         """Display formatted price range"""
@@ -276,12 +299,46 @@ class Vendor(TimeStampedBaseModel):
         return self.get_price_range_display() if self.price_range else "Contact for price"
     
     def update_rating(self):
-        """Recalculate average rating from reviews"""
-        from django.db.models import Avg
-        result = self.reviews.aggregate(avg_rating=Avg("rating"))
-        self.average_rating = result["avg_rating"] or 0
-        self.review_count = self.reviews.count()
-        self.save(update_fields=["average_rating", "review_count"])
+        """Recalculate rating totals from all reviews (full scan)"""
+        from django.db.models import Count, Sum
+        result = self.reviews.aggregate(total=Sum("rating"), count=Count("id"))
+        self.rating_sum = result["total"] or 0
+        self.review_count = result["count"]
+        self.average_rating = self.compute_average(self.rating_sum, self.review_count)
+        self.save(update_fields=["average_rating", "review_count", "rating_sum"])
+    
+    def adjust_rating(self, rating_delta, count_delta=0):
+        """
+        Apply a review change to the running rating totals in one UPDATE.
+        
+        - New review: adjust_rating(rating, 1)
+        - Rating changed: adjust_rating(new_rating - old_rating)
+        - Review deleted: adjust_rating(-rating, -1)
+        """
+        from django.db.models import Case, F, FloatField, Value, When
+        from django.db.models.functions import Cast
+        
+        new_sum = F("rating_sum") + rating_delta
+        new_count = F("review_count") + count_delta
+        # SET expressions see the pre-update row, so the average is
+        # derived from the adjusted sum/count within the same statement.
+        Vendor.objects.filter(pk=self.pk).update(
+            rating_sum=new_sum,
+            review_count=new_count,
+            average_rating=Case(
+                When(review_count__lte=-count_delta, then=Value(0.0)),
+                default=Cast(new_sum, FloatField()) / Cast(new_count, FloatField()),
+                output_field=FloatField(),
+            ),
+        )
+    
+    @staticmethod
+    def compute_average(rating_sum, review_count):
+        """Average rating rounded to the stored precision"""
+        from decimal import Decimal
+        if not review_count:
+            return Decimal("0")
+        return (Decimal(rating_sum) / review_count).quantize(Decimal("0.01"))
 
 
 class VendorImage(TimeStampedBaseModel):
@@ -437,6 +494,10 @@ class VendorReview(TimeStampedBaseModel):
         verbose_name_plural = "Vendor Reviews"
         ordering = ["-created_at"]
         unique_together = ["vendor", "user"]
+        indexes = [
+            models.Index(fields=["vendor", "-created_at", "-id"]),
+            models.Index(fields=["-created_at", "-id"]),
+        ]
     
     def __str__(self):
         return f"{self.vendor.name} - {self.rating}★ by {self.user}"
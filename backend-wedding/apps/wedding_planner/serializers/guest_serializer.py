@@ -63,16 +63,11 @@ class GuestSerializer(serializers.ModelSerializer):
     
     def get_table_assignment(self, obj):
         """Get the table ID if guest has a seating assignment (primary guest only)."""
-        from apps.wedding_planner.models.seating_model import SeatingAssignment
-        try:
-            # Get assignment for the primary guest (not plus_one or child)
-            assignment = SeatingAssignment.objects.filter(
-                guest=obj, 
-                attendee_type="guest"
-            ).first()
-            return assignment.table_id if assignment else None
-        except SeatingAssignment.DoesNotExist:
-            return None
+        # Read through the related managers so the view's prefetch is used
+        for assignment in obj.seating_assignments.all():
+            if assignment.attendee_type == "guest":
+                return assignment.table_id
+        return None
     
     def get_meal_selection(self, obj):
         """Get the guest's meal selection summary."""
@@ -90,19 +85,14 @@ class GuestSerializer(serializers.ModelSerializer):
     
     def get_claimed_gifts(self, obj):
         """Get the gifts claimed by this guest."""
-        from apps.wedding_planner.models.registry_model import RegistryItem
-        try:
-            claimed_items = RegistryItem.objects.filter(claimed_by=obj)
-            return [
-                {
-                    "id": item.id,
-                    "name": item.name,
-                    "category": item.get_category_display() if item.category else None,
-                }
-                for item in claimed_items
-            ]
-        except Exception:
-            return []
+        return [
+            {
+                "id": item.id,
+                "name": item.name,
+                "category": item.get_category_display() if item.category else None,
+            }
+            for item in obj.claimed_registry_items.all()
+        ]
     
     def get_guest_type_display(self, obj):
         return obj.get_guest_type_display() if obj.guest_type else None
@@ -12,6 +12,7 @@ Includes:
 - SavedVendorSerializer: Bookmarked vendors
 """
 
+from django.db.models import Prefetch
 from rest_framework import serializers
 from apps.wedding_planner.models import (
     VendorCategory, Vendor, VendorImage, VendorOffer,
@@ -19,6 +20,18 @@ from apps.wedding_planner.models import (
 )
 
 
+def prefetch_active_offers(queryset, lookup="offers"):
+    """
+    Prefetch the active offers VendorListSerializer counts into
+    ``active_offers``; ``lookup`` is the path to Vendor.offers.
+    """
+    return queryset.prefetch_related(Prefetch(
+        lookup,
+        queryset=VendorOffer.objects.filter(is_active=True),
+        to_attr="active_offers",
+    ))
+
+
 class VendorCategorySerializer(serializers.ModelSerializer):
     """
     Serializer for vendor categories.
@@ -53,6 +66,8 @@ class VendorCategorySerializer(serializers.ModelSerializer):
     
     def get_vendor_count(self, obj):
         """Count active vendors in this category"""
+        if hasattr(obj, "active_vendor_count"):
+            return obj.active_vendor_count
         return obj.vendors.filter(is_active=True).count()
 
 
@@ -74,6 +89,8 @@ class VendorCategoryListSerializer(serializers.ModelSerializer):
         ]
     
     def get_vendor_count(self, obj):
+        if hasattr(obj, "active_vendor_count"):
+            return obj.active_vendor_count
         return obj.vendors.filter(is_active=True).count()
 
 
@@ -330,6 +347,8 @@ class VendorListSerializer(serializers.ModelSerializer):
         ]
     
     def get_offer_count(self, obj):
+        if hasattr(obj, "active_offers"):
+            return len(obj.active_offers)
         return obj.offers.filter(is_active=True).count()
 
 
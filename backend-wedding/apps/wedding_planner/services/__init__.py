@@ -1,3 +1,22 @@
 from .notification_service import NotificationService
+from .geo_service import GeoService
+from .vendor_facet_service import VendorFacetService
+from .notification_retention_service import NotificationRetentionService
+from .restaurant_access_service import RestaurantAccessService
+from .portal_summary_service import PortalSummaryService
+from .kitchen_report_service import KitchenReportService
+from .sample_data_service import SampleDataService
+from .wedding_access_service import WeddingAccess, WeddingAccessService
 
-__all__ = ["NotificationService"]
+__all__ = [
+    "NotificationService",
+    "GeoService",
+    "VendorFacetService",
+    "NotificationRetentionService",
+    "RestaurantAccessService",
+    "PortalSummaryService",
+    "KitchenReportService",
+    "SampleDataService",
+    "WeddingAccess",
+    "WeddingAccessService",
+]
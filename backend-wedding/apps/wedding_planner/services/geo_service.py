@@ -0,0 +1,192 @@
+"""
+Geo Service - Nearest-vendor lookup without PostGIS.
+
+Vendors store a geohash of their coordinates in an indexed column.
+A radius search is answered in two steps:
+
+1. Candidate selection: the bounding box of the search circle is covered
+   by a handful of geohash cells, and each cell becomes an indexed range
+   lookup on ``Vendor.geohash`` (all hashes sharing the cell's prefix).
+2. Exact filter: the great-circle (haversine) distance is computed by the
+   database for the whole candidate set in one expression, then used to
+   drop points outside the radius and to sort nearest first.
+"""
+import math
+from typing import List, Optional
+
+from django.db.models import FloatField, Q, Value
+from django.db.models.functions import ASin, Cast, Cos, Least, Power, Radians, Sin, Sqrt
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+
+# Precision stored on Vendor.geohash (~4.8m x 4.8m cells)
+GEOHASH_PRECISION = 9
+
+# Upper bound on cells used to cover a search area
+MAX_COVERING_CELLS = 16
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def encode_geohash(latitude, longitude, precision: int = GEOHASH_PRECISION) -> str:
+    """Encode a coordinate pair as a geohash string."""
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    latitude = float(latitude)
+    longitude = float(longitude)
+
+    chars = []
+    bits = 0
+    value = 0
+    even = True  # Geohash interleaves bits starting with longitude
+    while len(chars) < precision:
+        if even:
+            mid = (lng_lo + lng_hi) / 2
+            if longitude >= mid:
+                value = (value << 1) | 1
+                lng_lo = mid
+            else:
+                value <<= 1
+                lng_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if latitude >= mid:
+                value = (value << 1) | 1
+                lat_lo = mid
+            else:
+                value <<= 1
+                lat_hi = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits = 0
+            value = 0
+    return "".join(chars)
+
+
+def _cell_size(precision: int):
+    """Return (lat_height, lng_width) in degrees of a geohash cell."""
+    total_bits = 5 * precision
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lng_bits)
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float):
+    """
+    Return (lat_min, lat_max, lng_min, lng_max) enclosing the search circle.
+    Longitude bounds are not normalized and may extend past +/-180.
+    Returns a full longitude span near the poles.
+    """
+    lat_delta = radius_km / KM_PER_DEGREE_LAT
+    lat_min = max(-90.0, latitude - lat_delta)
+    lat_max = min(90.0, latitude + lat_delta)
+
+    # A degree of longitude shrinks with cos(latitude); use the widest
+    # latitude inside the box so the whole circle is covered.
+    widest = max(abs(lat_min), abs(lat_max))
+    cos_lat = math.cos(math.radians(widest))
+    if cos_lat < 1e-6 or widest >= 90.0:
+        return lat_min, lat_max, -180.0, 180.0
+    lng_delta = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    if lng_delta >= 180.0:
+        return lat_min, lat_max, -180.0, 180.0
+    return lat_min, lat_max, longitude - lng_delta, longitude + lng_delta
+
+
+def covering_geohashes(latitude: float, longitude: float, radius_km: float) -> Optional[List[str]]:
+    """
+    Return geohash prefixes whose cells together cover the search circle.
+    Picks the finest precision needing at most MAX_COVERING_CELLS cells.
+    Returns None when the area is too large for a prefix filter to help.
+    """
+    lat_min, lat_max, lng_min, lng_max = bounding_box(latitude, longitude, radius_km)
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_h, lng_w = _cell_size(precision)
+        lat_cells = int(2 ** ((5 * precision) // 2))
+        lng_cells = int(2 ** ((5 * precision + 1) // 2))
+
+        row_start = int(math.floor((lat_min + 90.0) / lat_h))
+        row_end = min(int(math.floor((lat_max + 90.0) / lat_h)), lat_cells - 1)
+        col_start = int(math.floor((lng_min + 180.0) / lng_w))
+        col_end = int(math.floor((lng_max + 180.0) / lng_w))
+
+        rows = row_end - row_start + 1
+        cols = min(col_end - col_start + 1, lng_cells)
+        if rows * cols > MAX_COVERING_CELLS:
+            continue
+
+        prefixes = set()
+        for row in range(row_start, row_end + 1):
+            cell_lat = -90.0 + (row + 0.5) * lat_h
+            for offset in range(cols):
+                col = (col_start + offset) % lng_cells
+                cell_lng = -180.0 + (col + 0.5) * lng_w
+                prefixes.add(encode_geohash(cell_lat, cell_lng, precision))
+        return sorted(prefixes)
+
+    return None
+
+
+def haversine_km(lat1, lng1, lat2, lng2) -> float:
+    """Great-circle distance in kilometres between two points."""
+    lat1, lng1, lat2, lng2 = map(math.radians, map(float, (lat1, lng1, lat2, lng2)))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def haversine_expression(latitude: float, longitude: float, lat_field="latitude", lng_field="longitude"):
+    """
+    Build a database expression for the haversine distance (km) between
+    each row's coordinates and the given point.
+    """
+    lat0 = math.radians(latitude)
+    lng0 = math.radians(longitude)
+    row_lat = Radians(Cast(lat_field, FloatField()))
+    row_lng = Radians(Cast(lng_field, FloatField()))
+
+    a = (
+        Power(Sin((row_lat - Value(lat0)) / Value(2.0)), 2)
+        + Value(math.cos(lat0)) * Cos(row_lat)
+        * Power(Sin((row_lng - Value(lng0)) / Value(2.0)), 2)
+    )
+    return Value(2 * EARTH_RADIUS_KM) * ASin(Least(Sqrt(a), Value(1.0), output_field=FloatField()))
+
+
+class GeoService:
+    """
+    Radius search over models with latitude/longitude and geohash columns.
+    """
+
+    @classmethod
+    def nearby(cls, queryset, latitude: float, longitude: float, radius_km: float, limit: int = 50):
+        """
+        Return up to ``limit`` rows within ``radius_km`` of the point,
+        nearest first, each annotated with ``distance_km``.
+        """
+        queryset = queryset.filter(latitude__isnull=False, longitude__isnull=False)
+
+        lat_min, lat_max, lng_min, lng_max = bounding_box(latitude, longitude, radius_km)
+        queryset = queryset.filter(latitude__range=(lat_min, lat_max))
+
+        prefixes = covering_geohashes(latitude, longitude, radius_km)
+        if prefixes:
+            # Range lookups instead of startswith: SQLite's LIKE cannot use
+            # the index, a plain B-tree range works on every backend.
+            cell_filter = Q()
+            for prefix in prefixes:
+                upper = prefix + _BASE32[-1] * (GEOHASH_PRECISION - len(prefix))
+                cell_filter |= Q(geohash__gte=prefix, geohash__lte=upper)
+            queryset = queryset.filter(cell_filter)
+
+        return queryset.annotate(
+            distance_km=haversine_expression(latitude, longitude)
+        ).filter(
+            distance_km__lte=radius_km
+        ).order_by("distance_km", "id")[:limit]
@@ -0,0 +1,343 @@
+"""
+Kitchen Report Service - Plate counts and allergen conflicts for caterers.
+
+Builds, for confirmed guests of a wedding:
+- a table x meal matrix counting every plate (guests, plus-ones, children),
+- per-allergen counts (plates containing it, attendees avoiding it),
+- the list of guests whose chosen meal contains something they avoid.
+
+Everything is loaded with a fixed number of flat ``values()`` queries
+(guests, seating, children, meals, tables, restrictions) and joined in
+Python, so the cost does not grow with the number of queries per guest.
+
+Plate rules:
+- A plus-one eats the meal chosen by the guest who brings them.
+- A child gets the wedding's kids menu when one exists.
+- Plus-ones and children sit at their own assignment, falling back to the
+  host guest's table; anyone unseated is counted under "Unassigned".
+
+Dietary restrictions and the free-text ``allergies`` field are matched to
+``MealChoice.Allergen`` values by name (e.g. "Gluten-Free", "Nut allergy",
+"Lactose intolerant").
+"""
+import csv
+import io
+import re
+from collections import Counter, defaultdict
+
+from apps.wedding_planner.models import (
+    Child,
+    Guest,
+    GuestMealSelection,
+    MealChoice,
+    SeatingAssignment,
+    Table,
+)
+
+NO_MEAL = "none"
+UNASSIGNED = "unassigned"
+
+# Words that carry no allergen meaning in restriction names
+_FILLER_WORDS = {
+    "free", "allergy", "allergies", "allergic", "intolerance", "intolerant",
+    "no", "without", "non", "sensitivity", "sensitive", "diet", "to",
+}
+
+# Common names that differ from the allergen value or label
+_ALLERGEN_SYNONYMS = {
+    "nut": "nuts",
+    "peanut": "peanuts",
+    "tree nut": "tree_nuts",
+    "tree nuts": "tree_nuts",
+    "egg": "eggs",
+    "milk": "dairy",
+    "lactose": "dairy",
+    "wheat": "gluten",
+    "celiac": "gluten",
+    "coeliac": "gluten",
+    "shrimp": "shellfish",
+    "crustacean": "shellfish",
+    "crustaceans": "shellfish",
+    "mollusc": "molluscs",
+    "mollusk": "molluscs",
+    "mushroom": "mushrooms",
+    "sulphites": "sulfites",
+    "sulfite": "sulfites",
+    "soya": "soy",
+}
+
+
+def match_allergens(text):
+    """Return the set of allergen values mentioned in a restriction text."""
+    if not text:
+        return set()
+
+    known = {}
+    for value, label in MealChoice.Allergen.choices:
+        known[value.replace("_", " ")] = value
+        known[label.lower()] = value
+    known.update(_ALLERGEN_SYNONYMS)
+
+    found = set()
+    for part in re.split(r"[,;/\n]+|\band\b", text.lower()):
+        words = [
+            word for word in re.findall(r"[a-z]+", part)
+            if word not in _FILLER_WORDS
+        ]
+        # Longest phrase first so "tree nuts" wins over "nuts"
+        i = 0
+        while i < len(words):
+            for size in (2, 1):
+                phrase = " ".join(words[i:i + size])
+                if phrase in known:
+                    found.add(known[phrase])
+                    i += size
+                    break
+            else:
+                i += 1
+    return found
+
+
+class KitchenReportService:
+    """
+    Computes the caterer's head-count and allergen report for a wedding.
+    """
+
+    @classmethod
+    def build(cls, wedding) -> dict:
+        """Return the full kitchen report for confirmed guests."""
+        meals = list(
+            MealChoice.objects.filter(wedding=wedding)
+            .order_by("meal_type", "name")
+            .values("id", "name", "meal_type", "contains_allergens")
+        )
+        meals_by_id = {meal["id"]: meal for meal in meals}
+        kids_meal_id = next(
+            (meal["id"] for meal in meals if meal["meal_type"] == MealChoice.MealType.KIDS),
+            None,
+        )
+
+        tables = list(
+            Table.objects.filter(wedding=wedding)
+            .order_by("table_number")
+            .values("id", "table_number", "name")
+        )
+
+        guests = list(
+            Guest.objects.filter(wedding=wedding, attendance_status="yes")
+            .values(
+                "id",
+                "first_name",
+                "last_name",
+                "is_plus_one_coming",
+                "meal_selection__meal_choice_id",
+                "meal_selection__allergies",
+            )
+        )
+
+        seats = {}
+        child_seats = {}
+        for row in SeatingAssignment.objects.filter(table__wedding=wedding).values(
+            "guest_id", "attendee_type", "child_id", "table_id"
+        ):
+            if row["attendee_type"] == SeatingAssignment.AttendeeType.CHILD:
+                child_seats[row["child_id"]] = row["table_id"]
+            else:
+                seats[(row["guest_id"], row["attendee_type"])] = row["table_id"]
+
+        children = defaultdict(list)
+        for row in Child.objects.filter(
+            guest__wedding=wedding, guest__attendance_status="yes"
+        ).values("id", "guest_id"):
+            children[row["guest_id"]].append(row["id"])
+
+        restrictions = defaultdict(set)
+        for row in GuestMealSelection.dietary_restrictions.through.objects.filter(
+            guestmealselection__guest__wedding=wedding,
+            guestmealselection__guest__attendance_status="yes",
+        ).values("guestmealselection__guest_id", "dietaryrestriction__name"):
+            restrictions[row["guestmealselection__guest_id"]].add(
+                row["dietaryrestriction__name"]
+            )
+
+        matrix = defaultdict(Counter)  # table_id -> meal_id -> plates
+        attendees = defaultdict(Counter)  # table_id -> attendee type -> people
+        plates_by_meal = Counter()
+        avoiding = Counter()
+        conflicts = []
+
+        def seat(table_id, meal_id, attendee_type):
+            table_id = table_id or UNASSIGNED
+            meal_id = meal_id or NO_MEAL
+            matrix[table_id][meal_id] += 1
+            attendees[table_id][attendee_type] += 1
+            plates_by_meal[meal_id] += 1
+
+        for guest in guests:
+            guest_id = guest["id"]
+            meal_id = guest["meal_selection__meal_choice_id"]
+            table_id = seats.get((guest_id, SeatingAssignment.AttendeeType.GUEST))
+
+            seat(table_id, meal_id, "guests")
+            if guest["is_plus_one_coming"]:
+                seat(
+                    seats.get((guest_id, SeatingAssignment.AttendeeType.PLUS_ONE), table_id),
+                    meal_id,
+                    "plus_ones",
+                )
+            for child_id in children.get(guest_id, ()):
+                seat(child_seats.get(child_id, table_id), kids_meal_id, "children")
+
+            avoided = set()
+            for name in restrictions.get(guest_id, ()):
+                avoided |= match_allergens(name)
+            avoided |= match_allergens(guest["meal_selection__allergies"])
+            for allergen in avoided:
+                avoiding[allergen] += 1
+
+            meal = meals_by_id.get(meal_id)
+            clash = avoided.intersection(meal["contains_allergens"]) if meal else set()
+            if clash:
+                conflicts.append({
+                    "guest_id": guest_id,
+                    "guest_name": f"{guest['first_name']} {guest['last_name']}",
+                    "table_id": table_id,
+                    "meal_id": meal_id,
+                    "meal_name": meal["name"],
+                    "allergens": sorted(clash),
+                })
+
+        table_labels = {table["id"]: cls._table_label(table) for table in tables}
+        for conflict in conflicts:
+            conflict["table"] = table_labels.get(conflict["table_id"], "Unassigned")
+
+        columns = [meal["id"] for meal in meals] + [NO_MEAL]
+        rows = [
+            cls._matrix_row(table["id"], table_labels[table["id"]], columns, matrix, attendees)
+            for table in tables
+        ]
+        if UNASSIGNED in matrix:
+            rows.append(
+                cls._matrix_row(UNASSIGNED, "Unassigned", columns, matrix, attendees)
+            )
+
+        allergen_counts = []
+        for value, label in MealChoice.Allergen.choices:
+            plates = sum(
+                plates_by_meal[meal["id"]]
+                for meal in meals
+                if value in meal["contains_allergens"]
+            )
+            if plates or avoiding[value]:
+                allergen_counts.append({
+                    "allergen": value,
+                    "label": label,
+                    "plates_containing": plates,
+                    "attendees_avoiding": avoiding[value],
+                })
+
+        totals = Counter()
+        for counts in attendees.values():
+            totals.update(counts)
+
+        return {
+            "meals": [
+                {
+                    "id": meal["id"],
+                    "name": meal["name"],
+                    "meal_type": meal["meal_type"],
+                    "allergens": meal["contains_allergens"],
+                    "plates": plates_by_meal[meal["id"]],
+                }
+                for meal in meals
+            ],
+            "tables": rows,
+            "totals": {
+                "guests": totals["guests"],
+                "plus_ones": totals["plus_ones"],
+                "children": totals["children"],
+                "plates": sum(plates_by_meal.values()),
+                "no_selection": plates_by_meal[NO_MEAL],
+            },
+            "allergens": allergen_counts,
+            "conflicts": conflicts,
+        }
+
+    @classmethod
+    def to_csv(cls, report) -> str:
+        """Render the matrix and conflict list as a CSV sheet."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        meal_ids = [meal["id"] for meal in report["meals"]]
+        writer.writerow(
+            ["Table"]
+            + [meal["name"] for meal in report["meals"]]
+            + ["No selection", "Guests", "Plus-ones", "Children", "Total plates"]
+        )
+        for row in report["tables"]:
+            writer.writerow(
+                [row["table"]]
+                + [row["meals"][str(meal_id)] for meal_id in meal_ids]
+                + [
+                    row["meals"][NO_MEAL],
+                    row["guests"],
+                    row["plus_ones"],
+                    row["children"],
+                    row["total"],
+                ]
+            )
+        totals = report["totals"]
+        writer.writerow(
+            ["Total"]
+            + [meal["plates"] for meal in report["meals"]]
+            + [
+                totals["no_selection"],
+                totals["guests"],
+                totals["plus_ones"],
+                totals["children"],
+                totals["plates"],
+            ]
+        )
+
+        writer.writerow([])
+        writer.writerow(["Allergen", "Plates containing", "Attendees avoiding"])
+        for allergen in report["allergens"]:
+            writer.writerow([
+                allergen["label"],
+                allergen["plates_containing"],
+                allergen["attendees_avoiding"],
+            ])
+
+        writer.writerow([])
+        writer.writerow(["Allergen conflicts"])
+        writer.writerow(["Guest", "Table", "Meal", "Allergens"])
+        for conflict in report["conflicts"]:
+            writer.writerow([
+                conflict["guest_name"],
+                conflict["table"],
+                conflict["meal_name"],
+                ", ".join(conflict["allergens"]),
+            ])
+
+        return buffer.getvalue()
+
+    @staticmethod
+    def _table_label(table) -> str:
+        if table["name"]:
+            return f"Table {table['table_number']} ({table['name']})"
+        return f"Table {table['table_number']}"
+
+    @staticmethod
+    def _matrix_row(table_id, label, columns, matrix, attendees) -> dict:
+        counts = matrix.get(table_id, Counter())
+        people = attendees.get(table_id, Counter())
+        return {
+            "table_id": None if table_id == UNASSIGNED else table_id,
+            "table": label,
+            "meals": {str(meal_id): counts[meal_id] for meal_id in columns},
+            "guests": people["guests"],
+            "plus_ones": people["plus_ones"],
+            "children": people["children"],
+            "total": sum(counts.values()),
+        }
@@ -0,0 +1,126 @@
+"""
+Notification Retention Service - Prunes old notifications in bounded batches.
+
+A notification is eligible for removal when:
+- its ``expires_at`` has passed (read or not), or
+- it has been read and is older than the retention window.
+
+Eligible rows are processed by primary key range, one short transaction
+per batch, so no single DELETE locks a large part of the table. Before a
+batch is deleted its rows are rolled up into NotificationDailyCount
+(per wedding, day and type) so historical volumes are kept.
+"""
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, Max, Min, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.wedding_planner.models.notifications_model import (
+    Notification,
+    NotificationDailyCount,
+)
+
+
+class NotificationRetentionService:
+    """
+    Batched deletion and daily roll-up of old notifications.
+    """
+
+    DEFAULT_RETENTION_DAYS = 30
+    DEFAULT_BATCH_SIZE = 5000
+
+    @classmethod
+    def eligible(cls, days: int = DEFAULT_RETENTION_DAYS, now=None):
+        """Queryset of notifications the retention policy allows removing."""
+        now = now or timezone.now()
+        cutoff = now - timedelta(days=days)
+        return Notification.objects.filter(
+            Q(expires_at__lte=now) | Q(is_read=True, created_at__lt=cutoff)
+        )
+
+    @classmethod
+    def prune(
+        cls,
+        days: int = DEFAULT_RETENTION_DAYS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        rollup: bool = True,
+        dry_run: bool = False,
+        pause_seconds: float = 0,
+        now=None,
+        progress=None,
+    ) -> dict:
+        """
+        Remove eligible notifications batch by batch.
+
+        ``progress`` is called with the running stats after each batch.
+        Returns counts and throughput for the run.
+        """
+        now = now or timezone.now()
+        eligible = cls.eligible(days, now).order_by()
+
+        bounds = eligible.aggregate(low=Min("id"), high=Max("id"))
+        stats = {
+            "deleted": 0,
+            "rolled_up": 0,
+            "batches": 0,
+            "seconds": 0.0,
+            "rows_per_second": 0.0,
+        }
+        if bounds["low"] is None:
+            return stats
+
+        started = time.monotonic()
+        start = bounds["low"]
+        while start <= bounds["high"]:
+            end = start + batch_size
+            batch = eligible.filter(id__gte=start, id__lt=end)
+
+            if dry_run:
+                stats["deleted"] += batch.count()
+            else:
+                with transaction.atomic():
+                    if rollup:
+                        stats["rolled_up"] += cls._rollup(batch)
+                    deleted, _ = batch.delete()
+                    stats["deleted"] += deleted
+
+            stats["batches"] += 1
+            start = end
+
+            elapsed = time.monotonic() - started
+            stats["seconds"] = round(elapsed, 3)
+            stats["rows_per_second"] = round(stats["deleted"] / elapsed, 1) if elapsed else 0.0
+            if progress:
+                progress(stats)
+            if pause_seconds:
+                time.sleep(pause_seconds)
+
+        return stats
+
+    @classmethod
+    def _rollup(cls, batch) -> int:
+        """Add the batch's per-wedding daily counts to NotificationDailyCount."""
+        groups = (
+            batch.annotate(day=TruncDate("created_at"))
+            .values("wedding_id", "day", "notification_type")
+            .annotate(total=Count("id"))
+            .order_by()
+        )
+
+        rolled_up = 0
+        for group in groups:
+            lookup = {
+                "wedding_id": group["wedding_id"],
+                "date": group["day"],
+                "notification_type": group["notification_type"],
+            }
+            updated = NotificationDailyCount.objects.filter(**lookup).update(
+                count=F("count") + group["total"]
+            )
+            if not updated:
+                NotificationDailyCount.objects.create(count=group["total"], **lookup)
+            rolled_up += group["total"]
+        return rolled_up
@@ -11,6 +11,9 @@ from apps.wedding_planner.models.notifications_model import (
     Notification,
     NotificationPreference,
 )
+from apps.wedding_planner.services.notification_retention_service import (
+    NotificationRetentionService,
+)
 
 
 class NotificationService:
@@ -374,13 +377,11 @@ class NotificationService:
     
     @classmethod
     def delete_old_notifications(cls, days: int = 30) -> int:
-        """Delete notifications older than specified days. Returns count deleted."""
-        cutoff_date = timezone.now() - timedelta(days=days)
-        deleted, _ = Notification.objects.filter(
-            created_at__lt=cutoff_date,
-            is_read=True,
-        ).delete()
-        return deleted
+        """
+        Delete read notifications older than specified days and expired ones.
+        Runs in bounded batches with daily roll-ups. Returns count deleted.
+        """
+        return NotificationRetentionService.prune(days=days)["deleted"]
     
     @classmethod
     def get_stats(cls, user, wedding=None) -> dict:
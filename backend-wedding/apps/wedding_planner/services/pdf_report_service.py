@@ -4,8 +4,18 @@ PDF Report Generation Service
 Generates printable PDF reports for wedding planning:
 - Guest list with meal selections
 - Table seating arrangements
+
+All report data is loaded up front into an in-memory snapshot with a fixed
+number of queries (guests, tables, seating assignments); the layout code
+only reads from the snapshot.
+
+The PDF is written to a temporary file rather than an in-memory buffer so
+large reports can be streamed to the client without holding extra copies.
+Table styles are built once and shared, and long guest lists are split
+into chunks with a repeated header row.
 """
-import io
+import tempfile
+from collections import defaultdict
 from datetime import datetime
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, letter
@@ -15,6 +25,65 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
 
+# Guest lists longer than this are split into several tables so layout
+# never has to measure and split one huge table.
+TABLE_CHUNK_ROWS = 200
+
+MEAL_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#be123c')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')]),
+])
+
+MEAL_SUMMARY_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6b7280')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
+    ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#f3f4f6')),
+])
+
+SEATING_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f3f4f6')),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+])
+
+
+def chunked_tables(rows, col_widths, style, chunk_rows=TABLE_CHUNK_ROWS):
+    """
+    Build one or more tables from ``rows`` (header first), each with at most
+    ``chunk_rows`` body rows and the header repeated on every page.
+    """
+    header, body = rows[0], rows[1:]
+    tables = []
+    for start in range(0, max(len(body), 1), chunk_rows):
+        table = Table(
+            [header] + body[start:start + chunk_rows],
+            colWidths=col_widths,
+            repeatRows=1,
+        )
+        table.setStyle(style)
+        tables.append(table)
+    return tables
+
+
 class WeddingPDFReport:
     """Generate PDF reports for wedding planning."""
     
@@ -22,6 +91,7 @@ class WeddingPDFReport:
         self.wedding = wedding
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
+        self.snapshot = None
     
     def _setup_custom_styles(self):
         """Setup custom paragraph styles."""
@@ -57,11 +127,83 @@ class WeddingPDFReport:
             textColor=colors.gray,
         ))
     
-    def generate_full_report(self):
-        """Generate a complete wedding report PDF."""
-        buffer = io.BytesIO()
+    def load_snapshot(self):
+        """
+        Load everything the report shows in three queries:
+        confirmed guests with their meals, tables, and seating assignments
+        with the seated guest's meal.
+        """
+        from apps.wedding_planner.models import Guest
+        from apps.wedding_planner.models import Table as WeddingTable
+        from apps.wedding_planner.models.meal_model import MealChoice
+        from apps.wedding_planner.models.seating_model import SeatingAssignment
+        
+        meal_type_labels = dict(MealChoice.MealType.choices)
+        
+        guests = list(
+            Guest.objects.filter(wedding=self.wedding, attendance_status='yes')
+            .order_by('last_name', 'first_name')
+            .values(
+                'first_name',
+                'last_name',
+                'dietary_restrictions',
+                'is_plus_one_coming',
+                'plus_one_name',
+                'meal_selection__id',
+                'meal_selection__meal_choice__name',
+                'meal_selection__meal_choice__meal_type',
+            )
+        )
+        for guest in guests:
+            guest['has_selection'] = guest.pop('meal_selection__id') is not None
+            guest['meal_name'] = guest.pop('meal_selection__meal_choice__name')
+            meal_type = guest.pop('meal_selection__meal_choice__meal_type')
+            guest['meal_type'] = meal_type_labels.get(meal_type, meal_type)
+        
+        tables = list(
+            WeddingTable.objects.filter(wedding=self.wedding)
+            .order_by('table_number')
+            .values('id', 'table_number', 'name', 'is_vip', 'location', 'capacity')
+        )
+        
+        assignments = defaultdict(list)
+        for row in (
+            SeatingAssignment.objects.filter(table__wedding=self.wedding)
+            .order_by('table__table_number', 'seat_number', 'id')
+            .values(
+                'table_id',
+                'attendee_type',
+                'guest__first_name',
+                'guest__last_name',
+                'guest__meal_selection__meal_choice__name',
+            )
+        ):
+            assignments[row['table_id']].append({
+                'name': f"{row['guest__first_name']} {row['guest__last_name']}",
+                'attendee_type': row['attendee_type'],
+                'meal_name': row['guest__meal_selection__meal_choice__name'],
+            })
+        for table in tables:
+            table['assignments'] = assignments.get(table['id'], [])
+            table['seats_taken'] = len(table['assignments'])
+        
+        self.snapshot = {'guests': guests, 'tables': tables}
+        return self.snapshot
+    
+    def generate_full_report(self, output=None):
+        """
+        Generate a complete wedding report PDF.
+        
+        Writes to ``output`` (a binary file object) or, by default, to a new
+        temporary file. Returns the file rewound to the start.
+        """
+        if self.snapshot is None:
+            self.load_snapshot()
+        
+        if output is None:
+            output = tempfile.TemporaryFile(suffix='.pdf')
         doc = SimpleDocTemplate(
-            buffer,
+            output,
             pagesize=A4,
             rightMargin=1.5*cm,
             leftMargin=1.5*cm,
@@ -97,24 +239,17 @@ class WeddingPDFReport:
         
         # Build PDF
         doc.build(elements)
-        buffer.seek(0)
-        return buffer
+        output.seek(0)
+        return output
     
     def _build_meal_section(self):
         """Build the meal selections section."""
-        from apps.wedding_planner.models import Guest
-        from apps.wedding_planner.models.meal_model import GuestMealSelection
-        
         elements = []
         elements.append(Paragraph("Guest Meal Selections", self.styles['SectionTitle']))
         
-        # Get all confirmed guests with their meal selections
-        guests = Guest.objects.filter(
-            wedding=self.wedding,
-            attendance_status='yes'
-        ).order_by('last_name', 'first_name')
+        guests = self.snapshot['guests']
         
-        if not guests.exists():
+        if not guests:
             elements.append(Paragraph("No confirmed guests yet.", self.styles['Normal']))
             return elements
         
@@ -122,41 +257,18 @@ class WeddingPDFReport:
         table_data = [['Guest Name', 'Meal Selection', 'Dietary Notes']]
         
         for guest in guests:
-            name = f"{guest.first_name} {guest.last_name}"
-            
-            # Get meal selection
-            try:
-                meal_selection = guest.meal_selection
-                meal_name = meal_selection.meal_choice.name if meal_selection.meal_choice else "Not selected"
-            except GuestMealSelection.DoesNotExist:
-                meal_name = "Not selected"
-            
-            dietary = guest.dietary_restrictions or "-"
+            name = f"{guest['first_name']} {guest['last_name']}"
+            meal_name = guest['meal_name'] or "Not selected"
+            dietary = guest['dietary_restrictions'] or "-"
             
             table_data.append([name, meal_name, dietary[:50]])  # Truncate long dietary notes
             
             # Add plus one if coming
-            if guest.is_plus_one_coming and guest.plus_one_name:
-                table_data.append([f"  + {guest.plus_one_name}", "Not selected", "-"])
-        
-        # Create table
-        meal_table = Table(table_data, colWidths=[6*cm, 5*cm, 6*cm])
-        meal_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#be123c')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('TOPPADDING', (0, 1), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')]),
-        ]))
+            if guest['is_plus_one_coming'] and guest['plus_one_name']:
+                table_data.append([f"  + {guest['plus_one_name']}", "Not selected", "-"])
         
-        elements.append(meal_table)
+        # Create table(s)
+        elements.extend(chunked_tables(table_data, [6*cm, 5*cm, 6*cm], MEAL_TABLE_STYLE))
         
         # Meal summary
         elements.append(Spacer(1, 20))
@@ -164,13 +276,10 @@ class WeddingPDFReport:
         
         meal_counts = {}
         for guest in guests:
-            try:
-                meal_selection = guest.meal_selection
-                if meal_selection.meal_choice:
-                    meal_type = meal_selection.meal_choice.get_meal_type_display()
-                    meal_counts[meal_type] = meal_counts.get(meal_type, 0) + 1
-            except:
+            if not guest['has_selection']:
                 meal_counts['Not selected'] = meal_counts.get('Not selected', 0) + 1
+            elif guest['meal_type']:
+                meal_counts[guest['meal_type']] = meal_counts.get(guest['meal_type'], 0) + 1
         
         if meal_counts:
             summary_data = [['Meal Type', 'Count']]
@@ -179,48 +288,35 @@ class WeddingPDFReport:
             summary_data.append(['Total', str(sum(meal_counts.values()))])
             
             summary_table = Table(summary_data, colWidths=[8*cm, 3*cm])
-            summary_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6b7280')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
-                ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#f3f4f6')),
-            ]))
+            summary_table.setStyle(MEAL_SUMMARY_STYLE)
             elements.append(summary_table)
         
         return elements
     
     def _build_seating_section(self):
         """Build the table seating section."""
-        from apps.wedding_planner.models import Table as WeddingTable
-        from apps.wedding_planner.models.seating_model import SeatingAssignment
-        
         elements = []
         elements.append(Paragraph("Table Seating Arrangements", self.styles['SectionTitle']))
         
-        # Get all tables
-        tables = WeddingTable.objects.filter(wedding=self.wedding).order_by('table_number')
+        tables = self.snapshot['tables']
         
-        if not tables.exists():
+        if not tables:
             elements.append(Paragraph("No tables created yet.", self.styles['Normal']))
             return elements
         
         for table in tables:
             # Table header
-            table_name = f"Table {table.table_number}"
-            if table.name:
-                table_name += f" - {table.name}"
-            if table.is_vip:
+            table_name = f"Table {table['table_number']}"
+            if table['name']:
+                table_name += f" - {table['name']}"
+            if table['is_vip']:
                 table_name += " (VIP)"
             
             elements.append(Paragraph(table_name, self.styles['SubSection']))
             
             # Table info
-            location = f"Location: {table.location}" if table.location else ""
-            capacity_info = f"Capacity: {table.seats_taken}/{table.capacity}"
+            location = f"Location: {table['location']}" if table['location'] else ""
+            capacity_info = f"Capacity: {table['seats_taken']}/{table['capacity']}"
             if location:
                 elements.append(Paragraph(f"{location} | {capacity_info}", self.styles['Normal']))
             else:
@@ -228,43 +324,27 @@ class WeddingPDFReport:
             
             elements.append(Spacer(1, 5))
             
-            # Get seated guests
-            assignments = SeatingAssignment.objects.filter(table=table).select_related('guest')
+            assignments = table['assignments']
             
-            if assignments.exists():
+            if assignments:
                 guest_data = [['#', 'Guest Name', 'Type', 'Meal']]
                 
                 for i, assignment in enumerate(assignments, 1):
-                    guest = assignment.guest
-                    name = f"{guest.first_name} {guest.last_name}"
-                    
                     # Attendee type
-                    if assignment.attendee_type == 'guest':
+                    if assignment['attendee_type'] == 'guest':
                         att_type = "Guest"
-                    elif assignment.attendee_type == 'plus_one':
+                    elif assignment['attendee_type'] == 'plus_one':
                         att_type = "Plus One"
                     else:
                         att_type = "Child"
                     
-                    # Meal
-                    try:
-                        meal = guest.meal_selection.meal_choice.name if guest.meal_selection.meal_choice else "-"
-                    except:
-                        meal = "-"
+                    meal = assignment['meal_name'] or "-"
                     
-                    guest_data.append([str(i), name, att_type, meal])
+                    guest_data.append([str(i), assignment['name'], att_type, meal])
                 
-                guest_table = Table(guest_data, colWidths=[1*cm, 6*cm, 3*cm, 5*cm])
-                guest_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f3f4f6')),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 8),
-                    ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
-                    ('TOPPADDING', (0, 0), (-1, -1), 4),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-                ]))
-                elements.append(guest_table)
+                elements.extend(chunked_tables(
+                    guest_data, [1*cm, 6*cm, 3*cm, 5*cm], SEATING_TABLE_STYLE
+                ))
             else:
                 elements.append(Paragraph("No guests assigned to this table.", self.styles['Normal']))
             
@@ -274,16 +354,19 @@ class WeddingPDFReport:
         elements.append(Spacer(1, 10))
         elements.append(Paragraph("Seating Summary", self.styles['SubSection']))
         
-        total_capacity = sum(t.capacity for t in tables)
-        total_seated = sum(t.seats_taken for t in tables)
+        total_capacity = sum(t['capacity'] for t in tables)
+        total_seated = sum(t['seats_taken'] for t in tables)
         
-        summary_text = f"Total Tables: {tables.count()} | Total Capacity: {total_capacity} | Seated: {total_seated} | Available: {total_capacity - total_seated}"
+        summary_text = f"Total Tables: {len(tables)} | Total Capacity: {total_capacity} | Seated: {total_seated} | Available: {total_capacity - total_seated}"
         elements.append(Paragraph(summary_text, self.styles['Normal']))
         
         return elements
 
 
-def generate_wedding_report_pdf(wedding):
-    """Generate a complete wedding report PDF."""
+def generate_wedding_report_pdf(wedding, output=None):
+    """
+    Generate a complete wedding report PDF.
+    Returns a file object (a temporary file unless ``output`` is given).
+    """
     report = WeddingPDFReport(wedding)
-    return report.generate_full_report()
+    return report.generate_full_report(output)
@@ -0,0 +1,137 @@
+"""
+Portal Summary Service - Meal, table and guest counts from grouped queries.
+
+The meal filter bars (restaurant portal and couple dashboard) and the
+portal summary show a count per meal type, restaurant status, client
+status, created-by and overall status. Instead of one COUNT per choice,
+meals are grouped once by all of those columns and every facet is folded
+out of the resulting rows in Python. Tables and guests get one aggregate
+each.
+"""
+from collections import Counter
+
+from django.db.models import Count, Sum
+
+from apps.wedding_planner.models import Guest, MealChoice, SeatingAssignment, Table
+
+
+class PortalSummaryService:
+    """
+    Builds filter and summary counts shared by the portal and meal views.
+    """
+
+    MEAL_FACETS = (
+        "meal_type",
+        "restaurant_status",
+        "client_status",
+        "created_by",
+        "request_status",
+    )
+
+    @classmethod
+    def meal_counts(cls, meals) -> dict:
+        """
+        Count meals per value of every facet with a single grouped query.
+
+        Returns ``{"total": n, "<facet>": Counter({value: n, ...}), ...}``.
+        """
+        rows = meals.values(*cls.MEAL_FACETS).annotate(count=Count("id")).order_by()
+
+        counts = {facet: Counter() for facet in cls.MEAL_FACETS}
+        total = 0
+        for row in rows:
+            total += row["count"]
+            for facet in cls.MEAL_FACETS:
+                counts[facet][row[facet]] += row["count"]
+        counts["total"] = total
+        return counts
+
+    @staticmethod
+    def choice_options(counts, choices, all_label=None, total=0) -> list:
+        """
+        Turn facet counts into ``[{"value", "label", "count"}, ...]`` in
+        choice order, optionally led by an "all" entry.
+        """
+        options = []
+        if all_label:
+            options.append({"value": "all", "label": all_label, "count": total})
+        for value, label in choices:
+            options.append({"value": value, "label": label, "count": counts.get(value, 0)})
+        return options
+
+    @classmethod
+    def meal_filters(cls, meals) -> dict:
+        """Filter options for the restaurant portal meal list."""
+        counts = cls.meal_counts(meals)
+        total = counts["total"]
+        return {
+            "meal_types": cls.choice_options(
+                counts["meal_type"], MealChoice.MealType.choices, "All Types", total
+            ),
+            "restaurant_statuses": cls.choice_options(
+                counts["restaurant_status"], MealChoice.RequestStatus.choices, "All", total
+            ),
+            "client_statuses": cls.choice_options(
+                counts["client_status"], MealChoice.RequestStatus.choices, "All", total
+            ),
+            "created_by": cls.choice_options(
+                counts["created_by"], MealChoice.CreatedBy.choices, "All", total
+            ),
+        }
+
+    @classmethod
+    def table_totals(cls, wedding) -> dict:
+        """Table count, total capacity and seats taken for a wedding."""
+        totals = Table.objects.filter(wedding=wedding).aggregate(
+            count=Count("id"),
+            total_capacity=Sum("capacity"),
+        )
+        return {
+            "count": totals["count"],
+            "total_capacity": totals["total_capacity"] or 0,
+            "total_seats_taken": SeatingAssignment.objects.filter(
+                table__wedding=wedding
+            ).count(),
+        }
+
+    @classmethod
+    def guest_counts(cls, wedding) -> dict:
+        """Guest counts per attendance status."""
+        rows = (
+            Guest.objects.filter(wedding=wedding)
+            .values("attendance_status")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+        return {row["attendance_status"]: row["count"] for row in rows}
+
+    @classmethod
+    def summary(cls, wedding, token) -> dict:
+        """Portal overview, limited to what the access token may see."""
+        data = {
+            "wedding_name": f"{wedding.partner1_name} & {wedding.partner2_name}",
+            "wedding_date": wedding.wedding_date,
+        }
+
+        if token.can_manage_tables:
+            data["tables"] = cls.table_totals(wedding)
+
+        if token.can_manage_meals:
+            counts = cls.meal_counts(MealChoice.objects.filter(wedding=wedding))
+            data["meals"] = {
+                "count": counts["total"],
+                "by_type": {
+                    label: counts["meal_type"][value]
+                    for value, label in MealChoice.MealType.choices
+                    if counts["meal_type"][value]
+                },
+            }
+
+        if token.can_view_guest_count:
+            guests = cls.guest_counts(wedding)
+            data["guests"] = {
+                "confirmed": guests.get("yes", 0),
+                "pending": guests.get("pending", 0),
+            }
+
+        return data
@@ -0,0 +1,117 @@
+"""
+Restaurant Access Service - Cached token lookup and buffered access tracking.
+
+The restaurant portal polls tables and meals constantly. Two things keep
+those reads from hitting the token row on every request:
+
+- Token lookup: tokens (with their wedding) are cached by access_code for
+  a short TTL. Token saves/deletes drop the cached entry (see signals.py),
+  and validity (active flag, expiry) is still evaluated on every request.
+  The drop only reaches every worker through a shared cache, so without
+  CACHE_URL tokens are read from the database each time and deactivating
+  or regenerating a link applies immediately.
+- Access tracking: hits are counted in process memory instead of an
+  UPDATE per request. The first hit more than RESTAURANT_ACCESS_FLUSH_SECONDS
+  after the oldest buffered one writes the buffer out, in that request, as
+  a single ``F()`` increment per token. Counts of a worker that gets no
+  more portal hits wait for its next one, and up to one interval of hits
+  is lost when a worker stops. ``RESTAURANT_ACCESS_FLUSH_SECONDS=0`` writes
+  every hit straight away.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import F
+from django.utils import timezone
+
+from apps.commons.cache import cache_is_shared
+from apps.wedding_planner.models.restaurant_access_model import RestaurantAccessToken
+
+TOKEN_CACHE_KEY = "restaurant_token:{access_code}"
+
+
+class RestaurantAccessService:
+    """
+    Token lookup and access counting for the restaurant portal.
+    """
+
+    TOKEN_CACHE_TTL = 60
+
+    _pending = {}  # token_id -> [hits, last_accessed_at]
+    _lock = threading.Lock()
+    _buffered_since = None  # time.monotonic() of the oldest buffered hit
+
+    @classmethod
+    def get_token(cls, access_code):
+        """Return the token (with wedding) for an access code, or None."""
+        if not cache_is_shared():
+            return cls._load_token(access_code)
+        key = TOKEN_CACHE_KEY.format(access_code=access_code)
+        token = cache.get(key)
+        if token is None:
+            token = cls._load_token(access_code)
+            if token is None:
+                return None
+            cache.set(key, token, cls.TOKEN_CACHE_TTL)
+        return token
+
+    @staticmethod
+    def _load_token(access_code):
+        return (
+            RestaurantAccessToken.objects.using(DEFAULT_DB_ALIAS)
+            .select_related("wedding")
+            .filter(access_code=access_code)
+            .first()
+        )
+
+    @classmethod
+    def invalidate(cls, *access_codes):
+        """Drop cached tokens for the given access codes."""
+        keys = [
+            TOKEN_CACHE_KEY.format(access_code=code)
+            for code in access_codes
+            if code
+        ]
+        if keys:
+            cache.delete_many(keys)
+
+    @classmethod
+    def record_access(cls, token):
+        """
+        Count a portal hit for the token.
+        Buffered in memory; written out by flush() once the interval passes.
+        """
+        now = timezone.now()
+        with cls._lock:
+            entry = cls._pending.setdefault(token.pk, [0, now])
+            entry[0] += 1
+            entry[1] = now
+            if cls._buffered_since is None:
+                cls._buffered_since = time.monotonic()
+            due = time.monotonic() - cls._buffered_since >= cls.flush_interval()
+        if due:
+            cls.flush()
+
+    @classmethod
+    def flush(cls) -> int:
+        """
+        Write buffered hits: one UPDATE per token with an F() increment.
+        Returns the number of tokens written.
+        """
+        with cls._lock:
+            pending, cls._pending = cls._pending, {}
+            cls._buffered_since = None
+
+        for token_id, (hits, last_accessed_at) in pending.items():
+            RestaurantAccessToken.objects.filter(pk=token_id).update(
+                access_count=F("access_count") + hits,
+                last_accessed_at=last_accessed_at,
+            )
+        return len(pending)
+
+    @classmethod
+    def flush_interval(cls) -> float:
+        return getattr(settings, "RESTAURANT_ACCESS_FLUSH_SECONDS", 60)
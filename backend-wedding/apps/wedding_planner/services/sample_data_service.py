@@ -0,0 +1,287 @@
+"""
+Sample Data Service - Synthetic weddings at a configurable scale.
+
+Used by the seed_sample_data / benchmark_endpoints commands and the
+query-count tests. Everything below the wedding is written with
+bulk_create, so large sizes seed quickly; fields that save() or the
+serializers would normally maintain (email normalisation, todo
+priority_order and progress counters, vendor slug/geohash) are filled in
+directly.
+
+Per wedding:
+- guests (a mix of RSVP states) with plus-ones and children,
+- tables with seating assignments for every attending guest, plus-one
+  and (as seating allows one child per guest) the first child,
+- meal choices and a selection for most attending guests,
+- todo categories and todos with checklist items,
+- a gift registry with items (some claimed by guests),
+- notifications for the owner,
+- an active restaurant access token.
+
+Vendors are global; seed_vendors() creates them once per run and
+seed_wedding() saves some of them for the owner.
+"""
+import random
+from datetime import timedelta
+from decimal import Decimal
+
+from django.utils import timezone
+
+from apps.commons.models import User
+from apps.todo_list_wedding.models import Todo, TodoCategory, TodoChecklist
+from apps.wedding_planner.models import (
+    AttendanceStatus,
+    Child,
+    GiftRegistry,
+    Guest,
+    GuestMealSelection,
+    MealChoice,
+    Notification,
+    RegistryItem,
+    RestaurantAccessToken,
+    SavedVendor,
+    SeatingAssignment,
+    Table,
+    Vendor,
+    VendorCategory,
+    Wedding,
+)
+from apps.wedding_planner.services.geo_service import encode_geohash
+
+BATCH_SIZE = 2000
+
+MEALS = [
+    ("Beef Tenderloin", MealChoice.MealType.MEAT),
+    ("Sea Bass", MealChoice.MealType.FISH),
+    ("Mushroom Risotto", MealChoice.MealType.VEGETARIAN),
+    ("Kids Pasta", MealChoice.MealType.KIDS),
+]
+TODO_CATEGORIES = ["Venue", "Catering", "Attire", "Decor", "Music", "Paperwork"]
+TODO_WORDS = (
+    "book confirm call pay review order schedule venue caterer florist "
+    "photographer band cake dress suit rings invitations menu tasting "
+    "deposit contract rehearsal flights hotel decor lighting favors"
+).split()
+
+
+class SampleDataService:
+    """
+    Bulk synthetic data for benchmarks and query-count tests.
+    """
+
+    @classmethod
+    def create_owner(cls, email=None):
+        """A wedding owner with an unusable password."""
+        email = email or f"sample-owner-{random.randint(0, 10**9)}@example.com"
+        return User.objects.create_user(email=email, password=None)
+
+    @classmethod
+    def seed_vendors(cls, count, prefix="sample"):
+        """``count`` vendors in one category, spread over Thailand."""
+        category, _ = VendorCategory.objects.get_or_create(
+            slug=f"{prefix}-vendors",
+            defaults={"name": f"{prefix.title()} Vendors"},
+        )
+        vendors = []
+        for i in range(count):
+            lat, lng = random.uniform(5.6, 20.4), random.uniform(97.3, 105.6)
+            vendors.append(Vendor(
+                name=f"{prefix.title()} Vendor {i}",
+                slug=f"{prefix}-vendor-{i}",
+                category=category,
+                city=random.choice(["Bangkok", "Chiang Mai", "Phuket", "Krabi"]),
+                latitude=round(lat, 6),
+                longitude=round(lng, 6),
+                geohash=encode_geohash(lat, lng),
+                min_price=Decimal(random.randint(5, 50) * 1000),
+            ))
+        return Vendor.objects.bulk_create(vendors, batch_size=BATCH_SIZE)
+
+    @classmethod
+    def seed_wedding(
+        cls,
+        owner,
+        guests=200,
+        children_per_family=2,
+        family_rate=0.2,
+        plus_one_rate=0.3,
+        table_size=10,
+        todos=100,
+        checklist_items=4,
+        registry_items=50,
+        notifications=50,
+        vendors=(),
+        label="sample",
+    ):
+        """
+        Create one wedding for ``owner`` with related data at the given
+        sizes and return it.
+        """
+        wedding = Wedding.objects.create(
+            owner=owner,
+            partner1_name="Alex",
+            partner2_name="Sam",
+            slug=f"{label}-{owner.pk}-{random.randint(0, 10**9)}",
+            wedding_date=timezone.now().date() + timedelta(days=120),
+        )
+        guest_rows = cls._seed_guests(wedding, guests, children_per_family, family_rate, plus_one_rate)
+        cls._seed_meals_and_seating(wedding, guest_rows, table_size)
+        cls._seed_todos(wedding, todos, checklist_items)
+        cls._seed_registry(wedding, guest_rows, registry_items)
+        Notification.objects.bulk_create([
+            Notification(
+                user=owner,
+                wedding=wedding,
+                notification_type=random.choice(Notification.NotificationType.values),
+                title=f"Notification {i}",
+                message="Something happened in your wedding plan.",
+                is_read=random.random() < 0.5,
+            )
+            for i in range(notifications)
+        ], batch_size=BATCH_SIZE)
+        SavedVendor.objects.bulk_create(
+            [SavedVendor(user=owner, vendor=vendor) for vendor in vendors],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        RestaurantAccessToken.objects.create(
+            wedding=wedding,
+            name="Main Caterer",
+            restaurant_name="Harbor Catering",
+        )
+        return wedding
+
+    @classmethod
+    def _seed_guests(cls, wedding, count, children_per_family, family_rate, plus_one_rate):
+        statuses = [AttendanceStatus.YES, AttendanceStatus.PENDING, AttendanceStatus.NO]
+        guests = []
+        for i in range(count):
+            plus_one = random.random() < plus_one_rate
+            guests.append(Guest(
+                wedding=wedding,
+                first_name=f"Guest{i}",
+                last_name=f"Family{i % 97}",
+                email=f"guest{i}@example.com",
+                attendance_status=random.choices(statuses, weights=[70, 20, 10])[0],
+                is_plus_one_coming=plus_one,
+                plus_one_name=f"Partner{i}" if plus_one else None,
+                has_children=children_per_family > 0 and random.random() < family_rate,
+                dietary_restrictions="No nuts" if i % 11 == 0 else None,
+            ))
+        guests = Guest.objects.bulk_create(guests, batch_size=BATCH_SIZE)
+        Child.objects.bulk_create([
+            Child(guest=guest, first_name=f"Child{n}", age=random.randint(1, 15))
+            for guest in guests
+            if guest.has_children
+            for n in range(children_per_family)
+        ], batch_size=BATCH_SIZE)
+        return guests
+
+    @classmethod
+    def _seed_meals_and_seating(cls, wedding, guests, table_size):
+        meals = MealChoice.objects.bulk_create([
+            MealChoice(wedding=wedding, name=name, meal_type=meal_type)
+            for name, meal_type in MEALS
+        ])
+        attending = [guest for guest in guests if guest.attendance_status == AttendanceStatus.YES]
+        GuestMealSelection.objects.bulk_create([
+            GuestMealSelection(guest=guest, meal_choice=random.choice(meals[:3]))
+            for guest in attending
+            if random.random() < 0.9
+        ], batch_size=BATCH_SIZE)
+
+        children = Child.objects.filter(
+            guest__wedding=wedding, guest__attendance_status=AttendanceStatus.YES
+        )
+        attendees = [(guest, SeatingAssignment.AttendeeType.GUEST, None) for guest in attending]
+        attendees += [
+            (guest, SeatingAssignment.AttendeeType.PLUS_ONE, None)
+            for guest in attending
+            if guest.is_plus_one_coming
+        ]
+        # (guest, attendee_type) is unique, so only one child per family gets a seat
+        by_id = {guest.id: guest for guest in attending}
+        seated_families = set()
+        for child in children:
+            if child.guest_id not in seated_families:
+                seated_families.add(child.guest_id)
+                attendees.append((by_id[child.guest_id], SeatingAssignment.AttendeeType.CHILD, child))
+        if not attendees:
+            return
+
+        table_count = -(-len(attendees) // table_size)
+        tables = Table.objects.bulk_create([
+            Table(wedding=wedding, table_number=n, capacity=table_size)
+            for n in range(1, table_count + 1)
+        ])
+        SeatingAssignment.objects.bulk_create([
+            SeatingAssignment(
+                guest=guest,
+                table=tables[i // table_size],
+                attendee_type=attendee_type,
+                child=child,
+                seat_number=i % table_size + 1,
+            )
+            for i, (guest, attendee_type, child) in enumerate(attendees)
+        ], batch_size=BATCH_SIZE)
+
+    @classmethod
+    def _seed_todos(cls, wedding, count, checklist_items):
+        categories = TodoCategory.objects.bulk_create([
+            TodoCategory(wedding=wedding, name=name, order=n)
+            for n, name in enumerate(TODO_CATEGORIES)
+        ])
+        today = timezone.now().date()
+        statuses = Todo.Status.values
+        priorities = Todo.Priority.values
+        todos = []
+        for i in range(count):
+            status = random.choices(statuses, weights=[30, 25, 10, 30, 5])[0]
+            priority = random.choice(priorities)
+            done = random.randint(0, checklist_items) if checklist_items else 0
+            todos.append(Todo(
+                wedding=wedding,
+                category=random.choice(categories),
+                title=" ".join(random.choices(TODO_WORDS, k=3)).capitalize(),
+                description=" ".join(random.choices(TODO_WORDS, k=12)),
+                status=status,
+                priority=priority,
+                priority_order=Todo.priority_order_for(priority),
+                due_date=today + timedelta(days=random.randint(-30, 150)),
+                completed_at=timezone.now() if status == Todo.Status.COMPLETED else None,
+                is_pinned=random.random() < 0.05,
+                checklist_total=checklist_items,
+                checklist_completed=done,
+                progress_percent=Todo.compute_progress(done, checklist_items) or 0,
+            ))
+        todos = Todo.objects.bulk_create(todos, batch_size=BATCH_SIZE)
+        TodoChecklist.objects.bulk_create([
+            TodoChecklist(
+                todo=todo,
+                title=f"Step {n + 1}",
+                is_completed=n < todo.checklist_completed,
+                completed_at=timezone.now() if n < todo.checklist_completed else None,
+                order=n,
+            )
+            for todo in todos
+            for n in range(checklist_items)
+        ], batch_size=BATCH_SIZE)
+
+    @classmethod
+    def _seed_registry(cls, wedding, guests, count):
+        registry = GiftRegistry.objects.create(wedding=wedding)
+        categories = RegistryItem.Category.values
+        items = []
+        for i in range(count):
+            claimer = random.choice(guests) if guests and random.random() < 0.3 else None
+            items.append(RegistryItem(
+                registry=registry,
+                name=f"Registry item {i}",
+                price=Decimal(random.randint(10, 500)),
+                category=random.choice(categories),
+                is_claimed=claimer is not None,
+                claimed_by=claimer,
+                claimed_at=timezone.now() if claimer else None,
+                display_order=i,
+            ))
+        RegistryItem.objects.bulk_create(items, batch_size=BATCH_SIZE)
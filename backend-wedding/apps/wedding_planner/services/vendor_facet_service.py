@@ -0,0 +1,167 @@
+"""
+Vendor Facet Service - Cached vendor directory facets.
+
+The vendor catalog changes rarely, yet the directory pages show counts per
+category, category type, city and flag on every view. All of those facets
+are computed from one grouped query over active vendors, stored in the
+cache under a version number and memoized in process memory.
+
+Saving or deleting a Vendor or VendorCategory bumps the version (see
+signals.py), so every process recomputes on its next read.
+"""
+import threading
+import time
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Count
+
+from apps.wedding_planner.models import Vendor, VendorCategory
+
+VERSION_KEY = "vendor_facets:version"
+FACETS_KEY = "vendor_facets:{version}"
+
+# Safety net for writes that bypass signals (QuerySet.update, raw SQL)
+FACETS_TTL_SECONDS = 300
+
+# Vendor fields whose changes do not affect any facet
+NON_FACET_FIELDS = {"average_rating", "review_count", "rating_sum", "updated_at"}
+
+
+class VendorFacetService:
+    """
+    Computes and caches vendor directory facets.
+    """
+
+    _memo = {"version": None, "expires_at": 0.0, "facets": None}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_facets(cls) -> dict:
+        """Return the current facets, recomputing only when stale."""
+        version = cls._current_version()
+        now = time.monotonic()
+        memo = cls._memo
+        if memo["version"] == version and memo["expires_at"] > now:
+            return memo["facets"]
+
+        key = FACETS_KEY.format(version=version)
+        facets = cache.get(key)
+        if facets is None:
+            facets = cls.compute_facets()
+            cache.set(key, facets, FACETS_TTL_SECONDS)
+
+        with cls._lock:
+            cls._memo = {
+                "version": version,
+                "expires_at": now + FACETS_TTL_SECONDS,
+                "facets": facets,
+            }
+        return facets
+
+    @classmethod
+    def invalidate(cls):
+        """Bump the facet version so all processes recompute."""
+        cls._current_version()
+        try:
+            cache.incr(VERSION_KEY)
+        except ValueError:
+            # Key evicted between the read and incr
+            cache.set(VERSION_KEY, int(time.time() * 1000), None)
+        with cls._lock:
+            cls._memo = {"version": None, "expires_at": 0.0, "facets": None}
+
+    @classmethod
+    def compute_facets(cls) -> dict:
+        """
+        Build every directory facet from one grouped vendor query
+        plus one query for the (small) category list.
+        """
+        rows = (
+            Vendor.objects.using(DEFAULT_DB_ALIAS)
+            .filter(is_active=True)
+            .values("category_id", "city", "country", "is_verified", "is_eco_friendly")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+
+        total = verified = eco = 0
+        by_category = defaultdict(int)
+        by_city = defaultdict(int)
+        for row in rows:
+            count = row["count"]
+            total += count
+            if row["is_verified"]:
+                verified += count
+            if row["is_eco_friendly"]:
+                eco += count
+            by_category[row["category_id"]] += count
+            if row["city"]:
+                by_city[(row["city"], row["country"])] += count
+
+        all_categories = (
+            VendorCategory.objects.using(DEFAULT_DB_ALIAS)
+            .order_by("-is_featured", "sort_order", "name")
+            .values("id", "name", "slug", "category_type", "icon", "is_active")
+        )
+        # Vendors of inactive categories still count towards type totals,
+        # matching the previous per-type queries.
+        category_types = {}
+        categories = []
+        for category in all_categories:
+            category_types[category["id"]] = category["category_type"]
+            if category.pop("is_active"):
+                categories.append(category)
+
+        categories_per_type = defaultdict(int)
+        for category in categories:
+            category["vendor_count"] = by_category.get(category["id"], 0)
+            categories_per_type[category["category_type"]] += 1
+
+        vendors_per_type = defaultdict(int)
+        for category_id, count in by_category.items():
+            vendors_per_type[category_types.get(category_id)] += count
+
+        type_distribution = []
+        type_options = []
+        for value, label in VendorCategory.CategoryType.choices:
+            if vendors_per_type.get(value):
+                type_distribution.append({
+                    "type": value,
+                    "label": label,
+                    "count": vendors_per_type[value],
+                })
+            type_options.append({
+                "value": value,
+                "label": label,
+                "count": categories_per_type.get(value, 0),
+            })
+
+        cities = [
+            {"city": city, "country": country, "count": count}
+            for (city, country), count in sorted(
+                by_city.items(), key=lambda item: -item[1]
+            )
+        ]
+
+        return {
+            "total_vendors": total,
+            "verified_vendors": verified,
+            "eco_friendly_vendors": eco,
+            "categories": categories,
+            "total_categories": sum(1 for c in categories if c["vendor_count"] > 0),
+            "category_type_distribution": type_distribution,
+            "category_types": type_options,
+            "cities": cities,
+            "city_names": sorted({city for city, _ in by_city}),
+        }
+
+    @classmethod
+    def _current_version(cls) -> int:
+        version = cache.get(VERSION_KEY)
+        if version is None:
+            # Seed with a timestamp so a flushed cache never reuses an old key
+            cache.add(VERSION_KEY, int(time.time() * 1000), None)
+            version = cache.get(VERSION_KEY)
+        return version
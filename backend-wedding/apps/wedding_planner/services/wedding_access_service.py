@@ -0,0 +1,140 @@
+"""
+Wedding Access Service - Which weddings a user can reach, resolved once.
+
+Views used to check access with a ``wedding__owner=user`` join (or a
+``Wedding.objects.get(id=..., owner=user)``) in every get_queryset,
+get_serializer_context, perform_create and action. Instead the user's
+weddings are resolved once per request into a WeddingAccess:
+
+- weddings the user owns (role "owner"),
+- weddings whose WeddingTeam the user is an active TeamMember of (with
+  their TeamMember role).
+
+The result is memoized on the request. With a shared cache (CACHE_URL)
+it is also cached per user, and saving or deleting a Wedding,
+WeddingTeam or TeamMember drops the affected users' entries (see
+signals.py). A per-process cache would only be invalidated in the
+worker that handled the change, so without a shared cache the roles are
+read per request. Either way a lookup that would be denied reloads the
+roles once first, so a wedding created a moment ago is never refused.
+
+Viewer members can read; writes need the owner or an editing role.
+"""
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from apps.commons.cache import cache_is_shared
+from apps.wedding_planner.models import TeamMember, Wedding
+
+ACCESS_CACHE_KEY = "wedding_access:{user_id}"
+
+OWNER = "owner"
+EDIT_ROLES = {
+    OWNER,
+    TeamMember.Role.OWNER,
+    TeamMember.Role.PARTNER,
+    TeamMember.Role.PLANNER,
+    TeamMember.Role.EDITOR,
+}
+
+
+class WeddingAccess:
+    """
+    The weddings one user can reach: wedding id -> role.
+    """
+
+    __slots__ = ("roles", "_weddings", "_reload")
+
+    def __init__(self, roles, reload=None):
+        self.roles = roles
+        self._weddings = {}
+        # Called (once) for fresh roles before denying a lookup
+        self._reload = reload
+
+    def wedding_ids(self, write=False):
+        """Ids of the weddings the user can read (or, with write, edit)."""
+        if not write:
+            return list(self.roles)
+        return [wedding_id for wedding_id, role in self.roles.items() if role in EDIT_ROLES]
+
+    def resolve(self, wedding_id, write=False):
+        """``wedding_id`` as an int if the user can reach it, else None."""
+        try:
+            wedding_id = int(wedding_id)
+        except (TypeError, ValueError):
+            return None
+        if not self._allows(wedding_id, write) and self._reload is not None:
+            self.roles, self._reload = self._reload(), None
+        return wedding_id if self._allows(wedding_id, write) else None
+
+    def _allows(self, wedding_id, write):
+        role = self.roles.get(wedding_id)
+        return role is not None and (not write or role in EDIT_ROLES)
+
+    def get_wedding(self, wedding_id, write=False):
+        """The Wedding, loaded at most once per request, or None."""
+        wedding_id = self.resolve(wedding_id, write)
+        if wedding_id is None:
+            return None
+        if wedding_id not in self._weddings:
+            self._weddings[wedding_id] = Wedding.objects.filter(id=wedding_id).first()
+        return self._weddings[wedding_id]
+
+
+class WeddingAccessService:
+    """
+    Resolves and caches WeddingAccess per user and request.
+    """
+
+    CACHE_TTL = 60
+
+    @classmethod
+    def for_request(cls, request):
+        """The WeddingAccess of the request's user, memoized on the request."""
+        http_request = getattr(request, "_request", request)
+        user = request.user
+        access = getattr(http_request, "_wedding_access", None)
+        if access is None or access[0] != user.pk:
+            access = (user.pk, cls.for_user(user))
+            http_request._wedding_access = access
+        return access[1]
+
+    @classmethod
+    def for_user(cls, user):
+        if not user.is_authenticated:
+            return WeddingAccess({})
+        if not cache_is_shared():
+            return WeddingAccess(cls._load_roles(user.pk))
+
+        key = ACCESS_CACHE_KEY.format(user_id=user.pk)
+        roles = cache.get(key)
+        if roles is None:
+            return WeddingAccess(cls._refresh(user.pk))
+        return WeddingAccess(roles, reload=lambda: cls._refresh(user.pk))
+
+    @classmethod
+    def _refresh(cls, user_id):
+        roles = cls._load_roles(user_id)
+        cache.set(ACCESS_CACHE_KEY.format(user_id=user_id), roles, cls.CACHE_TTL)
+        return roles
+
+    @staticmethod
+    def _load_roles(user_id):
+        """wedding id -> role, from the database."""
+        roles = dict(
+            TeamMember.objects.using(DEFAULT_DB_ALIAS).filter(
+                user_id=user_id, is_active=True, team__wedding__isnull=False
+            ).values_list("team__wedding_id", "role")
+        )
+        roles.update(
+            (wedding_id, OWNER)
+            for wedding_id in Wedding.objects.using(DEFAULT_DB_ALIAS).filter(owner_id=user_id).values_list("id", flat=True)
+        )
+        return roles
+
+    @classmethod
+    def invalidate(cls, *user_ids):
+        """Drop cached access for the given users."""
+        keys = [ACCESS_CACHE_KEY.format(user_id=user_id) for user_id in user_ids if user_id]
+        if keys:
+            cache.delete_many(keys)
@@ -1,12 +1,26 @@
 """
 Wedding Planner signals - Automatically create notifications on model changes.
 """
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from apps.wedding_planner.models import Guest
+from apps.wedding_planner.models import (
+    Guest,
+    RestaurantAccessToken,
+    TeamMember,
+    Vendor,
+    VendorCategory,
+    Wedding,
+    WeddingTeam,
+)
 from apps.wedding_planner.models.guest_model import AttendanceStatus
 from apps.wedding_planner.services.notification_service import NotificationService
+from apps.wedding_planner.services.restaurant_access_service import RestaurantAccessService
+from apps.wedding_planner.services.wedding_access_service import WeddingAccessService
+from apps.wedding_planner.services.vendor_facet_service import (
+    NON_FACET_FIELDS,
+    VendorFacetService,
+)
 
 
 # Track previous attendance status
@@ -61,3 +75,63 @@ def create_rsvp_notification(sender, instance, created, **kwargs):
             wedding=wedding,
             guest=instance,
         )
+
+
+@receiver(post_save, sender=Vendor)
+@receiver(post_save, sender=VendorCategory)
+@receiver(post_delete, sender=Vendor)
+@receiver(post_delete, sender=VendorCategory)
+def invalidate_vendor_facets(sender, instance, **kwargs):
+    """
+    Bump the vendor facet cache version when the catalog changes.
+    Rating-only saves (review updates) don't affect any facet.
+    """
+    update_fields = kwargs.get("update_fields")
+    if update_fields and set(update_fields) <= NON_FACET_FIELDS:
+        return
+    VendorFacetService.invalidate()
+
+
+@receiver(post_save, sender=RestaurantAccessToken)
+@receiver(post_delete, sender=RestaurantAccessToken)
+def invalidate_restaurant_token_cache(sender, instance, **kwargs):
+    """
+    Drop the cached portal lookup when a token changes, including the
+    old access code after regenerate_code().
+    """
+    RestaurantAccessService.invalidate(
+        instance.access_code,
+        getattr(instance, "_previous_access_code", None),
+    )
+
+
+@receiver(post_save, sender=Wedding)
+@receiver(post_delete, sender=Wedding)
+def invalidate_owner_wedding_access(sender, instance, **kwargs):
+    """
+    Drop the owner's cached wedding access when a wedding is created,
+    deleted or changes hands.
+    """
+    WeddingAccessService.invalidate(instance.owner_id)
+
+
+@receiver(post_save, sender=TeamMember)
+@receiver(post_delete, sender=TeamMember)
+def invalidate_member_wedding_access(sender, instance, **kwargs):
+    """
+    Drop a collaborator's cached wedding access when their membership,
+    role or active flag changes.
+    """
+    WeddingAccessService.invalidate(instance.user_id)
+
+
+@receiver(post_save, sender=WeddingTeam)
+def invalidate_team_wedding_access(sender, instance, created, **kwargs):
+    """
+    A team moved to another wedding changes what all its members reach.
+    """
+    if created:
+        return
+    WeddingAccessService.invalidate(
+        *instance.members.values_list("user_id", flat=True)
+    )
@@ -1,3 +1,10 @@
 from django.test import TestCase
 
-# Create your tests here.
+from apps.commons.testing import QueryCountRegressionMixin
+
+
+class QueryCountRegressionTests(QueryCountRegressionMixin, TestCase):
+    urlconf = "apps.wedding_planner.urls"
+    broken_routes = {
+        "children-male": "Child has no gender field; the action still filters on it",
+    }
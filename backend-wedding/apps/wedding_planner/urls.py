@@ -34,6 +34,7 @@ from .views.restaurant_access_views import (
     RestaurantPortalMealStatusView,
     RestaurantPortalSummaryView,
     RestaurantPortalMealFiltersView,
+    RestaurantPortalKitchenReportView,
 )
 
 router = DefaultRouter()
@@ -94,4 +95,6 @@ urlpatterns = [
     path("restaurant-portal/<uuid:access_code>/meals/filters/", RestaurantPortalMealFiltersView.as_view(), name="restaurant-portal-meal-filters"),
     path("restaurant-portal/<uuid:access_code>/meals/<int:meal_id>/", RestaurantPortalMealDetailView.as_view(), name="restaurant-portal-meal-detail"),
     path("restaurant-portal/<uuid:access_code>/meals/<int:meal_id>/update-status/", RestaurantPortalMealStatusView.as_view(), name="restaurant-portal-meal-status"),
+    path("restaurant-portal/<uuid:access_code>/kitchen-report/", RestaurantPortalKitchenReportView.as_view(), name="restaurant-portal-kitchen-report"),
+    path("restaurant-portal/<uuid:access_code>/kitchen-report/csv/", RestaurantPortalKitchenReportView.as_view(export_csv=True), name="restaurant-portal-kitchen-report-csv"),
 ]
\ No newline at end of file
@@ -5,12 +5,13 @@ from rest_framework.response import Response
 
 from apps.wedding_planner.models.guest_child_model import Child
 from apps.wedding_planner.serializers.guest_child_serializer import ChildSerializer
+from apps.wedding_planner.views.wedding_access_mixin import WeddingAccessMixin
 
 
-class ChildViews(viewsets.ModelViewSet):
+class ChildViews(WeddingAccessMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing guest children.
-    Children are scoped to weddings owned by the authenticated user.
+    Children are scoped to the weddings the authenticated user can reach.
     """
 
     serializer_class = ChildSerializer
@@ -18,15 +19,9 @@ class ChildViews(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return children belonging to the current user's weddings."""
-        queryset = Child.objects.filter(
-            guest__wedding__owner=self.request.user
-        ).select_related("guest", "gender")
-
-        wedding_id = self.request.query_params.get("wedding")
-        if wedding_id:
-            queryset = queryset.filter(guest__wedding_id=wedding_id)
-
-        return queryset
+        return self.filter_by_wedding(
+            Child.objects.select_related("guest"), field="guest__wedding"
+        )
 
     @action(detail=False, methods=["get"], url_name="age")
     def age(self, request):
@@ -44,7 +39,7 @@ class ChildViews(viewsets.ModelViewSet):
                 {"message": "provide last_name query param"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        results = self.get_queryset().filter(last_name__icontains=last_name)
+        results = self.get_queryset().filter(guest__last_name__icontains=last_name)
         if not results.exists():
             return Response(
                 {"message": "last name not found"},
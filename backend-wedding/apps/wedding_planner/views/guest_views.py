@@ -5,8 +5,8 @@ from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
+from apps.commons.pagination import OptionalCursorPagination
 from apps.email_services.services import EmailService
-from apps.wedding_planner.models import Wedding
 from apps.wedding_planner.models.guest_model import Guest, AttendanceStatus
 from apps.wedding_planner.serializers.guest_serializer import (
     GuestSerializer,
@@ -14,9 +14,10 @@ from apps.wedding_planner.serializers.guest_serializer import (
     GuestPublicSerializer,
     GuestRSVPSerializer,
 )
+from apps.wedding_planner.views.wedding_access_mixin import WeddingAccessMixin
 
 
-class GuestViews(viewsets.ModelViewSet):
+class GuestViews(WeddingAccessMixin, viewsets.ModelViewSet):
     """ViewSet for managing wedding guests with filtering, search, and ordering."""
 
     serializer_class = GuestSerializer
@@ -31,24 +32,18 @@ class GuestViews(viewsets.ModelViewSet):
     search_fields = ["first_name", "last_name", "email", "phone_number"]
     ordering_fields = ["created_at", "first_name", "last_name", "attendance_status"]
     ordering = ["-created_at"]
+    pagination_class = OptionalCursorPagination
     
     def get_queryset(self):
         """Filter guests by wedding. Additional filtering handled by django-filter."""
-        user = self.request.user
-        wedding_id = self.kwargs.get("wedding_pk") or self.request.query_params.get("wedding")
-        
-        if wedding_id:
-            queryset = Guest.objects.filter(
-                wedding_id=wedding_id,
-                wedding__owner=user
-            )
-        else:
-            # Return all guests from all user's weddings
-            queryset = Guest.objects.filter(wedding__owner=user)
+        # The requested wedding, or all of the user's weddings
+        queryset = self.filter_by_wedding(Guest.objects.all())
         
         # Note: Filtering by attendance_status, guest_type, and search
         # is now handled automatically by django-filter and SearchFilter
-        return queryset
+        return queryset.select_related("meal_selection__meal_choice").prefetch_related(
+            "child_set", "seating_assignments", "claimed_registry_items"
+        )
     
     def get_serializer_class(self):
         if self.action == "create":
@@ -61,25 +56,17 @@ class GuestViews(viewsets.ModelViewSet):
     
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        wedding_id = self.kwargs.get("wedding_pk") or self.request.query_params.get("wedding")
+        wedding_id = self.requested_wedding_id()
         if wedding_id:
-            context["wedding"] = Wedding.objects.filter(
-                id=wedding_id, 
-                owner=self.request.user
-            ).first()
+            context["wedding"] = self.get_accessible_wedding(wedding_id)
         return context
     
     def perform_create(self, serializer):
         """Set the wedding when creating a guest."""
-        wedding_id = self.kwargs.get("wedding_pk") or self.request.data.get("wedding")
+        wedding_id = self.requested_wedding_id(data=True)
         if wedding_id:
-            wedding = Wedding.objects.filter(
-                id=wedding_id,
-                owner=self.request.user
-            ).first()
-            if wedding:
-                serializer.save(wedding=wedding)
-                return
+            serializer.save(wedding=self.get_writable_wedding(wedding_id))
+            return
         serializer.save()
     
     @action(methods=['get'], url_path='attendance_status', detail=False)
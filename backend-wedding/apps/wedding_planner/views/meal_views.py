@@ -6,7 +6,6 @@ from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
-from apps.wedding_planner.models import Wedding
 from apps.wedding_planner.models.meal_model import (
     DietaryRestriction,
     MealChoice,
@@ -17,9 +16,11 @@ from apps.wedding_planner.serializers.meal_serializer import (
     MealChoiceSerializer,
     GuestMealSelectionSerializer,
 )
+from apps.wedding_planner.services.portal_summary_service import PortalSummaryService
+from apps.wedding_planner.views.wedding_access_mixin import WeddingAccessMixin
 
 
-class DietaryRestrictionViews(viewsets.ModelViewSet):
+class DietaryRestrictionViews(WeddingAccessMixin, viewsets.ModelViewSet):
     """ViewSet for dietary restrictions."""
     serializer_class = DietaryRestrictionSerializer
     permission_classes = [IsAuthenticated]
@@ -31,21 +32,13 @@ class DietaryRestrictionViews(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Return global restrictions plus wedding-specific ones."""
-        user = self.request.user
-        wedding_id = self.request.query_params.get("wedding")
-        
         # Global restrictions (wedding=null) + user's wedding restrictions
-        query = Q(wedding__isnull=True)
-        
-        if wedding_id:
-            query |= Q(wedding_id=wedding_id, wedding__owner=user)
-        else:
-            query |= Q(wedding__owner=user)
-        
-        return DietaryRestriction.objects.filter(query)
+        return DietaryRestriction.objects.filter(
+            Q(wedding__isnull=True) | Q(wedding_id__in=self.scoped_wedding_ids())
+        )
 
 
-class MealChoiceViews(viewsets.ModelViewSet):
+class MealChoiceViews(WeddingAccessMixin, viewsets.ModelViewSet):
     """ViewSet for meal choices."""
     serializer_class = MealChoiceSerializer
     permission_classes = [IsAuthenticated]
@@ -56,21 +49,12 @@ class MealChoiceViews(viewsets.ModelViewSet):
     ordering = ['meal_type', 'name']
     
     def get_queryset(self):
-        """Filter meals by wedding owned by the current user."""
-        user = self.request.user
-        wedding_id = self.request.query_params.get("wedding")
-        
+        """Filter meals by the weddings the current user can reach."""
         # For anonymous users, return empty queryset (use public endpoints instead)
-        if not user.is_authenticated:
+        if not self.request.user.is_authenticated:
             return MealChoice.objects.none()
         
-        if wedding_id:
-            queryset = MealChoice.objects.filter(
-                wedding_id=wedding_id,
-                wedding__owner=user
-            )
-        else:
-            queryset = MealChoice.objects.filter(wedding__owner=user)
+        queryset = self.filter_by_wedding(MealChoice.objects.all())
         
         # Filter to available meals by default on list
         if self.action == "list":
@@ -111,20 +95,15 @@ class MealChoiceViews(viewsets.ModelViewSet):
         """Set the wedding when creating a meal choice from couple's side."""
         wedding_id = self.request.data.get("wedding")
         if wedding_id:
-            wedding = Wedding.objects.filter(
-                id=wedding_id,
-                owner=self.request.user
-            ).first()
-            if wedding:
-                # Client-created meals: auto-approve client status, restaurant needs to approve
-                serializer.save(
-                    wedding=wedding,
-                    created_by="client",
-                    client_status="approved",
-                    restaurant_status="pending",
-                    request_status="pending"
-                )
-                return
+            # Client-created meals: auto-approve client status, restaurant needs to approve
+            serializer.save(
+                wedding=self.get_writable_wedding(wedding_id),
+                created_by="client",
+                client_status="approved",
+                restaurant_status="pending",
+                request_status="pending"
+            )
+            return
         serializer.save()
     
     @action(detail=False, methods=["get"], url_path="by-type")
@@ -145,30 +124,12 @@ class MealChoiceViews(viewsets.ModelViewSet):
         Get available meal type filters with counts.
         Returns all meal types from the backend with their counts.
         """
-        queryset = self.get_queryset()
-        
-        # Get counts by meal type
-        type_counts = (
-            queryset
-            .values("meal_type")
-            .annotate(count=Count("id"))
-            .order_by("meal_type")
-        )
-        
-        # Build response with all meal types from MealChoice.MealType
-        meal_types = []
-        type_count_map = {item["meal_type"]: item["count"] for item in type_counts}
-        
-        for choice_value, choice_label in MealChoice.MealType.choices:
-            meal_types.append({
-                "value": choice_value,
-                "label": choice_label,
-                "count": type_count_map.get(choice_value, 0),
-            })
-        
+        counts = PortalSummaryService.meal_counts(self.get_queryset())
         return Response({
-            "meal_types": meal_types,
-            "total_count": queryset.count(),
+            "meal_types": PortalSummaryService.choice_options(
+                counts["meal_type"], MealChoice.MealType.choices
+            ),
+            "total_count": counts["total"],
         })
 
     @action(detail=True, methods=["post"], url_path="update-status")
@@ -216,34 +177,16 @@ class MealChoiceViews(viewsets.ModelViewSet):
         """
         Get request status filters with counts.
         """
-        queryset = self.get_queryset()
-        
-        # Get counts by request status
-        status_counts = (
-            queryset
-            .values("request_status")
-            .annotate(count=Count("id"))
-            .order_by("request_status")
-        )
-        
-        # Build response with all statuses
-        statuses = []
-        status_count_map = {item["request_status"]: item["count"] for item in status_counts}
-        
-        for choice_value, choice_label in MealChoice.RequestStatus.choices:
-            statuses.append({
-                "value": choice_value,
-                "label": choice_label,
-                "count": status_count_map.get(choice_value, 0),
-            })
-        
+        counts = PortalSummaryService.meal_counts(self.get_queryset())
         return Response({
-            "statuses": statuses,
-            "total_count": queryset.count(),
+            "statuses": PortalSummaryService.choice_options(
+                counts["request_status"], MealChoice.RequestStatus.choices
+            ),
+            "total_count": counts["total"],
         })
 
 
-class GuestMealSelectionViews(viewsets.ModelViewSet):
+class GuestMealSelectionViews(WeddingAccessMixin, viewsets.ModelViewSet):
     """ViewSet for guest meal selections."""
     serializer_class = GuestMealSelectionSerializer
     permission_classes = [IsAuthenticated]
@@ -254,21 +197,11 @@ class GuestMealSelectionViews(viewsets.ModelViewSet):
     ordering = ['-created_at']
     
     def get_queryset(self):
-        """Filter selections by wedding owned by the current user."""
-        user = self.request.user
-        wedding_id = self.request.query_params.get("wedding")
-        
-        if wedding_id:
-            return GuestMealSelection.objects.select_related(
-                "guest", "meal_choice"
-            ).filter(
-                guest__wedding_id=wedding_id,
-                guest__wedding__owner=user
-            )
-        
-        return GuestMealSelection.objects.select_related(
+        """Filter selections by the weddings the current user can reach."""
+        queryset = GuestMealSelection.objects.select_related(
             "guest", "meal_choice"
-        ).filter(guest__wedding__owner=user)
+        ).prefetch_related("dietary_restrictions")
+        return self.filter_by_wedding(queryset, field="guest__wedding")
     
     @action(detail=False, methods=["get"], url_path="by-meal")
     def group_by_meal(self, request):
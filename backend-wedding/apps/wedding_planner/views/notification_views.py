@@ -6,8 +6,8 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
+from apps.commons.pagination import OptionalCursorPagination
 from apps.wedding_planner.models.notifications_model import Notification, NotificationPreference
-from apps.wedding_planner.models import Wedding
 from apps.wedding_planner.serializers.notification_serializers import (
     NotificationSerializer,
     NotificationListSerializer,
@@ -16,9 +16,10 @@ from apps.wedding_planner.serializers.notification_serializers import (
     CreateNotificationSerializer,
 )
 from apps.wedding_planner.services.notification_service import NotificationService
+from apps.wedding_planner.views.wedding_access_mixin import WeddingAccessMixin
 
 
-class NotificationViewSet(viewsets.ModelViewSet):
+class NotificationViewSet(WeddingAccessMixin, viewsets.ModelViewSet):
     """
     ViewSet for notifications.
     
@@ -32,8 +33,11 @@ class NotificationViewSet(viewsets.ModelViewSet):
     - GET /notifications/unread-count/ - Get unread count
     - POST /notifications/mark-read/ - Bulk mark as read
     - POST /notifications/check-todos/ - Check and create todo notifications
+    
+    List supports keyset pagination with ?pagination=cursor.
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = OptionalCursorPagination
     
     def get_serializer_class(self):
         if self.action == "list":
@@ -92,9 +96,9 @@ class NotificationViewSet(viewsets.ModelViewSet):
         
         wedding = None
         if wedding_id:
-            try:
-                wedding = Wedding.objects.get(id=wedding_id, owner=request.user)
-            except Wedding.DoesNotExist:
+            # Notifications are the user's own; only the wedding is checked
+            wedding = self.wedding_access.resolve(wedding_id)
+            if wedding is None:
                 return Response(
                     {"error": "Wedding not found"},
                     status=status.HTTP_404_NOT_FOUND
@@ -134,9 +138,9 @@ class NotificationViewSet(viewsets.ModelViewSet):
         wedding = None
         
         if wedding_id:
-            try:
-                wedding = Wedding.objects.get(id=wedding_id, owner=request.user)
-            except Wedding.DoesNotExist:
+            # Notifications are the user's own; only the wedding is checked
+            wedding = self.wedding_access.resolve(wedding_id)
+            if wedding is None:
                 return Response(
                     {"error": "Wedding not found"},
                     status=status.HTTP_404_NOT_FOUND
@@ -155,9 +159,9 @@ class NotificationViewSet(viewsets.ModelViewSet):
         wedding = None
         
         if wedding_id:
-            try:
-                wedding = Wedding.objects.get(id=wedding_id, owner=request.user)
-            except Wedding.DoesNotExist:
+            # Notifications are the user's own; only the wedding is checked
+            wedding = self.wedding_access.resolve(wedding_id)
+            if wedding is None:
                 return Response(
                     {"error": "Wedding not found"},
                     status=status.HTTP_404_NOT_FOUND
@@ -177,9 +181,9 @@ class NotificationViewSet(viewsets.ModelViewSet):
         wedding = None
         
         if wedding_id:
-            try:
-                wedding = Wedding.objects.get(id=wedding_id, owner=request.user)
-            except Wedding.DoesNotExist:
+            # Notifications are the user's own; only the wedding is checked
+            wedding = self.wedding_access.resolve(wedding_id)
+            if wedding is None:
                 return Response(
                     {"error": "Wedding not found"},
                     status=status.HTTP_404_NOT_FOUND
@@ -207,9 +211,8 @@ class NotificationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        try:
-            wedding = Wedding.objects.get(id=wedding_id, owner=request.user)
-        except Wedding.DoesNotExist:
+        wedding = self.get_accessible_wedding(wedding_id)
+        if wedding is None:
             return Response(
                 {"error": "Wedding not found"},
                 status=status.HTTP_404_NOT_FOUND
@@ -236,9 +239,8 @@ class NotificationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        try:
-            wedding = Wedding.objects.get(id=wedding_id, owner=request.user)
-        except Wedding.DoesNotExist:
+        wedding = self.get_accessible_wedding(wedding_id)
+        if wedding is None:
             return Response(
                 {"error": "Wedding not found"},
                 status=status.HTTP_404_NOT_FOUND
@@ -257,7 +259,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
         )
 
 
-class NotificationPreferenceViewSet(viewsets.ModelViewSet):
+class NotificationPreferenceViewSet(WeddingAccessMixin, viewsets.ModelViewSet):
     """
     ViewSet for notification preferences.
     
@@ -284,9 +286,8 @@ class NotificationPreferenceViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        try:
-            wedding = Wedding.objects.get(id=wedding_id, owner=request.user)
-        except Wedding.DoesNotExist:
+        wedding = self.get_accessible_wedding(wedding_id)
+        if wedding is None:
             return Response(
                 {"error": "Wedding not found"},
                 status=status.HTTP_404_NOT_FOUND
@@ -14,7 +14,7 @@ from django.shortcuts import get_object_or_404
 from apps.wedding_planner.models.registry_model import (
     GiftRegistry, ExternalRegistry, RegistryItem, Gift
 )
-from apps.wedding_planner.models import Wedding, Guest
+from apps.wedding_planner.models import Guest
 from apps.wedding_planner.serializers.registry_serializers import (
     GiftRegistrySerializer,
     GiftRegistryPublicSerializer,
@@ -28,9 +28,10 @@ from apps.wedding_planner.serializers.registry_serializers import (
     RegistryItemContributeSerializer,
     GiftSerializer,
 )
+from apps.wedding_planner.views.wedding_access_mixin import WeddingAccessMixin
 
 
-class GiftRegistryViewSet(viewsets.ModelViewSet):
+class GiftRegistryViewSet(WeddingAccessMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing gift registries.
     
@@ -43,9 +44,9 @@ class GiftRegistryViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        """Filter by wedding owned by user"""
+        """Filter by the weddings the user can reach"""
         return GiftRegistry.objects.filter(
-            wedding__owner=self.request.user
+            wedding_id__in=self.wedding_access.wedding_ids(write=self.is_write())
         ).select_related("wedding")
     
     def list(self, request, *args, **kwargs):
@@ -58,9 +59,8 @@ class GiftRegistryViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        try:
-            wedding = Wedding.objects.get(id=wedding_id, owner=request.user)
-        except Wedding.DoesNotExist:
+        wedding = self.get_accessible_wedding(wedding_id)
+        if wedding is None:
             return Response(
                 {"error": "Wedding not found"},
                 status=status.HTTP_404_NOT_FOUND
@@ -108,7 +108,7 @@ class GiftRegistryViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class RegistryItemViewSet(viewsets.ModelViewSet):
+class RegistryItemViewSet(WeddingAccessMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing registry items (wishlist).
     
@@ -154,17 +154,11 @@ class RegistryItemViewSet(viewsets.ModelViewSet):
         Filter items by wedding and apply all filters.
         ALL filtering is done here on the backend.
         """
-        user = self.request.user
-        wedding_id = self.request.query_params.get("wedding")
-        
-        # Base queryset - items from user's weddings
-        queryset = RegistryItem.objects.filter(
-            registry__wedding__owner=user
-        ).select_related("registry", "registry__wedding", "claimed_by")
-        
-        # Filter by wedding
-        if wedding_id:
-            queryset = queryset.filter(registry__wedding_id=wedding_id)
+        # Base queryset - items from the requested wedding or all of the user's
+        queryset = self.filter_by_wedding(
+            RegistryItem.objects.select_related("registry", "registry__wedding", "claimed_by"),
+            field="registry__wedding",
+        )
         
         # Filter by category
         category = self.request.query_params.get("category")
@@ -226,9 +220,8 @@ class RegistryItemViewSet(viewsets.ModelViewSet):
         if not wedding_id:
             raise serializers.ValidationError({"wedding": "Wedding ID is required"})
         
-        try:
-            wedding = Wedding.objects.get(id=wedding_id, owner=self.request.user)
-        except Wedding.DoesNotExist:
+        wedding = self.get_accessible_wedding(wedding_id)
+        if wedding is None:
             raise serializers.ValidationError({"wedding": "Wedding not found"})
         
         # Get or create registry
@@ -255,9 +248,8 @@ class RegistryItemViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        try:
-            wedding = Wedding.objects.get(id=wedding_id, owner=request.user)
-        except Wedding.DoesNotExist:
+        wedding = self.get_accessible_wedding(wedding_id)
+        if wedding is None:
             return Response(
                 {"error": "Wedding not found"},
                 status=status.HTTP_404_NOT_FOUND
@@ -507,6 +499,7 @@ class RegistryItemViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        wedding_ids = self.wedding_access.wedding_ids(write=True)
         for item_data in items_data:
             item_id = item_data.get("id")
             order = item_data.get("display_order")
@@ -514,13 +507,13 @@ class RegistryItemViewSet(viewsets.ModelViewSet):
             if item_id and order is not None:
                 RegistryItem.objects.filter(
                     id=item_id,
-                    registry__wedding__owner=request.user
+                    registry__wedding_id__in=wedding_ids
                 ).update(display_order=order)
         
         return Response({"success": True, "message": "Items reordered"})
 
 
-class GiftViewSet(viewsets.ModelViewSet):
+class GiftViewSet(WeddingAccessMixin, viewsets.ModelViewSet):
     """
     ViewSet for tracking received gifts.
     
@@ -535,13 +528,10 @@ class GiftViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        queryset = Gift.objects.filter(
-            registry__wedding__owner=self.request.user
-        ).select_related("registry", "registry_item", "guest")
-        
-        wedding_id = self.request.query_params.get("wedding")
-        if wedding_id:
-            queryset = queryset.filter(registry__wedding_id=wedding_id)
+        queryset = self.filter_by_wedding(
+            Gift.objects.select_related("registry", "registry_item", "guest"),
+            field="registry__wedding",
+        )
         
         # Filter by received status
         received = self.request.query_params.get("received")
@@ -11,6 +11,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.views import APIView
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404
 from django.db.models import Count, Q
 
@@ -24,6 +25,9 @@ from ..serializers.restaurant_access_serializer import (
     RestaurantMealSerializer,
     RestaurantMealCreateSerializer,
 )
+from ..services.kitchen_report_service import KitchenReportService
+from ..services.portal_summary_service import PortalSummaryService
+from ..services.restaurant_access_service import RestaurantAccessService
 
 
 class RestaurantAccessTokenViews(viewsets.ModelViewSet):
@@ -133,19 +137,22 @@ class RestaurantPortalMixin:
         """
         Validate the access code and return the token and wedding.
         Records the access and returns (token, wedding) or raises 404/403.
+        
+        The token lookup is cached (with a shared cache) and the access is
+        buffered, so portal polling does not read or write the token row on
+        every request.
         """
-        token = get_object_or_404(
-            RestaurantAccessToken.objects.select_related("wedding"),
-            access_code=access_code
-        )
+        token = RestaurantAccessService.get_token(access_code)
+        if token is None:
+            raise Http404("No RestaurantAccessToken matches the given query.")
         
         if not token.is_valid:
             if token.is_expired:
                 return None, None, "This access link has expired"
             return None, None, "This access link is no longer active"
         
-        # Record the access
-        token.record_access()
+        # Record the access (buffered, written once the flush interval passes)
+        RestaurantAccessService.record_access(token)
         
         return token, token.wedding, None
 
@@ -206,7 +213,11 @@ class RestaurantPortalTablesView(APIView, RestaurantPortalMixin):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        tables = Table.objects.filter(wedding=wedding).order_by("table_number")
+        tables = (
+            Table.objects.filter(wedding=wedding)
+            .prefetch_related("seating_assignments")
+            .order_by("table_number")
+        )
         serializer = RestaurantTableSerializer(tables, many=True, context={"request": request})
         return Response(serializer.data)
     
@@ -575,37 +586,7 @@ class RestaurantPortalSummaryView(APIView, RestaurantPortalMixin):
         if error:
             return Response({"error": error}, status=status.HTTP_403_FORBIDDEN)
         
-        data = {
-            "wedding_name": f"{wedding.partner1_name} & {wedding.partner2_name}",
-            "wedding_date": wedding.wedding_date,
-        }
-        
-        if token.can_manage_tables:
-            tables = Table.objects.filter(wedding=wedding)
-            data["tables"] = {
-                "count": tables.count(),
-                "total_capacity": sum(t.capacity for t in tables),
-                "total_seats_taken": sum(t.seats_taken for t in tables),
-            }
-        
-        if token.can_manage_meals:
-            meals = MealChoice.objects.filter(wedding=wedding)
-            data["meals"] = {
-                "count": meals.count(),
-                "by_type": {}
-            }
-            for meal_type in MealChoice.MealType.choices:
-                count = meals.filter(meal_type=meal_type[0]).count()
-                if count > 0:
-                    data["meals"]["by_type"][meal_type[1]] = count
-        
-        if token.can_view_guest_count:
-            data["guests"] = {
-                "confirmed": Guest.objects.filter(wedding=wedding, attendance_status="yes").count(),
-                "pending": Guest.objects.filter(wedding=wedding, attendance_status="pending").count(),
-            }
-        
-        return Response(data)
+        return Response(PortalSummaryService.summary(wedding, token))
 
 
 class RestaurantPortalMealFiltersView(APIView, RestaurantPortalMixin):
@@ -629,50 +610,41 @@ class RestaurantPortalMealFiltersView(APIView, RestaurantPortalMixin):
             )
         
         meals = MealChoice.objects.filter(wedding=wedding)
+        return Response(PortalSummaryService.meal_filters(meals))
+
+
+class RestaurantPortalKitchenReportView(APIView, RestaurantPortalMixin):
+    """
+    GET /api/wedding_planner/restaurant-portal/<access_code>/kitchen-report/
+    GET /api/wedding_planner/restaurant-portal/<access_code>/kitchen-report/csv/
+    
+    Returns plate counts per table and meal (including plus-ones and children),
+    allergen totals and guests whose meal conflicts with their restrictions.
+    """
+    permission_classes = [AllowAny]
+    export_csv = False
+    
+    def get(self, request, access_code):
+        token, wedding, error = self.get_token_and_wedding(access_code)
         
-        # Meal type filters with counts
-        meal_types = [{"value": "all", "label": "All Types", "count": meals.count()}]
-        for meal_type in MealChoice.MealType.choices:
-            count = meals.filter(meal_type=meal_type[0]).count()
-            meal_types.append({
-                "value": meal_type[0],
-                "label": meal_type[1],
-                "count": count
-            })
-        
-        # Restaurant status filters with counts
-        restaurant_statuses = [{"value": "all", "label": "All", "count": meals.count()}]
-        for status_choice in MealChoice.RequestStatus.choices:
-            count = meals.filter(restaurant_status=status_choice[0]).count()
-            restaurant_statuses.append({
-                "value": status_choice[0],
-                "label": status_choice[1],
-                "count": count
-            })
-        
-        # Client status filters with counts
-        client_statuses = [{"value": "all", "label": "All", "count": meals.count()}]
-        for status_choice in MealChoice.RequestStatus.choices:
-            count = meals.filter(client_status=status_choice[0]).count()
-            client_statuses.append({
-                "value": status_choice[0],
-                "label": status_choice[1],
-                "count": count
-            })
-        
-        # Created by filters with counts
-        created_by_filters = [{"value": "all", "label": "All", "count": meals.count()}]
-        for created_choice in MealChoice.CreatedBy.choices:
-            count = meals.filter(created_by=created_choice[0]).count()
-            created_by_filters.append({
-                "value": created_choice[0],
-                "label": created_choice[1],
-                "count": count
-            })
+        if error:
+            return Response({"error": error}, status=status.HTTP_403_FORBIDDEN)
         
-        return Response({
-            "meal_types": meal_types,
-            "restaurant_statuses": restaurant_statuses,
-            "client_statuses": client_statuses,
-            "created_by": created_by_filters,
-        })
+        if not token.can_manage_meals:
+            return Response(
+                {"error": "Meal access is not enabled for this link"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        report = KitchenReportService.build(wedding)
+        
+        if self.export_csv:
+            response = HttpResponse(
+                KitchenReportService.to_csv(report),
+                content_type="text/csv; charset=utf-8",
+            )
+            filename = f"kitchen_report_{wedding.slug or wedding.id}.csv"
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+            return response
+        
+        return Response(report)
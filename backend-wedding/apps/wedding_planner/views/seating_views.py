@@ -1,16 +1,18 @@
 from django.db import models
+from django.db.models import Prefetch
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
 from apps.wedding_planner.models.seating_model import Table, SeatingAssignment
-from apps.wedding_planner.models import Wedding, Guest, AttendanceStatus
+from apps.wedding_planner.models import Guest, AttendanceStatus
 from apps.wedding_planner.serializers.seating_serializer import (
     TableSerializer,
     TableSummarySerializer,
     SeatingAssignmentSerializer,
 )
+from apps.wedding_planner.views.wedding_access_mixin import WeddingAccessMixin
 
 
 # ---------------------------------------------------------------------------
@@ -37,29 +39,23 @@ def _get_seating_summary(tables):
     }
 
 
-def _build_unassigned_guests_list(user, wedding_id=None):
+def _build_unassigned_guests_list(wedding_ids):
     """
     Build the expanded list of unassigned attendees
-    (guests, plus-ones, children) sorted by priority.
+    (guests, plus-ones, children) of the given weddings, sorted by priority.
     """
     confirmed_guests = (
         Guest.objects.filter(
-            wedding__owner=user,
+            wedding_id__in=wedding_ids,
             attendance_status=AttendanceStatus.YES,
         )
         .prefetch_related("child_set")
         .order_by("guest_type", "relationship_tier", "last_name", "first_name")
     )
-    if wedding_id:
-        confirmed_guests = confirmed_guests.filter(wedding_id=wedding_id)
 
     existing_assignments = SeatingAssignment.objects.filter(
-        guest__wedding__owner=user,
+        guest__wedding_id__in=wedding_ids,
     ).select_related("child")
-    if wedding_id:
-        existing_assignments = existing_assignments.filter(
-            guest__wedding_id=wedding_id,
-        )
 
     # Build sets of already-assigned IDs
     assigned_guests: set[int] = set()
@@ -180,44 +176,39 @@ def _build_unassigned_guests_list(user, wedding_id=None):
 # ---------------------------------------------------------------------------
 
 
-class TableViews(viewsets.ModelViewSet):
+class TableViews(WeddingAccessMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing tables.
-    Tables are filtered by wedding owned by the current user.
+    Tables are filtered by the weddings the current user can reach.
     """
 
     serializer_class = TableSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        user = self.request.user
-        wedding_id = (
-            self.kwargs.get("wedding_pk")
-            or self.request.query_params.get("wedding")
+        return self.filter_by_wedding(Table.objects.all()).prefetch_related(
+            Prefetch(
+                "seating_assignments",
+                queryset=SeatingAssignment.objects.select_related("guest", "child"),
+            )
         )
-        if wedding_id:
-            return Table.objects.filter(wedding_id=wedding_id, wedding__owner=user)
-        return Table.objects.filter(wedding__owner=user)
 
     def perform_create(self, serializer):
         """Set the wedding and auto-generate table_number when creating a table."""
-        wedding_id = self.kwargs.get("wedding_pk") or self.request.data.get("wedding")
+        wedding_id = self.requested_wedding_id(data=True)
         if wedding_id:
-            wedding = Wedding.objects.filter(
-                id=wedding_id, owner=self.request.user
-            ).first()
-            if wedding:
-                table_number = self.request.data.get("table_number")
-                if not table_number:
-                    max_number = (
-                        Table.objects.filter(wedding=wedding).aggregate(
-                            models.Max("table_number")
-                        )["table_number__max"]
-                        or 0
-                    )
-                    table_number = max_number + 1
-                serializer.save(wedding=wedding, table_number=table_number)
-                return
+            wedding = self.get_writable_wedding(wedding_id)
+            table_number = self.request.data.get("table_number")
+            if not table_number:
+                max_number = (
+                    Table.objects.filter(wedding=wedding).aggregate(
+                        models.Max("table_number")
+                    )["table_number__max"]
+                    or 0
+                )
+                table_number = max_number + 1
+            serializer.save(wedding=wedding, table_number=table_number)
+            return
         serializer.save()
 
     @action(detail=False, methods=["get"], url_path="available")
@@ -239,14 +230,13 @@ class TableViews(viewsets.ModelViewSet):
         Get all seating data in a single call: tables, unassigned guests, and
         summary stats.  Reduces 3 API calls to 1 for the seating page.
         """
-        wedding_id = request.query_params.get("wedding")
         tables = self.get_queryset()
 
         return Response(
             {
                 "tables": TableSerializer(tables, many=True).data,
                 "unassigned_guests": _build_unassigned_guests_list(
-                    request.user, wedding_id
+                    self.scoped_wedding_ids()
                 ),
                 "summary": _get_seating_summary(tables),
             }
@@ -292,34 +282,28 @@ class TableViews(viewsets.ModelViewSet):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class SeatingAssignmentViews(viewsets.ModelViewSet):
+class SeatingAssignmentViews(WeddingAccessMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing seating assignments.
-    Assignments are filtered by wedding owned by the current user.
+    Assignments are filtered by the weddings the current user can reach.
     """
 
     serializer_class = SeatingAssignmentSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        user = self.request.user
-        wedding_id = (
-            self.kwargs.get("wedding_pk")
-            or self.request.query_params.get("wedding")
+        return self.filter_by_wedding(
+            SeatingAssignment.objects.select_related("guest", "table"),
+            field="table__wedding",
         )
-        qs = SeatingAssignment.objects.select_related("guest", "table").filter(
-            table__wedding__owner=user
-        )
-        if wedding_id:
-            qs = qs.filter(table__wedding_id=wedding_id)
-        return qs
 
     def destroy(self, request, *args, **kwargs):
         """Delete a seating assignment with proper ownership check."""
         try:
-            assignment = SeatingAssignment.objects.select_related(
-                "table__wedding"
-            ).get(pk=kwargs.get("pk"), table__wedding__owner=request.user)
+            assignment = SeatingAssignment.objects.get(
+                pk=kwargs.get("pk"),
+                table__wedding_id__in=self.wedding_access.wedding_ids(write=True),
+            )
             assignment.delete()
             return Response(status=status.HTTP_204_NO_CONTENT)
         except SeatingAssignment.DoesNotExist:
@@ -332,7 +316,7 @@ class SeatingAssignmentViews(viewsets.ModelViewSet):
         """Create a seating assignment, validating ownership."""
         from apps.wedding_planner.models.guest_child_model import Child
 
-        user = request.user
+        wedding_ids = self.wedding_access.wedding_ids(write=True)
         guest_id = request.data.get("guest")
         table_id = request.data.get("table")
         attendee_type = request.data.get("attendee_type", "guest")
@@ -340,7 +324,7 @@ class SeatingAssignmentViews(viewsets.ModelViewSet):
 
         # Validate guest ownership
         try:
-            guest = Guest.objects.get(pk=guest_id, wedding__owner=user)
+            guest = Guest.objects.get(pk=guest_id, wedding_id__in=wedding_ids)
         except Guest.DoesNotExist:
             return Response(
                 {"error": "Guest not found or doesn't belong to your wedding"},
@@ -349,7 +333,7 @@ class SeatingAssignmentViews(viewsets.ModelViewSet):
 
         # Validate table ownership
         try:
-            table = Table.objects.get(pk=table_id, wedding__owner=user)
+            table = Table.objects.get(pk=table_id, wedding_id__in=wedding_ids)
         except Table.DoesNotExist:
             return Response(
                 {"error": "Table not found or doesn't belong to your wedding"},
@@ -409,7 +393,8 @@ class SeatingAssignmentViews(viewsets.ModelViewSet):
         """Delete seating assignment by guest ID."""
         try:
             assignment = SeatingAssignment.objects.get(
-                guest_id=guest_id, table__wedding__owner=request.user
+                guest_id=guest_id,
+                table__wedding_id__in=self.wedding_access.wedding_ids(write=True),
             )
             assignment.delete()
             return Response(status=status.HTTP_204_NO_CONTENT)
@@ -425,8 +410,7 @@ class SeatingAssignmentViews(viewsets.ModelViewSet):
         Get guests who don't have seating assignments.
         Returns an expanded list including the guest, their plus one, and children.
         """
-        wedding_id = self.request.query_params.get("wedding")
-        expanded_list = _build_unassigned_guests_list(request.user, wedding_id)
+        expanded_list = _build_unassigned_guests_list(self.scoped_wedding_ids())
 
         return Response(
             {
@@ -2,7 +2,6 @@
 Server-Sent Events (SSE) for real-time notifications.
 Lightweight alternative to WebSockets - perfect for one-way server→client communication.
 """
-import json
 import time
 from django.http import StreamingHttpResponse
 from django.utils import timezone
@@ -11,6 +10,7 @@ from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.exceptions import TokenError
 
 from apps.commons.models import User
+from apps.commons.renderers import dumps
 from apps.wedding_planner.models import Wedding
 from apps.wedding_planner.models.notifications_model import Notification
 
@@ -153,7 +153,7 @@ class NotificationSSEView(View):
     
     def _format_event(self, event_type: str, data: dict) -> str:
         """Format data as SSE event."""
-        return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+        return f"event: {event_type}\ndata: {dumps(data).decode()}\n\n"
     
     def _error_event(self, message: str):
         """Generate a single error event."""
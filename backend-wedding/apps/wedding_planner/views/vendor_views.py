@@ -14,6 +14,7 @@ Endpoints:
     POST   /api/wedding_planner/vendors/               - Create vendor
     GET    /api/wedding_planner/vendors/dashboard/     - Combined dashboard data
     GET    /api/wedding_planner/vendors/by-category/<slug>/ - Vendors by category
+    GET    /api/wedding_planner/vendors/nearby/        - Nearest vendors within a radius
     
     GET    /api/wedding_planner/vendor-images/         - List images
     POST   /api/wedding_planner/vendor-images/         - Upload image
@@ -37,13 +38,17 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from django.db import transaction
 from django.db.models import Q, Count, Avg
 from django.shortcuts import get_object_or_404
 
+from apps.commons.pagination import OptionalCursorPagination
 from apps.wedding_planner.models import (
     VendorCategory, Vendor, VendorImage, VendorOffer,
     VendorReview, VendorQuote, SavedVendor
 )
+from apps.wedding_planner.services.geo_service import GeoService
+from apps.wedding_planner.services.vendor_facet_service import VendorFacetService
 from apps.wedding_planner.serializers.vendor_serializers import (
     VendorCategorySerializer,
     VendorCategoryListSerializer,
@@ -56,6 +61,7 @@ from apps.wedding_planner.serializers.vendor_serializers import (
     VendorReviewSerializer,
     VendorQuoteSerializer,
     SavedVendorSerializer,
+    prefetch_active_offers,
 )
 
 
@@ -102,8 +108,11 @@ class VendorCategoryViews(viewsets.ModelViewSet):
             )
         
         # Annotate with vendor count for sorting options
+        # (distinct: with-vendors joins vendors again to filter)
         queryset = queryset.annotate(
-            active_vendor_count=Count('vendors', filter=Q(vendors__is_active=True))
+            active_vendor_count=Count(
+                'vendors', filter=Q(vendors__is_active=True), distinct=True
+            )
         )
         
         # Backend sorting is defined in Meta.ordering
@@ -122,19 +131,9 @@ class VendorCategoryViews(viewsets.ModelViewSet):
         """
         Get list of all category types for filtering.
         Returns: [{"value": "venue", "label": "Venue", "count": 5}, ...]
+        Served from the vendor facet cache.
         """
-        types = []
-        for choice in VendorCategory.CategoryType.choices:
-            count = VendorCategory.objects.filter(
-                category_type=choice[0],
-                is_active=True
-            ).count()
-            types.append({
-                "value": choice[0],
-                "label": choice[1],
-                "count": count
-            })
-        return Response(types)
+        return Response(VendorFacetService.get_facets()["category_types"])
     
     @action(detail=False, methods=["get"], url_path="with-vendors")
     def categories_with_vendors(self, request):
@@ -171,9 +170,11 @@ class VendorViews(viewsets.ModelViewSet):
     - rating_min: Filter by minimum rating
     - search: Search by name, description, city
     - sort_by: Sort field (rating, price_low, price_high, name, newest)
+    - pagination: "cursor" for keyset pagination (newest first, ignores sort_by)
     """
     serializer_class = VendorSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = OptionalCursorPagination
     parser_classes = [MultiPartParser, FormParser, JSONParser]
     
     def get_queryset(self):
@@ -181,7 +182,9 @@ class VendorViews(viewsets.ModelViewSet):
         Apply all filters and sorting on the backend.
         Frontend NEVER does filtering - pass query params instead.
         """
-        queryset = Vendor.objects.filter(is_active=True).select_related('category')
+        queryset = prefetch_active_offers(
+            Vendor.objects.filter(is_active=True).select_related('category')
+        )
         
         # Filter by category ID
         category_id = self.request.query_params.get("category")
@@ -302,38 +305,14 @@ class VendorViews(viewsets.ModelViewSet):
         """
         user = request.user
         
-        # Get active categories with vendor counts
-        categories = VendorCategory.objects.filter(
-            is_active=True
-        ).annotate(
-            vendor_count=Count('vendors', filter=Q(vendors__is_active=True))
-        ).order_by("-is_featured", "sort_order", "name")
+        # Categories, counts and distributions come from the facet cache
+        facets = VendorFacetService.get_facets()
         
         # Get featured vendors
-        featured_vendors = Vendor.objects.filter(
+        featured_vendors = prefetch_active_offers(Vendor.objects.filter(
             is_active=True,
             is_featured=True
-        ).select_related('category')[:10]
-        
-        # Calculate stats
-        total_vendors = Vendor.objects.filter(is_active=True).count()
-        total_categories = categories.filter(vendor_count__gt=0).count()
-        verified_vendors = Vendor.objects.filter(is_active=True, is_verified=True).count()
-        eco_friendly_vendors = Vendor.objects.filter(is_active=True, is_eco_friendly=True).count()
-        
-        # Get category type distribution
-        category_type_stats = []
-        for choice in VendorCategory.CategoryType.choices:
-            count = Vendor.objects.filter(
-                is_active=True,
-                category__category_type=choice[0]
-            ).count()
-            if count > 0:
-                category_type_stats.append({
-                    "type": choice[0],
-                    "label": choice[1],
-                    "count": count
-                })
+        ).select_related('category'))[:10]
         
         # Get user's saved vendor IDs
         saved_vendor_ids = []
@@ -348,16 +327,16 @@ class VendorViews(viewsets.ModelViewSet):
         vendors = VendorListSerializer(vendor_queryset[:50], many=True).data
         
         return Response({
-            "categories": VendorCategoryListSerializer(categories, many=True).data,
+            "categories": facets["categories"],
             "featured_vendors": VendorListSerializer(featured_vendors, many=True).data,
             "vendors": vendors,
             "saved_vendor_ids": saved_vendor_ids,
             "stats": {
-                "total_vendors": total_vendors,
-                "total_categories": total_categories,
-                "verified_vendors": verified_vendors,
-                "eco_friendly_vendors": eco_friendly_vendors,
-                "category_type_distribution": category_type_stats,
+                "total_vendors": facets["total_vendors"],
+                "total_categories": facets["total_categories"],
+                "verified_vendors": facets["verified_vendors"],
+                "eco_friendly_vendors": facets["eco_friendly_vendors"],
+                "category_type_distribution": facets["category_type_distribution"],
             }
         })
     
@@ -410,12 +389,21 @@ class VendorViews(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"], url_path="nearby")
     def nearby(self, request):
         """
-        Get vendors near a location.
+        Get vendors near a location, nearest first.
         Requires latitude and longitude query params.
+        
+        Query Params:
+        - latitude, longitude: Search center
+        - radius: Search radius in km (default 50)
+        - limit: Max vendors returned (default 50, max 200)
+        
+        Candidates come from the indexed geohash column; exact haversine
+        distance is computed in the database for filtering and sorting.
         """
         lat = request.query_params.get("latitude")
         lng = request.query_params.get("longitude")
         radius_km = request.query_params.get("radius", 50)  # Default 50km
+        limit = request.query_params.get("limit", 50)
         
         if not lat or not lng:
             return Response(
@@ -427,61 +415,53 @@ class VendorViews(viewsets.ModelViewSet):
             lat = float(lat)
             lng = float(lng)
             radius_km = float(radius_km)
+            limit = min(max(int(limit), 1), 200)
         except ValueError:
             return Response(
                 {"error": "Invalid coordinates"},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Simple distance filter (not exact, but fast)
-        # For more precise geolocation, use PostGIS
-        lat_range = radius_km / 111  # ~111km per degree latitude
-        lng_range = radius_km / (111 * abs(lat) if lat != 0 else 111)
+        if not (-90 <= lat <= 90 and -180 <= lng <= 180) or radius_km <= 0:
+            return Response(
+                {"error": "Invalid coordinates"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        queryset = self.get_queryset().filter(
-            latitude__isnull=False,
-            longitude__isnull=False,
-            latitude__range=(lat - lat_range, lat + lat_range),
-            longitude__range=(lng - lng_range, lng + lng_range)
-        )
+        vendors = list(GeoService.nearby(self.get_queryset(), lat, lng, radius_km, limit))
         
-        serializer = VendorListSerializer(queryset, many=True)
-        return Response(serializer.data)
+        data = VendorListSerializer(vendors, many=True).data
+        for vendor, item in zip(vendors, data):
+            item["distance_km"] = round(vendor.distance_km, 2)
+        return Response(data)
     
     @action(detail=False, methods=["get"], url_path="cities")
     def available_cities(self, request):
         """
         Get list of cities with vendor count for filtering.
         Sorted by vendor count (most vendors first).
+        Served from the vendor facet cache.
         """
-        cities = Vendor.objects.filter(
-            is_active=True,
-            city__isnull=False
-        ).exclude(
-            city=""
-        ).values("city", "country").annotate(
-            count=Count("id")
-        ).order_by("-count")
-        
-        return Response(list(cities))
+        return Response(VendorFacetService.get_facets()["cities"])
     
     @action(detail=False, methods=["get"], url_path="filter-options")
     def filter_options(self, request):
         """
         Get all available filter options for the frontend.
         Returns categories, cities, price ranges, etc.
+        Category and city options are served from the vendor facet cache.
         """
-        # Categories
-        categories = VendorCategory.objects.filter(
-            is_active=True,
-            vendors__is_active=True
-        ).distinct().values("id", "name", "slug")
+        facets = VendorFacetService.get_facets()
+        
+        # Categories with at least one active vendor
+        categories = [
+            {"id": c["id"], "name": c["name"], "slug": c["slug"]}
+            for c in facets["categories"]
+            if c["vendor_count"] > 0
+        ]
         
         # Cities
-        cities = Vendor.objects.filter(
-            is_active=True,
-            city__isnull=False
-        ).exclude(city="").values_list("city", flat=True).distinct()
+        cities = facets["city_names"]
         
         # Price ranges
         price_ranges = [
@@ -576,9 +556,13 @@ class VendorOfferViews(viewsets.ModelViewSet):
 
 
 class VendorReviewViews(viewsets.ModelViewSet):
-    """ViewSet for vendor reviews"""
+    """
+    ViewSet for vendor reviews.
+    List supports keyset pagination with ?pagination=cursor (newest first).
+    """
     serializer_class = VendorReviewSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = OptionalCursorPagination
     
     def get_queryset(self):
         queryset = VendorReview.objects.all()
@@ -611,20 +595,29 @@ class VendorReviewViews(viewsets.ModelViewSet):
         return queryset
     
     def perform_create(self, serializer):
-        """Set user on create and update vendor rating"""
-        review = serializer.save(user=self.request.user)
-        review.vendor.update_rating()
+        """Set user on create and add the rating to the vendor totals"""
+        with transaction.atomic():
+            review = serializer.save(user=self.request.user)
+            review.vendor.adjust_rating(review.rating, 1)
     
     def perform_update(self, serializer):
-        """Update vendor rating after review update"""
-        review = serializer.save()
-        review.vendor.update_rating()
+        """Apply the rating change (or vendor move) to the vendor totals"""
+        old_rating = serializer.instance.rating
+        old_vendor = serializer.instance.vendor
+        with transaction.atomic():
+            review = serializer.save()
+            if review.vendor_id != old_vendor.id:
+                old_vendor.adjust_rating(-old_rating, -1)
+                review.vendor.adjust_rating(review.rating, 1)
+            elif review.rating != old_rating:
+                review.vendor.adjust_rating(review.rating - old_rating)
     
     def perform_destroy(self, instance):
-        """Update vendor rating after review delete"""
+        """Remove the rating from the vendor totals"""
         vendor = instance.vendor
-        instance.delete()
-        vendor.update_rating()
+        with transaction.atomic():
+            instance.delete()
+            vendor.adjust_rating(-instance.rating, -1)
     
     @action(detail=True, methods=["post"], url_path="helpful")
     def mark_helpful(self, request, pk=None):
@@ -672,6 +665,7 @@ class SavedVendorViews(viewsets.ModelViewSet):
             user=self.request.user,
             vendor__is_active=True
         ).select_related('vendor', 'vendor__category')
+        queryset = prefetch_active_offers(queryset, lookup="vendor__offers")
         
         # Filter by category
         category = self.request.query_params.get("category")
@@ -0,0 +1,65 @@
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import SAFE_METHODS
+
+from apps.wedding_planner.services.wedding_access_service import WeddingAccessService
+
+
+class WeddingAccessMixin:
+    """
+    Scope a viewset to the weddings the user owns or collaborates on.
+
+    Access is resolved once per request (WeddingAccessService), so
+    querysets filter on plain wedding ids instead of joining to the
+    wedding's owner. Unsafe methods are limited to weddings the user can
+    edit.
+    """
+
+    @property
+    def wedding_access(self):
+        return WeddingAccessService.for_request(self.request)
+
+    def requested_wedding_id(self, data=False):
+        """The ``wedding`` URL kwarg / query param (or request body field)."""
+        if data:
+            return self.kwargs.get("wedding_pk") or self.request.data.get("wedding")
+        return self.kwargs.get("wedding_pk") or self.request.query_params.get("wedding")
+
+    def is_write(self):
+        return self.request.method not in SAFE_METHODS
+
+    def scoped_wedding_ids(self):
+        """Ids of the requested wedding (if reachable) or of all reachable weddings."""
+        write = self.is_write()
+        wedding_id = self.requested_wedding_id()
+        if wedding_id:
+            wedding_id = self.wedding_access.resolve(wedding_id, write=write)
+            return [] if wedding_id is None else [wedding_id]
+        return self.wedding_access.wedding_ids(write=write)
+
+    def filter_by_wedding(self, queryset, field="wedding"):
+        """
+        Limit ``queryset`` to the requested wedding, or to all reachable
+        weddings when none is requested. ``field`` is the path to the
+        Wedding foreign key (e.g. ``"guest__wedding"``).
+        """
+        write = self.is_write()
+        wedding_id = self.requested_wedding_id()
+        if wedding_id:
+            wedding_id = self.wedding_access.resolve(wedding_id, write=write)
+            if wedding_id is None:
+                return queryset.none()
+            return queryset.filter(**{f"{field}_id": wedding_id})
+        return queryset.filter(**{f"{field}_id__in": self.wedding_access.wedding_ids(write=write)})
+
+    def get_accessible_wedding(self, wedding_id, write=None):
+        """The Wedding if the user can reach it (edit it, for writes), else None."""
+        if write is None:
+            write = self.is_write()
+        return self.wedding_access.get_wedding(wedding_id, write=write)
+
+    def get_writable_wedding(self, wedding_id):
+        """The Wedding for a create/update; PermissionDenied if the user can't edit it."""
+        wedding = self.wedding_access.get_wedding(wedding_id, write=True)
+        if wedding is None:
+            raise PermissionDenied("You do not have permission to edit this wedding.")
+        return wedding
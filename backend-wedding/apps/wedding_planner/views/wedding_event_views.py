@@ -8,29 +8,21 @@ from apps.wedding_planner.models.wedding_event_model import WeddingEvent
 from apps.wedding_planner.serializers.wedding_event_serializer import (
     WeddingEventSerializer,
 )
+from apps.wedding_planner.views.wedding_access_mixin import WeddingAccessMixin
 
 
-class WeddingEventViews(viewsets.ModelViewSet):
+class WeddingEventViews(WeddingAccessMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing wedding events.
-    Events are filtered by the wedding owned by the current user.
+    Events are filtered by the weddings the current user can reach.
     """
     serializer_class = WeddingEventSerializer
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        """Filter events by wedding owned by the current user."""
-        user = self.request.user
-        wedding_id = self.kwargs.get("wedding_pk") or self.request.query_params.get("wedding")
-        
-        if wedding_id:
-            return WeddingEvent.objects.filter(
-                wedding_id=wedding_id,
-                wedding__owner=user
-            )
-        
-        # Return all events from all user's weddings
-        return WeddingEvent.objects.filter(wedding__owner=user)
+        """Filter events by the weddings the current user can reach."""
+        # The requested wedding, or all of the user's weddings
+        return self.filter_by_wedding(WeddingEvent.objects.all())
     
     def get_permissions(self):
         """Allow public access for specific actions."""
@@ -40,15 +32,10 @@ class WeddingEventViews(viewsets.ModelViewSet):
     
     def perform_create(self, serializer):
         """Set the wedding when creating an event."""
-        wedding_id = self.kwargs.get("wedding_pk") or self.request.data.get("wedding")
+        wedding_id = self.requested_wedding_id(data=True)
         if wedding_id:
-            wedding = Wedding.objects.filter(
-                id=wedding_id,
-                owner=self.request.user
-            ).first()
-            if wedding:
-                serializer.save(wedding=wedding)
-                return
+            serializer.save(wedding=self.get_writable_wedding(wedding_id))
+            return
         serializer.save()
     
     @action(detail=False, methods=["get"], url_path="current")
@@ -56,7 +43,7 @@ class WeddingEventViews(viewsets.ModelViewSet):
         """Get the currently active wedding event for authenticated user."""
         if request.user.is_authenticated:
             event = WeddingEvent.objects.filter(
-                wedding__owner=request.user,
+                wedding_id__in=self.wedding_access.wedding_ids(),
                 is_active=True
             ).first()
         else:
@@ -1,5 +1,5 @@
 from django.db.models import Count, Q
-from django.http import HttpResponse
+from django.http import FileResponse
 from django.shortcuts import get_object_or_404
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
@@ -156,7 +156,7 @@ class WeddingViewSet(viewsets.ModelViewSet):
         }
         
         # Seating stats
-        tables = Table.objects.filter(wedding=wedding)
+        tables = Table.objects.filter(wedding=wedding).prefetch_related("seating_assignments")
         total_capacity = sum(t.capacity for t in tables)
         total_seated = sum(t.seats_taken for t in tables)
         
@@ -246,12 +246,14 @@ class WeddingViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Generate PDF
-        pdf_buffer = generate_wedding_report_pdf(wedding)
+        # Generate PDF into a temporary file
+        pdf_file = generate_wedding_report_pdf(wedding)
         
-        # Create response with PDF
-        response = HttpResponse(pdf_buffer.read(), content_type='application/pdf')
+        # Stream the file; FileResponse closes (and so removes) it when done
         filename = f"wedding_report_{wedding.slug or wedding.id}.pdf"
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-        
-        return response
+        return FileResponse(
+            pdf_file,
+            as_attachment=True,
+            filename=filename,
+            content_type='application/pdf',
+        )
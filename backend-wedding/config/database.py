@@ -0,0 +1,95 @@
+"""
+Database connection management.
+
+PostgreSQL connections are pooled per process with psycopg's
+ConnectionPool (Django's ``OPTIONS["pool"]``), so an API call borrows an
+open connection instead of paying the TCP/TLS/auth handshake. The pool
+checks a connection before handing it out and replaces broken ones.
+
+Pool sizes follow the gunicorn layout: each of the ``WEB_CONCURRENCY``
+worker processes holds its own pool, and a sync worker only ever uses
+one connection per thread, so the per-process maximum is the thread
+count, capped by ``DB_CONNECTION_BUDGET`` (connections this service may
+hold per database) divided by the worker count. ``DB_POOL_MAX_SIZE`` and
+``DB_POOL_MIN_SIZE`` override the computed sizes; a minimum above an
+explicit maximum is rejected at startup rather than by psycopg on the
+first connection.
+
+With ``DB_POOL=false`` (e.g. behind PgBouncer) connections are kept open
+for ``DB_CONN_MAX_AGE`` seconds instead, with Django's health checks.
+Other engines (SQLite in development) are left as they are.
+"""
+from django.core.exceptions import ImproperlyConfigured
+
+from config.env import env
+
+POSTGRES_ENGINES = ("django.db.backends.postgresql",)
+
+
+def pool_size(workers, threads, budget):
+    """(min_size, max_size) of one worker process's pool."""
+    max_size = env.int("DB_POOL_MAX_SIZE", default=None)
+    min_size = env.int("DB_POOL_MIN_SIZE", default=None)
+    if max_size is None:
+        max_size = max(1, min(threads, budget // max(workers, 1)))
+    elif max_size < 1:
+        raise ImproperlyConfigured(f"DB_POOL_MAX_SIZE must be at least 1, got {max_size}.")
+    elif min_size is not None and min_size > max_size:
+        raise ImproperlyConfigured(
+            f"DB_POOL_MIN_SIZE ({min_size}) is larger than DB_POOL_MAX_SIZE ({max_size})."
+        )
+    # A minimum above the computed maximum is capped to it
+    return min(1 if min_size is None else min_size, max_size), max_size
+
+
+def configure_connections(database):
+    """Apply the pooling / persistent-connection settings to one DATABASES entry."""
+    if database["ENGINE"] not in POSTGRES_ENGINES:
+        return database
+
+    # With a pool this makes it check connections before handing them out
+    database["CONN_HEALTH_CHECKS"] = True
+    if not env.bool("DB_POOL", default=True):
+        database.setdefault("CONN_MAX_AGE", env.int("DB_CONN_MAX_AGE", default=60))
+        return database
+
+    min_size, max_size = pool_size(
+        workers=env.int("WEB_CONCURRENCY", default=3),
+        threads=env.int("GUNICORN_THREADS", default=1),
+        budget=env.int("DB_CONNECTION_BUDGET", default=20),
+    )
+    # Pooled connections are returned to the pool after each request;
+    # Django refuses persistent connections on top of a pool.
+    database["CONN_MAX_AGE"] = 0
+    database.setdefault("OPTIONS", {})["pool"] = {
+        "min_size": min_size,
+        "max_size": max_size,
+        "timeout": env.float("DB_POOL_TIMEOUT", default=10.0),
+        "max_idle": env.float("DB_POOL_MAX_IDLE", default=300.0),
+        "max_lifetime": env.float("DB_POOL_MAX_LIFETIME", default=3600.0),
+    }
+    return database
+
+
+def connection_stats():
+    """
+    Per-alias connection settings and, for pooled aliases, the psycopg
+    pool counters of this process (size, available, waiting requests,
+    wait and connect times, errors).
+    """
+    from django.db import connections
+
+    stats = {}
+    for alias in connections:
+        settings_dict = connections.settings[alias]
+        pooled = bool(settings_dict.get("OPTIONS", {}).get("pool"))
+        row = {
+            "vendor": connections[alias].vendor,
+            "pooled": pooled,
+            "conn_max_age": settings_dict.get("CONN_MAX_AGE", 0),
+            "health_checks": settings_dict.get("CONN_HEALTH_CHECKS", False),
+        }
+        if pooled:
+            row["pool"] = connections[alias].pool.get_stats()
+        stats[alias] = row
+    return stats
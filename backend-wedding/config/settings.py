@@ -5,6 +5,7 @@ from pathlib import Path
 
 import environ
 
+from config.database import configure_connections
 from config.env import env, DeploymentEnvironment
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -57,12 +58,14 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "apps.commons.db_router.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "apps.commons.profiling.QueryProfilerMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -99,18 +102,58 @@ REST_FRAMEWORK = {
         "rest_framework.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
     ],
+    # Dispatches on the Authorization keyword to one of Session, JWT (Bearer)
+    # or expiring Token authentication; see apps/commons/authentication.py
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.SessionAuthentication",
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-        "rest_framework.authentication.TokenAuthentication",
-        "apps.commons.authentication.ExpiringTokenAuthentication",
+        "apps.commons.authentication.FastPathAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    # orjson-backed JSON (stdlib fallback), same output as DRF's JSONRenderer;
+    # see apps/commons/renderers.py
+    "DEFAULT_RENDERER_CLASSES": [
+        "apps.commons.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "apps.commons.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+# Per-process memory by default; set CACHE_URL (e.g. redis://...) to share
+# cached data and invalidations across workers.
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
+# Authenticated users and auth tokens are cached for this many seconds
+# (dropped on user/token changes). Only with a shared CACHE_URL: with a
+# per-process cache a logout or deactivation would not reach the other
+# workers, so a revoked token or inactive user could still authenticate
+# there until the entry expired. 0 disables the cache.
+AUTH_CACHE_TTL = env.int("AUTH_CACHE_TTL", default=60)
+
+# Restaurant portal hits are buffered per process and written by the first
+# hit this many seconds after the oldest buffered one (0: write every hit).
+RESTAURANT_ACCESS_FLUSH_SECONDS = env.int("RESTAURANT_ACCESS_FLUSH_SECONDS", default=60)
+
+# ---------------------------------------------------------------------------
+# Query profiler
+# ---------------------------------------------------------------------------
+# Opt-in per-request query/serializer timing (Server-Timing header, logs and
+# /api/commons/profiling/stats/). When disabled the middleware unloads itself.
+QUERY_PROFILER_ENABLED = env.bool("QUERY_PROFILER_ENABLED", default=False)
+QUERY_PROFILER_SAMPLE_RATE = env.float("QUERY_PROFILER_SAMPLE_RATE", default=1.0)
+# Profiled requests with at least this many queries are logged as warnings
+QUERY_PROFILER_QUERY_WARNING = env.int("QUERY_PROFILER_QUERY_WARNING", default=50)
+
 # ---------------------------------------------------------------------------
 # Password validation
 # ---------------------------------------------------------------------------
@@ -190,6 +233,10 @@ if DeploymentEnvironment.from_value(DEPLOYMENT_ENV) == DeploymentEnvironment.PRO
             }
         }
 
+    # Pooled (or persistent) connections sized to the gunicorn workers;
+    # see config/database.py
+    configure_connections(DATABASES["default"])
+
     STATIC_ROOT = BASE_DIR / "static"
     CORS_ORIGIN_ALLOW_ALL = False
 
@@ -206,6 +253,14 @@ else:
     }
     CORS_ORIGIN_ALLOW_ALL = True
 
+# Read replica (optional): safe requests read from it, writers stay on the
+# primary for DATABASE_REPLICA_PIN_SECONDS; see apps/commons/db_router.py
+if env.str("DATABASE_REPLICA_URL", default=""):
+    DATABASES["replica"] = configure_connections(env.db("DATABASE_REPLICA_URL"))
+    DATABASES["replica"]["TEST"] = {"MIRROR": "default"}
+DATABASE_ROUTERS = ["apps.commons.db_router.ReplicaRouter"]
+DATABASE_REPLICA_PIN_SECONDS = env.int("DATABASE_REPLICA_PIN_SECONDS", default=10)
+
 # Email Configuration
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = env.str("EMAIL_HOST", default="smtp.gmail.com")